@@ -0,0 +1,59 @@
+"""Measures command-line latency from invocation to the launcher's process spawn.
+
+The benchmark launcher runs ``date +%s%N``, so the first line it prints is
+the time its process started.  POSIX only.  Run with:
+
+    python benchmarks/bench_cli.py
+"""
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SCRIPT = os.path.join(ROOT, "Quick_Launcher.py")
+RUNS = 20
+TARGET_MS = 100.0
+
+
+def spawn_latency_ms(workdir):
+    start = time.time_ns()
+    output = subprocess.run([sys.executable, SCRIPT, "run", "Spawn", "--local"],
+                            cwd=workdir, capture_output=True, text=True, check=True).stdout
+    return (int(output.split()[0]) - start) / 1e6
+
+
+def interpreter_startup_ms():
+    start = time.perf_counter()
+    subprocess.run([sys.executable, "-c", "pass"], check=True)
+    return (time.perf_counter() - start) * 1000
+
+
+def qt_imported(workdir):
+    stderr = subprocess.run([sys.executable, "-X", "importtime", SCRIPT, "list"],
+                            cwd=workdir, capture_output=True, text=True).stderr
+    return "PyQt5" in stderr
+
+
+def main():
+    workdir = tempfile.mkdtemp(prefix="ql_cli_bench_")
+    launchers = {f"Launcher {i}": f"C:\\Projects\\project_{i}" for i in range(1000)}
+    launchers["Spawn"] = "date +%s%N;"
+    with open(os.path.join(workdir, "launcher_paths.json"), "w") as f:
+        json.dump({"launchers": launchers}, f)
+
+    spawn_latency_ms(workdir)  # Warm the filesystem cache
+    latencies = sorted(spawn_latency_ms(workdir) for _ in range(RUNS))
+    baseline = sorted(interpreter_startup_ms() for _ in range(RUNS))
+    median = latencies[len(latencies) // 2]
+    print(f"python -c pass:             median {baseline[len(baseline) // 2]:6.1f} ms")
+    print(f"invocation -> spawn:        median {median:6.1f} ms, max {latencies[-1]:6.1f} ms "
+          f"(target < {TARGET_MS:.0f} ms)")
+    print(f"PyQt5 imported by the CLI:  {'yes' if qt_imported(workdir) else 'no'}")
+    return 0 if median < TARGET_MS else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,143 @@
+"""Compares the virtualized launcher grid with the old widget-per-entry grid.
+
+Each case runs in a fresh interpreter so RSS numbers do not leak between
+cases.  Run headless with:
+
+    QT_QPA_PLATFORM=offscreen python benchmarks/bench_grid.py
+"""
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+SIZES = (10, 1000, 10000)
+CASES = ("widgets", "model", "window")
+
+
+def current_rss_kb():
+    """Resident set size of this process in kB (Linux), or peak RSS elsewhere."""
+    try:
+        with open("/proc/self/status") as f:
+            for line in f:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1])
+    except OSError:
+        pass
+    import resource
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+
+def make_launchers(count):
+    return {f"Launcher {i}": (f"C:\\Projects\\project_{i}" if i % 3 else f"make -C build_{i};make install")
+            for i in range(count)}
+
+
+def build_widgets(launchers):
+    """The previous grid: one LauncherWidget with four buttons and a stylesheet per entry."""
+    from PyQt5.QtWidgets import QMainWindow, QWidget, QGridLayout, QHBoxLayout, QPushButton
+
+    stylesheet = """
+        QPushButton {
+            background: qlineargradient(x1:0, y1:0, x2:1, y2:0, stop:0 #f0f0f0, stop:1 #e0e0e0);
+            border: 1px solid #ccc; border-radius: 5px; padding: 6px; color: #000000;
+        }
+        QPushButton:hover {
+            background: qlineargradient(x1:0, y1:0, x2:1, y2:0, stop:0 #e8e8e8, stop:1 #d8d8d8);
+        }
+        QPushButton:disabled { color: #808080; background: #d3d3d3; }
+        QPushButton#copyButton, QPushButton#editButton, QPushButton#deleteButton {
+            border: none; border-radius: 12px; min-width: 25px; max-width: 25px;
+            min-height: 25px; max-height: 25px; color: white; font-size: 10pt;
+            padding: 0; margin-left: 2px;
+        }
+        QPushButton#copyButton { background: qlineargradient(x1:0, y1:0, x2:1, y2:1, stop:0 #a5d6a7, stop:1 #81c784); }
+        QPushButton#editButton { background: qlineargradient(x1:0, y1:0, x2:1, y2:1, stop:0 #ce93d8, stop:1 #ba68c8); }
+        QPushButton#deleteButton { background: qlineargradient(x1:0, y1:0, x2:1, y2:1, stop:0 #ef5350, stop:1 #e53935); }
+    """
+
+    class LauncherWidget(QWidget):
+        def __init__(self, nickname, path):
+            super().__init__()
+            layout = QHBoxLayout(self)
+            self.open_button = QPushButton(nickname)
+            self.open_button.setEnabled(bool(path))
+            layout.addWidget(self.open_button)
+            for name, text in (("copyButton", "\u2398"), ("editButton", "\u270E"), ("deleteButton", "X")):
+                button = QPushButton(text)
+                button.setObjectName(name)
+                layout.addWidget(button)
+            self.setStyleSheet(stylesheet)
+
+    window = QMainWindow()
+    central = QWidget()
+    grid = QGridLayout(central)
+    for i, (nickname, path) in enumerate(launchers.items()):
+        row, col = divmod(i, 2)
+        grid.addWidget(LauncherWidget(nickname, path), row, col)
+    window.setCentralWidget(central)
+    return window
+
+
+def build_model(launchers):
+    from PyQt5.QtWidgets import QMainWindow
+    from quicklaunch.gui import LauncherGridView, LauncherListModel
+
+    window = QMainWindow()
+    model = LauncherListModel(window)
+    model.set_launchers(launchers)
+    view = LauncherGridView(columns=2)
+    view.setModel(model)
+    window.setCentralWidget(view)
+    return window
+
+
+def build_window(launchers):
+    from quicklaunch.gui import MainWindow
+    return MainWindow()
+
+
+def run_case(case, count):
+    """Builds and shows one window; prints a JSON result line."""
+    workdir = tempfile.mkdtemp(prefix="ql_bench_")
+    launchers = make_launchers(count)
+    with open(os.path.join(workdir, "launcher_paths.json"), "w") as f:
+        json.dump({"launchers": launchers}, f)
+    os.chdir(workdir)
+
+    from PyQt5.QtWidgets import QApplication
+    app = QApplication(sys.argv)
+    import quicklaunch.gui  # noqa: F401  (import cost is not part of the measurement)
+    baseline_rss = current_rss_kb()
+
+    builder = {"widgets": build_widgets, "model": build_model, "window": build_window}[case]
+    start = time.perf_counter()
+    window = builder(launchers)
+    window.resize(900, 600)
+    window.show()
+    app.processEvents()
+    elapsed = time.perf_counter() - start
+    print(json.dumps({"case": case, "launchers": count, "seconds": elapsed,
+                      "rss_kb": current_rss_kb() - baseline_rss}))
+
+
+def main():
+    if len(sys.argv) == 4 and sys.argv[1] == "--case":
+        run_case(sys.argv[2], int(sys.argv[3]))
+        return
+    env = dict(os.environ, QT_QPA_PLATFORM=os.environ.get("QT_QPA_PLATFORM", "offscreen"))
+    print(f"{'case':<8} {'launchers':>9} {'seconds':>9} {'RSS delta':>12}")
+    for count in SIZES:
+        for case in CASES:
+            output = subprocess.run([sys.executable, os.path.abspath(__file__), "--case", case, str(count)],
+                                    capture_output=True, text=True, env=env).stdout
+            result = json.loads(output.strip().splitlines()[-1])
+            print(f"{case:<8} {count:>9} {result['seconds']:>9.3f} {result['rss_kb'] / 1024:>9.1f} MB")
+
+
+if __name__ == '__main__':
+    main()
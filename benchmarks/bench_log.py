@@ -0,0 +1,62 @@
+"""Measures how many log lines per second reach the terminal view.
+
+Run headless with:  QT_QPA_PLATFORM=offscreen python benchmarks/bench_log.py
+"""
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from PyQt5.QtWidgets import QApplication, QTextEdit
+
+from quicklaunch.gui import MainWindow
+
+
+def drain(app, window):
+    """Processes events until every queued line has been written to the view."""
+    while window.terminal.pending or window.terminal.flush_timer.isActive():
+        app.processEvents()
+        time.sleep(0.001)
+
+
+def bench_terminal_view(app, message_count):
+    window = MainWindow()
+    start = time.perf_counter()
+    for i in range(message_count):
+        window.log_message(f"build step {i} finished", "INFO")
+    drain(app, window)
+    elapsed = time.perf_counter() - start
+    lines_in_view = window.terminal.document().blockCount()
+    window.close()
+    return elapsed, lines_in_view
+
+
+def bench_legacy_text_edit(app, message_count):
+    """The previous implementation: one QTextEdit.append and scroll per message."""
+    terminal = QTextEdit()
+    terminal.setReadOnly(True)
+    start = time.perf_counter()
+    for i in range(message_count):
+        terminal.append(f"[00:00:00] INFO: build step {i} finished\n")
+        terminal.verticalScrollBar().setValue(terminal.verticalScrollBar().maximum())
+    app.processEvents()
+    return time.perf_counter() - start, terminal.document().blockCount()
+
+
+def main():
+    os.chdir(tempfile.mkdtemp(prefix="ql_log_bench_"))  # MainWindow creates its data files here
+    app = QApplication(sys.argv)
+    for message_count in (1000, 10000, 100000):
+        elapsed, lines = bench_terminal_view(app, message_count)
+        print(f"TerminalView   {message_count:>7} lines: {elapsed:8.3f}s "
+              f"{message_count / elapsed:12.0f} lines/s ({lines} kept)")
+        if message_count <= 10000:
+            elapsed, lines = bench_legacy_text_edit(app, message_count)
+            print(f"QTextEdit      {message_count:>7} lines: {elapsed:8.3f}s "
+                  f"{message_count / elapsed:12.0f} lines/s ({lines} kept)")
+
+
+if __name__ == '__main__':
+    main()
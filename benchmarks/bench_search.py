@@ -0,0 +1,92 @@
+"""Measures per-keystroke search latency of LauncherIndex on 50 000 launchers.
+
+The index is built in slices the way the window builds it at startup,
+recording the longest slice and the first keystroke typed while the build is
+half done and right after it completes.  Then every query is typed one
+character at a time, the way the search box sees it.
+Run with:  python benchmarks/bench_search.py
+"""
+import os
+import random
+import sys
+import time
+from collections import deque
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from quicklaunch.search import LauncherIndex
+
+ENTRY_COUNT = 50000
+TARGET_MS = 5.0
+INDEX_SLICE = 0.008  # Same as MainWindow.INDEX_SLICE
+QUERIES = ["build", "deploy payments", "frontend", "dpl", "kubectl", "npm run", "docs",
+           "api gate", "xyzzy", "c:\\projects", "pay", "release notes", "tst"]
+
+WORDS = ["api", "gateway", "payments", "frontend", "backend", "docs", "release", "notes",
+         "build", "deploy", "staging", "prod", "metrics", "auth", "search", "billing",
+         "mobile", "desktop", "infra", "scripts", "tools", "reports", "shared", "legacy"]
+COMMANDS = ["git pull", "npm run build", "npm test", "kubectl get pods", "make", "make install",
+            "docker compose up -d", "python manage.py migrate", "cargo build --release"]
+
+
+def make_launchers(count, seed=1):
+    rng = random.Random(seed)
+    launchers = {}
+    while len(launchers) < count:
+        name = " ".join(rng.sample(WORDS, rng.randint(1, 3))).title() + f" {len(launchers)}"
+        if rng.random() < 0.5:
+            path = "C:\\Projects\\" + "\\".join(rng.sample(WORDS, rng.randint(1, 3)))
+        else:
+            path = f"cd C:\\Projects\\{rng.choice(WORDS)};" + ";".join(rng.sample(COMMANDS, rng.randint(1, 3)))
+        launchers[name] = path
+    return launchers
+
+
+def main():
+    launchers = make_launchers(ENTRY_COUNT)
+    index = LauncherIndex()
+    pending = deque(launchers)
+    slices = []
+    first_ms = {}
+    start = time.perf_counter()
+    done = False
+    while not done:
+        slice_start = time.perf_counter()
+        done = index.add_pending(pending, launchers, INDEX_SLICE)
+        slices.append((time.perf_counter() - slice_start) * 1000)
+        if "during" not in first_ms and len(index) >= ENTRY_COUNT // 2:
+            keystroke_start = time.perf_counter()
+            index.search(QUERIES[0][0])
+            first_ms["during"] = (time.perf_counter() - keystroke_start) * 1000
+    print(f"Indexed {len(index)} launchers in {time.perf_counter() - start:.2f}s, "
+          f"{len(slices)} slices: median {sorted(slices)[len(slices) // 2]:.2f} ms, max {max(slices):.2f} ms")
+    start = time.perf_counter()
+    index.search(QUERIES[0][0])
+    first_ms["after"] = (time.perf_counter() - start) * 1000
+    print(f"First keystroke: {first_ms['during']:.2f} ms half-way through the build, "
+          f"{first_ms['after']:.2f} ms after it")
+
+    timings = []
+    for query in QUERIES:
+        for length in range(1, len(query) + 1):
+            start = time.perf_counter()
+            results = index.search(query[:length])
+            timings.append((time.perf_counter() - start) * 1000)
+        print(f"  {query!r:<18} top hit: {results[0][0] if results else '-'}")
+
+    start = time.perf_counter()
+    for i, nickname in enumerate(list(launchers)[:1000]):
+        index.update(nickname, nickname + " renamed", launchers[nickname])
+    update_ms = (time.perf_counter() - start)
+
+    timings.sort()
+    mean = sum(timings) / len(timings)
+    p95 = timings[int(len(timings) * 0.95)]
+    print(f"{len(timings)} keystrokes: mean {mean:.2f} ms, p95 {p95:.2f} ms, max {timings[-1]:.2f} ms "
+          f"(target < {TARGET_MS} ms)")
+    print(f"Incremental update: {update_ms:.3f} ms per launcher")
+    return 0 if p95 < TARGET_MS and max(first_ms.values()) < TARGET_MS else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,80 @@
+"""Compares warm shell sessions with starting a process per command step.
+
+Every command chain is run ``--runs`` times through PlanRun, once the way a
+launcher runs by default (one ``/bin/sh`` or direct exec per step) and once
+through a quicklaunch.sessions SessionPool.  Reports the median and p95
+wall time of a run.  POSIX only.  Run with:
+
+    python benchmarks/bench_sessions.py [--runs 50] [--output sessions.json]
+"""
+import argparse
+import json
+import os
+import statistics
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from quicklaunch import sessions
+from quicklaunch.executor import PlanRun, parse_plan
+from quicklaunch.sessions import SessionPool
+from quicklaunch.telemetry import percentile
+
+CHAINS = {
+    "true": "true;",
+    "echo": "echo ready;",
+    "status": "cd /tmp; ls -a;",
+    "env setup": "export APP_ENV=dev; export APP_LEVEL=3; sh -c 'echo $APP_ENV $APP_LEVEL';",
+    "pipeline": "printf 'b\\na\\n' | sort | head -n 1;",
+}
+
+
+def time_runs(chain, runs, pool=None):
+    plan = parse_plan(chain)
+    times = []
+    for _ in range(runs):
+        runner = PlanRun(plan, on_output=lambda batch: None, sessions=pool)
+        start = time.perf_counter()
+        if runner.run() != 0:
+            raise RuntimeError(f"{chain!r} failed")
+        times.append(time.perf_counter() - start)
+    return sorted(times)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=50)
+    parser.add_argument("--output", help="write the results as JSON")
+    args = parser.parse_args()
+    if not sessions.supported():
+        sys.exit("Warm shell sessions need /bin/sh")
+
+    pool = SessionPool(size=2, max_commands=1000)
+    pool.warm()
+    results = {}
+    try:
+        for name, chain in CHAINS.items():
+            spawn = time_runs(chain, args.runs)
+            warm = time_runs(chain, args.runs, pool)
+            results[name] = {
+                "chain": chain,
+                "spawn_median": statistics.median(spawn), "spawn_p95": percentile(spawn, 0.95),
+                "session_median": statistics.median(warm), "session_p95": percentile(warm, 0.95),
+            }
+    finally:
+        pool.close()
+
+    print(f"{'chain':<10} {'spawn p50':>10} {'p95':>8} {'session p50':>12} {'p95':>8} {'speed-up':>9}")
+    for name, result in results.items():
+        print(f"{name:<10} {result['spawn_median'] * 1000:8.2f}ms {result['spawn_p95'] * 1000:6.2f}ms "
+              f"{result['session_median'] * 1000:10.2f}ms {result['session_p95'] * 1000:6.2f}ms "
+              f"{result['spawn_median'] / result['session_median']:8.1f}x")
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump({"runs": args.runs, "results": results}, f, indent=2)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,367 @@
+"""Benchmark suite for the launcher hot paths, with a JSON baseline.
+
+Every scenario is timed ``--repeat`` times for each launcher count and the
+median, minimum and individual runs are written as JSON, so two revisions
+can be compared:
+
+    QT_QPA_PLATFORM=offscreen python benchmarks/bench_suite.py --output before.json
+    ... change something ...
+    QT_QPA_PLATFORM=offscreen python benchmarks/bench_suite.py --compare before.json
+
+``--compare`` exits with status 1 when a scenario's median got slower by
+more than ``--threshold``.  ``--profile cprofile`` prints the top cProfile
+entries of every scenario instead, ``--profile tracemalloc`` the top
+allocation sites.
+"""
+import argparse
+import cProfile
+import datetime
+import io
+import json
+import os
+import platform
+import pstats
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt5.QtCore import PYQT_VERSION_STR, QT_VERSION_STR, QObject, pyqtSlot
+from PyQt5.QtWidgets import QApplication, QDialog
+
+from quicklaunch import gui
+from quicklaunch.executor import parse_plan
+from quicklaunch.gui import BuildThread, MainWindow
+
+SIZES = (100, 1000, 10000)
+OPERATIONS = 100  # Swaps, renames, ... per timed run
+LOG_MESSAGES = 10000
+SPAWNS = 20
+TOP = 15  # Rows printed per scenario in profile mode
+
+
+def make_launchers(count):
+    return {f"Launcher {i}": (f"C:\\Projects\\project_{i}" if i % 3 else f"make -C build_{i};make install")
+            for i in range(count)}
+
+
+def write_launchers(count):
+    with open("launcher_paths.json", "w", encoding="utf-8") as f:
+        json.dump({"launchers": make_launchers(count)}, f)
+
+
+def drain(app, window):
+    """Processes events until the terminal has written every queued line."""
+    while window.terminal.pending or window.terminal.flush_timer.isActive():
+        app.processEvents()
+        time.sleep(0.001)
+
+
+class ScriptedDialog:
+    """Stands in for EditDialog: accepts immediately with preset values."""
+
+    values = ("", "")
+
+    def __init__(self, parent=None, nickname="", path="", options=None):
+        pass
+
+    def exec_(self):
+        return QDialog.Accepted
+
+    def get_values(self):
+        return ScriptedDialog.values
+
+    def get_options(self):
+        return {}
+
+
+class Scenario:
+    """One benchmark: ``setup`` is not timed, ``run`` is, ``teardown`` cleans up."""
+
+    name = ""
+    sized = True  # Whether the launcher count matters
+
+    def __init__(self, app, count):
+        self.app = app
+        self.count = count
+        self.window = None
+
+    def setup(self):
+        write_launchers(self.count)
+        self.window = MainWindow()
+
+    def run(self):
+        raise NotImplementedError
+
+    def teardown(self):
+        if self.window is not None:
+            self.window.close()
+            self.window.deleteLater()
+            self.app.processEvents()
+            self.window = None
+
+
+class InitScenario(Scenario):
+    name = "init"
+
+    def setup(self):
+        write_launchers(self.count)
+
+    def run(self):
+        self.window = MainWindow()
+        self.window.show()
+        self.app.processEvents()
+
+
+class LoadScenario(Scenario):
+    name = "load"
+
+    def run(self):
+        self.window.store.close()
+        self.window.load_launchers()
+
+
+class SaveScenario(Scenario):
+    name = "save"
+
+    def run(self):
+        self.window.store.record("reset")
+        self.window.flush_launchers()
+
+
+class GridScenario(Scenario):
+    name = "create_grid"
+
+    def run(self):
+        self.window.create_launcher_grid()
+        self.app.processEvents()
+
+
+class SwapScenario(Scenario):
+    name = "swap"
+
+    def run(self):
+        nicknames = list(self.window.launchers_data)
+        for i in range(OPERATIONS):
+            self.window.swap_launchers(nicknames[i % len(nicknames)], nicknames[-1 - i % len(nicknames)])
+        self.app.processEvents()
+
+
+class RenameCollisionScenario(Scenario):
+    """edit_launcher renaming a launcher to a nickname that already exists."""
+
+    name = "rename_collision"
+
+    def setup(self):
+        super().setup()
+        self.original = gui.EditDialog
+        gui.EditDialog = ScriptedDialog
+
+    def run(self):
+        for i in range(OPERATIONS):
+            nicknames = list(self.window.launchers_data)
+            nickname, taken = nicknames[i % len(nicknames)], nicknames[(i + 1) % len(nicknames)]
+            ScriptedDialog.values = (taken, self.window.launchers_data[nickname])
+            self.window.edit_launcher(nickname, self.window.launchers_data[nickname])
+        self.app.processEvents()
+
+    def teardown(self):
+        gui.EditDialog = self.original
+        super().teardown()
+
+
+class LogScenario(Scenario):
+    name = "log_message"
+    sized = False
+
+    def setup(self):
+        write_launchers(10)
+        self.window = MainWindow()
+
+    def run(self):
+        for i in range(LOG_MESSAGES):
+            self.window.log_message(f"build step {i} finished", "INFO")
+        drain(self.app, self.window)
+
+
+class FirstOutput(QObject):
+    """Notes when the first output batch of a thread reaches the GUI thread."""
+
+    def __init__(self):
+        super().__init__()
+        self.received_at = None
+
+    @pyqtSlot(list)
+    def receive(self, chunk):
+        if self.received_at is None:
+            self.received_at = time.perf_counter()
+
+
+class SpawnScenario(Scenario):
+    """Time from BuildThread.start() to the first output line on the GUI thread."""
+
+    name = "spawn"
+    sized = False
+    TIMEOUT = 5.0
+
+    def setup(self):
+        self.plan = parse_plan("echo ready;")
+        self.latencies = []
+
+    def run(self):
+        for _ in range(SPAWNS):
+            thread = BuildThread(self.plan, stream=True)
+            first_output = FirstOutput()
+            thread.output_chunk.connect(first_output.receive)
+            start = time.perf_counter()
+            thread.start()
+            while first_output.received_at is None and time.perf_counter() - start < self.TIMEOUT:
+                self.app.processEvents()
+            thread.wait()
+            if first_output.received_at is not None:
+                self.latencies.append(first_output.received_at - start)
+
+
+SCENARIOS = (InitScenario, LoadScenario, SaveScenario, GridScenario, SwapScenario,
+             RenameCollisionScenario, LogScenario, SpawnScenario)
+
+
+def profile_run(scenario, mode):
+    """Runs a scenario once under cProfile or tracemalloc and returns the report."""
+    scenario.setup()
+    try:
+        if mode == "cprofile":
+            profiler = cProfile.Profile()
+            profiler.runcall(scenario.run)
+            out = io.StringIO()
+            pstats.Stats(profiler, stream=out).sort_stats("cumulative").print_stats(TOP)
+            return out.getvalue()
+        tracemalloc.start(10)
+        scenario.run()
+        snapshot = tracemalloc.take_snapshot()
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        stats = snapshot.statistics("lineno")[:TOP]
+        return "\n".join([f"peak {peak / 1024:.1f} KiB, still allocated:"] + [str(stat) for stat in stats])
+    finally:
+        scenario.teardown()
+
+
+def time_scenario(app, scenario_class, count, repeat):
+    runs = []
+    extra = {}
+    for _ in range(repeat):
+        scenario = scenario_class(app, count)
+        scenario.setup()
+        try:
+            start = time.perf_counter()
+            scenario.run()
+            runs.append(time.perf_counter() - start)
+            if isinstance(scenario, SpawnScenario):
+                extra.setdefault("spawn_latencies", []).extend(scenario.latencies)
+        finally:
+            scenario.teardown()
+    result = {"median": statistics.median(runs), "min": min(runs), "runs": runs}
+    if "spawn_latencies" in extra:
+        latencies = sorted(extra["spawn_latencies"])
+        result["spawn_median"] = statistics.median(latencies)
+        result["spawn_max"] = latencies[-1]
+    return result
+
+
+def git_revision():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=ROOT,
+                              capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare(results, baseline, threshold):
+    """Prints median changes against a baseline; returns the keys that regressed."""
+    regressions = []
+    print(f"\n{'scenario':<28} {'baseline':>10} {'now':>10} {'change':>8}")
+    for key, result in results.items():
+        before = baseline.get("results", {}).get(key)
+        if before is None:
+            continue
+        change = result["median"] / before["median"] - 1 if before["median"] else 0.0
+        flag = ""
+        if change > threshold:
+            regressions.append(key)
+            flag = "  REGRESSION"
+        print(f"{key:<28} {before['median']:>10.4f} {result['median']:>10.4f} {change:>+8.1%}{flag}")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the Quick Launch hot paths.")
+    parser.add_argument("--sizes", default=",".join(map(str, SIZES)),
+                        help="comma-separated launcher counts (default: %(default)s)")
+    parser.add_argument("--repeat", type=int, default=5, help="timed runs per scenario")
+    parser.add_argument("--only", help="comma-separated scenario names")
+    parser.add_argument("--output", help="write the results as JSON to this file")
+    parser.add_argument("--compare", help="baseline JSON to compare against")
+    parser.add_argument("--threshold", type=float, default=0.2,
+                        help="relative slowdown reported as a regression (default: %(default)s)")
+    parser.add_argument("--profile", choices=("cprofile", "tracemalloc"),
+                        help="print the hot spots of each scenario instead of timing it")
+    args = parser.parse_args()
+
+    sizes = [int(size) for size in args.sizes.split(",")]
+    scenarios = [scenario for scenario in SCENARIOS
+                 if not args.only or scenario.name in args.only.split(",")]
+    output = os.path.abspath(args.output) if args.output else None
+    baseline_path = os.path.abspath(args.compare) if args.compare else None
+    app = QApplication.instance() or QApplication(sys.argv)
+    os.chdir(tempfile.mkdtemp(prefix="ql_suite_"))
+
+    results = {}
+    for scenario_class in scenarios:
+        for count in (sizes if scenario_class.sized else [0]):
+            key = f"{scenario_class.name}/{count}" if scenario_class.sized else scenario_class.name
+            if args.profile:
+                print(f"===== {key} ({args.profile}) =====")
+                print(profile_run(scenario_class(app, count), args.profile))
+                continue
+            results[key] = time_scenario(app, scenario_class, count, args.repeat)
+            result = results[key]
+            line = f"{key:<28} median {result['median']:9.4f}s  min {result['min']:9.4f}s"
+            if "spawn_median" in result:
+                line += f"  spawn median {result['spawn_median'] * 1000:6.1f} ms max {result['spawn_max'] * 1000:6.1f} ms"
+            print(line, flush=True)
+    if args.profile:
+        return 0
+
+    report = {
+        "meta": {
+            "revision": git_revision(),
+            "date": datetime.datetime.now().isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "qt": QT_VERSION_STR,
+            "pyqt": PYQT_VERSION_STR,
+            "platform": platform.platform(),
+            "repeat": args.repeat,
+            "operations": OPERATIONS,
+        },
+        "results": results,
+    }
+    if output:
+        with open(output, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+    if baseline_path:
+        with open(baseline_path, encoding="utf-8") as f:
+            baseline = json.load(f)
+        if compare(results, baseline, args.threshold):
+            return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1 @@
+"""Qt-free building blocks used by the Quick Launch window."""
@@ -0,0 +1,5 @@
+import sys
+
+from quicklaunch.cli import main
+
+sys.exit(main())
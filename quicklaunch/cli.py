@@ -0,0 +1,94 @@
+"""Command-line entry point: ``Quick_Launcher.py run <nickname>``, ``list`` and ``stats``.
+
+Nothing here imports Qt.  ``run`` first offers the launcher to a running
+window (so its output shows up in that window's terminal) and only executes
+it in this process when no window is listening.
+"""
+import argparse
+import sys
+
+from quicklaunch import instance
+from quicklaunch.executor import PlanRun, get_backend, parse_plan
+from quicklaunch.store import open_store
+from quicklaunch.telemetry import TelemetryStore
+
+
+COMMANDS = ("run", "list", "stats")
+
+
+def wants_cli(argv):
+    return len(argv) > 1 and argv[1] in COMMANDS
+
+
+def load_launchers():
+    store = open_store()
+    try:
+        return store.load() or {}
+    finally:
+        store.close()
+
+
+def run_local(nickname, path):
+    """Runs a launcher in this process; returns its exit code."""
+    if not path:
+        print(f"Path is not set for launcher '{nickname}'.", file=sys.stderr)
+        return 1
+    try:
+        plan = parse_plan(path)
+    except ValueError as e:
+        print(f"Launcher '{nickname}': {str(e)}", file=sys.stderr)
+        return 1
+    if plan.opens_path:
+        get_backend().open_path(path)
+        return 0
+    # Output goes straight to this terminal
+    return PlanRun(plan, capture=False).run()
+
+
+def print_stats():
+    telemetry = TelemetryStore()
+    try:
+        stats = telemetry.stats()
+    finally:
+        telemetry.close()
+    print(f"{'launcher':<30} {'runs':>6} {'p50':>9} {'p95':>9} {'failed':>7}")
+    for entry in sorted(stats.values(), key=lambda entry: -entry.p95):
+        print(f"{entry.nickname:<30} {entry.runs:>6} {entry.p50:>8.2f}s {entry.p95:>8.2f}s "
+              f"{entry.failure_rate:>7.0%}")
+    return 0
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="Quick_Launcher.py", description="Run Quick Launch launchers.")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    run_parser = subparsers.add_parser("run", help="run a launcher by nickname")
+    run_parser.add_argument("nickname")
+    run_parser.add_argument("--local", action="store_true",
+                            help="run here even if a Quick Launch window is open")
+    subparsers.add_parser("list", help="list launchers")
+    subparsers.add_parser("stats", help="show run times and failure rates per launcher")
+    args = parser.parse_args(argv)
+
+    if args.command == "stats":
+        return print_stats()
+
+    launchers = load_launchers()
+    if args.command == "list":
+        for nickname, path in launchers.items():
+            print(f"{nickname}\t{path}")
+        return 0
+
+    if args.nickname not in launchers:
+        print(f"No launcher named '{args.nickname}'.", file=sys.stderr)
+        return 2
+    if not args.local:
+        reply = instance.forward({"command": "run", "nickname": args.nickname})
+        if reply is not None:
+            if reply.get("unconfirmed"):
+                print("The Quick Launch window did not confirm the request in time; it runs there once the "
+                      "window is responsive.", file=sys.stderr)
+            if reply.get("ok"):
+                return 0
+            print(reply.get("error", "The Quick Launch window refused the request."), file=sys.stderr)
+            return 1
+    return run_local(args.nickname, launchers[args.nickname])
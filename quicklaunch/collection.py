@@ -0,0 +1,147 @@
+from bisect import bisect_left
+from collections.abc import MutableMapping
+
+
+def diff_launchers(old, new):
+    """Keyed difference between two ``{nickname: path}`` mappings.
+
+    Returns ``(removed, added, updated)``: nicknames only in ``old``, (nickname,
+    path) pairs only in ``new`` in its order, and (nickname, path) pairs whose
+    path changed.  Order changes are left to ``LauncherCollection.reorder``.
+    """
+    removed = [nickname for nickname in old if nickname not in new]
+    added = [(nickname, path) for nickname, path in new.items() if nickname not in old]
+    updated = [(nickname, path) for nickname, path in new.items()
+               if nickname in old and old[nickname] != path]
+    return removed, added, updated
+
+
+class LauncherCollection(MutableMapping):
+    """Ordered ``{nickname: path}`` mapping with an explicit position index.
+
+    Behaves like the dict it replaces (assigning a new nickname appends it),
+    and also answers ``index(nickname)`` and ``at(row)`` in O(1).  ``swap``
+    and ``rename`` work in place in O(1); ``move`` only renumbers the rows
+    between the old and the new position.
+    """
+
+    def __init__(self, launchers=()):
+        self.order = []  # Nicknames by row
+        self.paths = {}  # nickname -> path
+        self.rows = {}  # nickname -> row
+        for nickname, path in dict(launchers).items():
+            self[nickname] = path
+
+    def __getitem__(self, nickname):
+        return self.paths[nickname]
+
+    def __setitem__(self, nickname, path):
+        if nickname not in self.paths:
+            self.rows[nickname] = len(self.order)
+            self.order.append(nickname)
+        self.paths[nickname] = path
+
+    def __delitem__(self, nickname):
+        row = self.rows.pop(nickname)
+        del self.paths[nickname]
+        del self.order[row]
+        self._renumber(row, len(self.order))
+
+    def __iter__(self):
+        return iter(self.order)
+
+    def __len__(self):
+        return len(self.order)
+
+    def __contains__(self, nickname):
+        return nickname in self.paths
+
+    def __repr__(self):
+        return f"LauncherCollection({dict(self)!r})"
+
+    def index(self, nickname):
+        return self.rows[nickname]
+
+    def at(self, row):
+        """The (nickname, path) pair at ``row``."""
+        nickname = self.order[row]
+        return nickname, self.paths[nickname]
+
+    def rename(self, nickname, new_nickname, path):
+        """Gives the launcher at ``nickname``'s row a new nickname and path."""
+        if new_nickname != nickname:
+            if new_nickname in self.paths:
+                raise ValueError(f"Launcher '{new_nickname}' already exists")
+            row = self.rows.pop(nickname)
+            del self.paths[nickname]
+            self.order[row] = new_nickname
+            self.rows[new_nickname] = row
+        self.paths[new_nickname] = path
+
+    def swap(self, nickname1, nickname2):
+        row1, row2 = self.rows[nickname1], self.rows[nickname2]
+        self.order[row1], self.order[row2] = nickname2, nickname1
+        self.rows[nickname1], self.rows[nickname2] = row2, row1
+
+    def move(self, nickname, row):
+        """Moves a launcher to ``row``, shifting the launchers in between by one."""
+        old_row = self.rows[nickname]
+        row = max(0, min(row, len(self.order) - 1))
+        if row == old_row:
+            return
+        del self.order[old_row]
+        self.order.insert(row, nickname)
+        self._renumber(min(row, old_row), max(row, old_row) + 1)
+
+    def reorder(self, order, on_move=None):
+        """Rearranges the launchers into ``order`` with as few moves as possible.
+
+        ``order`` must hold exactly the current nicknames.  Launchers on a
+        longest run already in the right relative order stay put; every other
+        one is moved right behind its predecessor in ``order``, calling
+        ``on_move(old_row, new_row)`` for each move.  Returns the number of moves.
+        """
+        target = {nickname: row for row, nickname in enumerate(order)}
+        kept = self._longest_ordered_run([target[nickname] for nickname in self.order])
+        moves = 0
+        for row, nickname in enumerate(order):
+            if nickname in kept:
+                continue
+            old_row = self.rows[nickname]
+            if row == 0:
+                new_row = 0
+            else:
+                new_row = self.rows[order[row - 1]]
+                new_row += 0 if old_row < new_row else 1
+            if new_row != old_row:
+                self.move(nickname, new_row)
+                if on_move is not None:
+                    on_move(old_row, new_row)
+                moves += 1
+        return moves
+
+    def _longest_ordered_run(self, targets):
+        """Nicknames forming a longest increasing subsequence of their target rows."""
+        tail_values = []  # tail_values[k]: smallest target row ending an ordered run of length k + 1
+        tails = []  # ... and the index of that launcher
+        previous = [-1] * len(targets)
+        for i, value in enumerate(targets):
+            k = bisect_left(tail_values, value)
+            if k:
+                previous[i] = tails[k - 1]
+            if k == len(tails):
+                tail_values.append(value)
+                tails.append(i)
+            else:
+                tail_values[k] = value
+                tails[k] = i
+        kept = set()
+        i = tails[-1] if tails else -1
+        while i >= 0:
+            kept.add(self.order[i])
+            i = previous[i]
+        return kept
+
+    def _renumber(self, start, stop):
+        for row in range(start, stop):
+            self.rows[self.order[row]] = row
@@ -0,0 +1,680 @@
+"""Turns a launcher path into an execution plan and runs it without Qt.
+
+A launcher is either a plain path, opened with the desktop's handler, or a
+``;``-separated command chain.  Each chain segment becomes a ``Step``:
+
+* ``cd`` and environment assignments are applied by the executor itself,
+  expanding ``~`` and simple variable references;
+* segments without shell syntax are executed directly from their argv;
+* anything else goes through the platform shell.
+
+Steps run one after the other and the chain stops at the first failure,
+like ``a && b && c``.  When a segment changes shell state the executor
+cannot reproduce (``source``, ``pushd``, calling a batch file, ...), the whole
+chain is handed to one shell instead, exactly as before.
+
+Segments may start with a ``[name]`` tag, which makes the chain a graph of
+steps that run in parallel where they can::
+
+    cd ~/src; [api] make -C api; [web with api] make -C web; [docs after api] make docs; make install
+
+A step waits for the step before it (and everything running alongside that
+step) unless it says otherwise: ``[web with api]`` starts together with
+``api`` and ``[docs after api]`` waits for ``api`` only.  Chains without tags
+keep their sequential meaning.
+"""
+import os
+import queue
+import re
+import shlex
+import shutil
+import signal
+import subprocess
+import sys
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+
+def is_command(path):
+    """Launcher paths containing ``;`` are command chains, everything else is a path."""
+    return ";" in path
+
+
+def split_chain(path):
+    """The segments of a command chain; ``a;`` runs just ``a`` as it always has."""
+    commands = path.split(";")
+    if commands[1] == '':
+        commands = commands[:1]
+    return [command.strip() for command in commands if command.strip()]
+
+
+# "[name]", "[name with other]" or "[name after one, two]"; the name must follow
+# the bracket directly so test expressions such as "[ -f x ]" are not tags
+STEP_TAG = re.compile(r"\[(?P<name>\w[\w.-]*)(?:\s+(?P<relation>after|with)\b(?P<names>[^\]]*))?\]\s*")
+
+
+class Step:
+    """One segment of a command chain.
+
+    ``kind`` is "exec" (run ``argv`` directly), "shell" (run ``text`` through
+    the shell), "cd" (change to ``value``) or "env" (set ``value`` = (name,
+    value)).  In a graph chain ``name`` identifies the step, ``deps`` names
+    the steps it waits for and steps sharing a ``group`` run side by side.
+    """
+
+    def __init__(self, kind, text, argv=None, value=None, name=None, deps=(), group=None):
+        self.kind = kind
+        self.text = text
+        self.argv = argv
+        self.value = value
+        self.name = name
+        self.deps = tuple(deps)
+        self.group = group
+
+    def __repr__(self):
+        return f"Step({self.kind!r}, {self.text!r})"
+
+    @property
+    def label(self):
+        return self.text if self.name is None else f"[{self.name}] {self.text}"
+
+
+class Plan:
+    """What running a launcher means: open ``path`` or run ``steps`` in order."""
+
+    def __init__(self, path, steps=None):
+        self.path = path
+        self.steps = steps or []
+
+    def __str__(self):
+        return self.path
+
+    @property
+    def opens_path(self):
+        return not self.steps
+
+    @property
+    def parallel(self):
+        """True for a graph chain, whose steps run as their dependencies allow."""
+        return any(step.name is not None for step in self.steps)
+
+    @property
+    def shell_free(self):
+        return all(step.kind != "shell" for step in self.steps)
+
+    def workdir(self, backend=None):
+        """The directory the chain works in once its leading ``cd`` and environment steps ran."""
+        backend = backend or get_backend()
+        cwd = None
+        env = None
+        for step in self.steps:
+            if step.kind not in ("cd", "env"):
+                break
+            cwd, env = apply_state(backend, step, cwd, env)
+        return cwd or os.getcwd()
+
+    @classmethod
+    def shell(cls, command):
+        """A plan that runs one command string through the shell."""
+        return cls(command, [Step("shell", command)])
+
+
+class PosixBackend:
+    """Linux/macOS: xdg-open/open for paths, /bin/sh for shell steps."""
+
+    SHELL_CHARS = set("|&<>()$`*?[]{}~!#\n")
+    EXPANDED_CHARS = set("$~{}")  # Expanded by the executor in cd and export
+    VARIABLE = re.compile(r"\$(?:[A-Za-z_]\w*|\{[A-Za-z_]\w*\})")
+    # Builtins that change the state later segments run in
+    STATE_BUILTINS = {"source", ".", "alias", "unalias", "set", "unset", "shopt", "pushd", "popd",
+                      "ulimit", "umask", "exec", "eval", "trap", "readonly", "declare", "typeset",
+                      "local", "hash", "export"}
+    BUILTINS = {"exit", "return", "read", "wait", "jobs", "fg", "bg", "type", "command", "builtin",
+                "let", "shift", "getopts", "times"}
+
+    def open_path(self, path):
+        opener = "open" if sys.platform == "darwin" else "xdg-open"
+        return subprocess.Popen([opener, os.path.normpath(path)],
+                                stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+
+    def parse_step(self, text):
+        """Returns a Step, or None when the segment needs the whole chain in one shell."""
+        words = text.split(None, 1)
+        if words and words[0] in ("cd", "export"):
+            return self.parse_state_step(text)
+        if self.SHELL_CHARS & set(text):
+            return Step("shell", text)
+        try:
+            argv = shlex.split(text)
+        except ValueError:
+            return Step("shell", text)
+        if not argv:
+            return Step("shell", text)
+        name = argv[0]
+        if name in self.STATE_BUILTINS or "=" in name:
+            return None
+        if name in self.BUILTINS or ("/" not in name and shutil.which(name) is None):
+            return Step("shell", text)  # Let the shell report unknown commands as usual
+        return Step("exec", text, argv=argv)
+
+    def parse_state_step(self, text):
+        """``cd DIR`` or ``export NAME=value``; None when only a shell can do it.
+
+        A leading ``~`` and ``$NAME``/``${NAME}`` references are kept and
+        expanded by ``expand`` when the step runs, with the chain's
+        environment at that point.  Anything else the shell would expand or
+        interpret (globs, command substitution, ``&&``, ...) sends the whole
+        chain to one shell, so the state change still reaches later segments.
+        """
+        chars = set(text)
+        if (self.SHELL_CHARS - self.EXPANDED_CHARS) & chars or ("'" in chars and "$" in chars) \
+                or (chars & {"'", '"'} and "~" in chars):
+            return None
+        try:
+            argv = shlex.split(text)
+        except ValueError:
+            return None
+        if any(set("${}") & set(self.VARIABLE.sub("", arg)) for arg in argv[1:]):
+            return None  # Parameter expansion beyond $NAME and ${NAME}
+        if argv[0] == "cd":
+            if len(argv) > 2 or argv[1:] == ["-"]:
+                return None
+            return Step("cd", text, value=argv[1] if len(argv) == 2 else "~")
+        if len(argv) == 2 and "=" in argv[1] and "~" not in argv[1]:
+            return Step("env", text, value=tuple(argv[1].split("=", 1)))
+        return None
+
+    def expand(self, text, env=None):
+        """``text`` with a leading ``~`` and ``$NAME``/``${NAME}`` expanded as /bin/sh would."""
+        env = os.environ if env is None else env
+        return self.VARIABLE.sub(lambda match: env.get(match[0].strip("${}"), ""), os.path.expanduser(text))
+
+    def popen_kwargs(self):
+        return {"start_new_session": True}  # Own process group so cancel reaches children
+
+    def terminate(self, process, force=False):
+        try:
+            os.killpg(process.pid, signal.SIGKILL if force else signal.SIGTERM)
+        except OSError:
+            if force:
+                process.kill()
+            else:
+                process.terminate()
+
+
+class WindowsBackend:
+    """Windows: explorer for paths, cmd.exe for shell steps."""
+
+    SHELL_CHARS = set("|&<>()^%!\n")
+    VARIABLE = re.compile(r"%(\w+)%")
+    STATE_BUILTINS = {"setlocal", "endlocal", "pushd", "popd", "call", "goto", "shift", "path",
+                      "prompt", "chcp"}
+    BUILTINS = {"assoc", "break", "cls", "color", "copy", "date", "del", "dir", "echo", "erase",
+                "exit", "for", "ftype", "if", "md", "mkdir", "mklink", "move", "rd", "ren",
+                "rename", "rem", "rmdir", "start", "time", "title", "type", "ver", "verify", "vol"}
+    BATCH_EXTENSIONS = (".bat", ".cmd")
+
+    def open_path(self, path):
+        return subprocess.Popen(['explorer', os.path.normpath(path)])
+
+    def parse_step(self, text):
+        first, _, rest = text.partition(" ")
+        name = first.strip('"').lower()
+        rest = rest.strip()
+        if name in ("cd", "chdir", "set") and (self.SHELL_CHARS - {"%"}) & set(text):
+            return None  # Let cmd.exe apply the state change for the whole chain
+        if name not in ("cd", "chdir", "set") and self.SHELL_CHARS & set(text):
+            return Step("shell", text)
+        if name in ("cd", "chdir"):
+            if rest.lower().startswith("/d "):
+                rest = rest[3:].strip()
+            if not rest or rest.startswith("/"):
+                return None
+            return Step("cd", text, value=rest.strip('"'))
+        if name == "set":
+            if "=" not in rest or rest.startswith("/"):
+                return None
+            return Step("env", text, value=tuple(rest.strip('"').split("=", 1)))
+        if name in self.STATE_BUILTINS:
+            return None
+        resolved = shutil.which(first.strip('"'))
+        if resolved is not None and resolved.lower().endswith(self.BATCH_EXTENSIONS):
+            return None  # Batch files often set variables for the following commands
+        if name in self.BUILTINS or resolved is None:
+            return Step("shell", text)
+        # CreateProcess parses the command line itself
+        return Step("exec", text, argv=text)
+
+    def expand(self, text, env=None):
+        """``text`` with ``%NAME%`` references expanded; unknown names stay as they are, like in cmd.exe."""
+        env = {name.upper(): value for name, value in (os.environ if env is None else env).items()}
+        return self.VARIABLE.sub(lambda match: env.get(match[1].upper(), match[0]), text)
+
+    def popen_kwargs(self):
+        return {"creationflags": getattr(subprocess, "CREATE_NO_WINDOW", 0)  # Hide console
+                | getattr(subprocess, "CREATE_NEW_PROCESS_GROUP", 0)}
+
+    def terminate(self, process, force=False):
+        # cmd.exe does not forward termination to its children
+        result = subprocess.run(["taskkill", "/F", "/T", "/PID", str(process.pid)],
+                                capture_output=True, creationflags=getattr(subprocess, "CREATE_NO_WINDOW", 0))
+        if result.returncode != 0 and process.poll() is None:
+            process.kill()
+
+
+def get_backend():
+    return WindowsBackend() if os.name == "nt" else PosixBackend()
+
+
+def apply_state(backend, step, cwd, env):
+    """The ``(cwd, env)`` a ``cd`` or environment step leaves; None stands for this process's own."""
+    if step.kind == "cd":
+        target = os.path.expanduser(backend.expand(step.value, env))
+        return os.path.normpath(os.path.join(cwd or os.getcwd(), target)), env
+    name, value = step.value
+    value = backend.expand(value, env)
+    env = dict(env or os.environ)
+    env[name] = value
+    return cwd, env
+
+
+def parse_plan(path, backend=None):
+    """Builds the Plan for a launcher path."""
+    if not is_command(path):
+        return Plan(path)
+    backend = backend or get_backend()
+    segments = split_chain(path)
+    if any(STEP_TAG.match(segment) for segment in segments):
+        return parse_graph(path, segments, backend)
+    steps = []
+    for segment in segments:
+        step = backend.parse_step(segment)
+        if step is None:
+            # Keep shell state across segments by running the chain in one shell
+            return Plan.shell(" && ".join(segments))
+        steps.append(step)
+    return Plan(path, steps)
+
+
+def parse_graph(path, segments, backend):
+    """Builds the Plan of a chain with ``[name]`` tags; ValueError for unknown or repeated names.
+
+    Steps may only refer to steps before them, so the graph has no cycles.
+    Untagged segments are named after their position in the chain.
+    """
+    steps = {}
+    groups = {}  # group -> names of its steps
+    previous = []  # What a step without "after" or "with" waits for
+    for number, segment in enumerate(segments, 1):
+        tag = STEP_TAG.match(segment)
+        text = segment[tag.end():] if tag else segment
+        name = tag["name"] if tag else str(number)
+        if name in steps:
+            raise ValueError(f"Step name [{name}] is used twice")
+        if not text:
+            raise ValueError(f"Step [{name}] has no command")
+        others = (tag["names"] or "").replace(",", " ").split() if tag else []
+        for other in others:
+            if other not in steps:
+                raise ValueError(f"Step [{name}] refers to [{other}], which is not defined before it")
+        relation = tag["relation"] if tag else None
+        if relation == "with":
+            if len(others) != 1:
+                raise ValueError(f"Step [{name}] must run with exactly one step")
+            deps, group = steps[others[0]].deps, steps[others[0]].group
+        else:
+            deps, group = (others if relation == "after" else previous), number
+        # Shell state cannot be shared between parallel steps, so run such segments as they are
+        step = backend.parse_step(text) or Step("shell", text)
+        step.name, step.deps, step.group = name, tuple(deps), group
+        steps[name] = step
+        groups.setdefault(group, []).append(name)
+        previous = groups[group]
+    return Plan(path, list(steps.values()))
+
+
+class StepResult:
+    def __init__(self, step, exit_code, seconds):
+        self.step = step
+        self.exit_code = exit_code
+        self.seconds = seconds
+
+
+class PlanRun:
+    """Runs the steps of a Plan, stopping at the first failing one.
+
+    With ``capture=True`` stdout and stderr are read line by line on two
+    reader threads and passed to ``on_output`` in batches of ``(stream,
+    line)`` tuples, at most every ``flush_interval`` seconds; otherwise the
+    output goes straight to this process's own console.  ``on_step`` receives
+    a StepResult after every step.  ``cancel`` (or ``timeout`` seconds for the
+    whole plan) terminates the current process and kills it after
+    ``kill_timeout`` seconds.
+
+    With a quicklaunch.resultcache ResultCache and a ``cache_spec``, a cached
+    successful run is replayed instead of running the plan, and successful
+    runs are added to the cache.
+
+    With a quicklaunch.sessions SessionPool, captured command steps are sent
+    to a warm shell session instead of starting a new process each.
+
+    The steps of a parallel Plan run on up to ``max_parallel`` threads as
+    soon as the steps they wait for succeeded, each line of output prefixed
+    with ``[step name]``.  When a step fails, the steps of its group that are
+    still running are cancelled and no new step starts.
+    """
+
+    FLUSH_INTERVAL = 0.05  # Seconds between batches while capturing
+    MAX_BATCH_LINES = 1000  # Emit early when a batch grows past this
+    MAX_PENDING_LINES = 10000  # Reader threads block when this many lines wait
+
+    def __init__(self, plan, backend=None, capture=True, on_output=None, on_step=None,
+                 timeout=None, kill_timeout=5.0, cache=None, cache_spec=None, sessions=None,
+                 max_parallel=None):
+        self.plan = plan
+        self.backend = backend or get_backend()
+        self.capture = capture
+        self.on_output = on_output
+        self.on_step = on_step
+        self.timeout = timeout
+        self.kill_timeout = kill_timeout
+        self.cancel_requested = False
+        self.timed_out = False
+        self.step_results = []
+        self.wall_time = 0.0
+        self.start = None
+        self.spawn_latency = None  # Seconds until the first process was started
+        self.output_chars = {"stdout": 0, "stderr": 0}  # Captured output, line breaks included
+        self.cache = cache if capture and cache_spec else None
+        self.cache_spec = cache_spec
+        self.cache_status = None  # "hit" or "miss" when the run used the cache
+        self.recorded = None  # Output kept for the cache during a miss
+        self.sessions = sessions if capture else None
+        self.max_parallel = max_parallel or max(2, os.cpu_count() or 1)  # Steps mostly wait on their processes
+        self.output_lock = threading.Lock()  # emit_output is called from several steps in a graph
+
+    def cancel(self):
+        self.cancel_requested = True
+
+    def run(self):
+        """Runs the plan and returns the exit code of the last step run."""
+        self.start = time.monotonic()
+        lookup = None
+        if self.cache is not None:
+            try:
+                lookup = self.cache.lookup(str(self.plan), self.cache_spec, self.plan.workdir(self.backend))
+            except OSError as e:
+                self.emit_output([("stderr", f"Result cache unavailable: {str(e)}")])
+            except ValueError as e:
+                self.emit_output([("stderr", f"Result cache skipped: {str(e)}")])
+            if lookup is not None and lookup.hit:
+                self.cache_status = "hit"
+                for first in range(0, len(lookup.output), self.MAX_BATCH_LINES):
+                    self.emit_output(lookup.output[first:first + self.MAX_BATCH_LINES])
+                self.wall_time = time.monotonic() - self.start
+                return 0
+            if lookup is not None:
+                self.cache_status = "miss"
+                self.recorded = []
+        exit_code = self.run_graph() if self.plan.parallel else self.run_steps()
+        if lookup is not None and exit_code == 0 and not self.cancel_requested and self.recorded is not None:
+            self.cache.store(lookup, self.recorded)
+        self.wall_time = time.monotonic() - self.start
+        return exit_code
+
+    def run_steps(self):
+        cwd = None
+        env = None
+        exit_code = 0
+        for step in self.plan.steps:
+            if self.cancel_requested:
+                break
+            step_start = time.monotonic()
+            if step.kind == "cd":
+                target, _ = apply_state(self.backend, step, cwd, env)
+                if os.path.isdir(target):
+                    cwd = target
+                    exit_code = 0
+                else:
+                    self.emit_output([("stderr", f"cd: {step.value}: No such directory")])
+                    exit_code = 1
+            elif step.kind == "env":
+                cwd, env = apply_state(self.backend, step, cwd, env)
+                exit_code = 0
+            else:
+                exit_code = self.run_process(step, cwd, env)
+            self.finish_step(step, exit_code, step_start)
+            if exit_code != 0:
+                break
+        return exit_code
+
+    def finish_step(self, step, exit_code, step_start):
+        result = StepResult(step, exit_code, time.monotonic() - step_start)
+        self.step_results.append(result)
+        if self.on_step is not None:
+            self.on_step(result)
+
+    def step_states(self):
+        """The ``(cwd, env)`` every step of a graph runs with.
+
+        ``cd`` and environment steps apply to the steps after them in the
+        chain's text, whichever order the steps actually run in.
+        """
+        cwd = None
+        env = None
+        states = {}
+        for step in self.plan.steps:
+            if step.kind in ("cd", "env"):
+                cwd, env = apply_state(self.backend, step, cwd, env)
+            states[step.name] = (cwd, env)
+        return states
+
+    def run_graph(self):
+        """Runs the steps of a parallel plan; returns the exit code of the first failing step."""
+        states = self.step_states()
+        waiting = list(self.plan.steps)
+        succeeded = set()
+        running = {}  # Future -> (step, child PlanRun, start)
+        exit_code = 0
+        failed = False
+        with ThreadPoolExecutor(max_workers=self.max_parallel, thread_name_prefix="step") as pool:
+            while waiting or running:
+                ready = [] if failed or self.cancel_requested else \
+                    [step for step in waiting if succeeded.issuperset(step.deps)]
+                for step in ready[:self.max_parallel - len(running)]:
+                    waiting.remove(step)
+                    step_start = time.monotonic()
+                    cwd, env = states[step.name]
+                    if step.kind in ("cd", "env"):
+                        code = 0
+                        if step.kind == "cd" and not os.path.isdir(cwd):
+                            self.emit_output([("stderr", f"[{step.name}] cd: {step.value}: No such directory")])
+                            code = 1
+                        self.finish_step(step, code, step_start)
+                        if code == 0:
+                            succeeded.add(step.name)
+                        else:
+                            failed, exit_code = True, code
+                        continue
+                    child = PlanRun(Plan(self.plan.path, [step]), self.backend, capture=True,
+                                    on_output=self.prefixed_output(step.name), kill_timeout=self.kill_timeout,
+                                    sessions=self.sessions)
+                    child.start = step_start
+                    running[pool.submit(child.run_process, step, cwd, env)] = (step, child)
+                if not running:
+                    if ready:
+                        continue  # cd and env steps finished at once; start what they unblocked
+                    break  # Cancelled, failed or stuck behind a failed step
+                finished, _ = wait(running, timeout=self.FLUSH_INTERVAL, return_when=FIRST_COMPLETED)
+                if self.timeout is not None and not self.timed_out \
+                        and time.monotonic() - self.start > self.timeout:
+                    self.timed_out = True
+                    self.cancel_requested = True
+                if self.cancel_requested:
+                    for _, child in running.values():
+                        child.cancel()
+                for future in finished:
+                    step, child = running.pop(future)
+                    code = future.result()
+                    self.add_child_stats(child)
+                    self.finish_step(step, code, child.start)
+                    if code == 0:
+                        succeeded.add(step.name)
+                    elif not failed:
+                        failed, exit_code = True, code
+                        for sibling, other in running.values():
+                            if sibling.group == step.group:
+                                other.cancel()
+        if exit_code == 0 and waiting:
+            exit_code = -1  # Cancelled before every step ran
+        return exit_code
+
+    def prefixed_output(self, name):
+        prefix = f"[{name}] "
+        return lambda batch: self.emit_output([(stream_name, prefix + line) for stream_name, line in batch])
+
+    def add_child_stats(self, child):
+        for stream_name, chars in child.output_chars.items():
+            self.output_chars[stream_name] += chars
+        if child.spawn_latency is not None:
+            latency = child.start - self.start + child.spawn_latency
+            if self.spawn_latency is None or latency < self.spawn_latency:
+                self.spawn_latency = latency
+
+    def emit_output(self, batch):
+        if not batch:
+            return
+        with self.output_lock:
+            if self.recorded is not None:
+                self.recorded.extend(batch)
+                if len(self.recorded) > self.cache.MAX_RECORDED_LINES:
+                    self.recorded = None  # Too much output to be worth caching
+            if self.on_output is not None:
+                self.on_output(batch)
+            elif not self.capture:
+                for stream_name, line in batch:
+                    print(line, file=sys.stderr if stream_name == "stderr" else sys.stdout)
+
+    def spawn(self, step, cwd, env, **kwargs):
+        args = step.argv if step.kind == "exec" else step.text
+        kwargs.update(self.backend.popen_kwargs())
+        return subprocess.Popen(args, shell=(step.kind == "shell"), cwd=cwd, env=env, **kwargs)
+
+    def run_process(self, step, cwd, env):
+        if self.sessions is not None:
+            return self.run_in_session(step, cwd, env)
+        try:
+            if not self.capture:
+                process = self.spawn(step, cwd, env)
+            else:
+                process = self.spawn(step, cwd, env, stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+                                     text=True, errors="replace")
+        except (OSError, ValueError) as e:
+            self.emit_output([("stderr", f"An unexpected error occurred: {str(e)}")])
+            return -1
+        if self.spawn_latency is None:
+            self.spawn_latency = time.monotonic() - self.start
+        if not self.capture:
+            return self.wait_uncaptured(process)
+        return self.pump(process)
+
+    def run_in_session(self, step, cwd, env):
+        """Runs a step in a warm shell session taken from ``sessions``."""
+        session = None
+        try:
+            session = self.sessions.acquire()
+            session.send(step.text, cwd, env)
+        except (OSError, ValueError) as e:
+            if session is not None:
+                self.sessions.discard(session)
+            self.emit_output([("stderr", f"An unexpected error occurred: {str(e)}")])
+            return -1
+        if self.spawn_latency is None:
+            self.spawn_latency = time.monotonic() - self.start
+        finished = self.drain(session.pending, session.process, 2, session.terminate)
+        if not finished or self.cancel_requested or not session.alive or session.exit_code is None:
+            self.sessions.discard(session)
+            return session.process.wait() if session.exit_code is None else session.exit_code
+        self.sessions.release(session)
+        return session.exit_code
+
+    def check_cancel(self, process, state, now, terminate=None):
+        """Handles timeout and cancellation; returns False once the pipes should be abandoned."""
+        terminate = terminate or (lambda force=False: self.backend.terminate(process, force))
+        if self.timeout is not None and not self.timed_out and now - self.start > self.timeout:
+            self.timed_out = True
+            self.cancel_requested = True
+        if self.cancel_requested and state["kill_deadline"] is None:
+            if process.poll() is None:
+                terminate()
+            state["kill_deadline"] = now + self.kill_timeout
+        elif state["kill_deadline"] is not None and state["abandon_deadline"] is None \
+                and now >= state["kill_deadline"]:
+            if process.poll() is None:
+                terminate(force=True)
+            state["abandon_deadline"] = now + self.kill_timeout
+        elif state["abandon_deadline"] is not None and now >= state["abandon_deadline"]:
+            return False  # A detached child still holds the pipes open
+        return True
+
+    def wait_uncaptured(self, process):
+        state = {"kill_deadline": None, "abandon_deadline": None}
+        while True:
+            try:
+                return process.wait(timeout=self.FLUSH_INTERVAL)
+            except subprocess.TimeoutExpired:
+                self.check_cancel(process, state, time.monotonic())
+
+    def pump(self, process):
+        """Streams a process's output in batches until both pipes close."""
+        pending = queue.Queue(maxsize=self.MAX_PENDING_LINES)
+        readers = [
+            threading.Thread(target=self._read_pipe, args=(process.stdout, "stdout", pending), daemon=True),
+            threading.Thread(target=self._read_pipe, args=(process.stderr, "stderr", pending), daemon=True),
+        ]
+        for reader in readers:
+            reader.start()
+        self.drain(pending, process, len(readers))
+        return process.wait()
+
+    def drain(self, pending, process, open_pipes, terminate=None):
+        """Emits ``(stream, line)`` items from ``pending`` in batches until ``open_pipes`` Nones arrived.
+
+        Returns False when the pipes were abandoned after a cancel.
+        """
+        state = {"kill_deadline": None, "abandon_deadline": None}
+        batch = []
+        deadline = time.monotonic() + self.FLUSH_INTERVAL
+        while open_pipes:
+            try:
+                item = pending.get(timeout=max(0.0, deadline - time.monotonic()))
+            except queue.Empty:
+                item = False
+            if item is None:
+                open_pipes -= 1
+            elif item:
+                batch.append(item)
+                self.output_chars[item[0]] += len(item[1]) + 1
+            if batch and (item is False or len(batch) >= self.MAX_BATCH_LINES
+                          or time.monotonic() >= deadline):
+                self.emit_output(batch)
+                batch = []
+            now = time.monotonic()
+            if item is False or now >= deadline:
+                deadline = now + self.FLUSH_INTERVAL
+            if not self.check_cancel(process, state, now, terminate):
+                self.emit_output(batch)
+                return False
+        self.emit_output(batch)
+        return True
+
+    @staticmethod
+    def _read_pipe(pipe, stream_name, pending):
+        """Pushes lines from one pipe onto the shared queue, then a None marker."""
+        try:
+            for line in pipe:
+                pending.put((stream_name, line.rstrip("\r\n")))
+        finally:
+            pipe.close()
+            pending.put(None)
@@ -0,0 +1,2263 @@
+"""The Quick Launch window; started by Quick_Launcher.py."""
+from PyQt5.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout,
+                             QHBoxLayout, QPushButton, QLineEdit,
+                             QDialog, QLabel, QDialogButtonBox, QMessageBox,
+                             QFrame, QPlainTextEdit, QTreeWidget,
+                             QTreeWidgetItem, QSpinBox, QListView,
+                             QStyledItemDelegate, QStyle, QToolTip, QFileIconProvider, QCheckBox,
+                             QComboBox)
+from PyQt5.QtGui import (QClipboard, QColor, QPalette, QIcon, QTextCursor, QPainter, QDrag,
+                         QPen, QBrush, QFont, QLinearGradient, QPixmap)
+from PyQt5.QtCore import (Qt, QObject, QTime, QThread, QTimer, QMimeData, pyqtSignal, pyqtSlot,
+                          QAbstractListModel, QModelIndex, QEvent, QSize, QRect,
+                          QRectF, QPoint, QPointF, QFileInfo, QBuffer, QByteArray, QIODevice,
+                          QFileSystemWatcher)
+from PyQt5.QtNetwork import QHostAddress, QTcpServer
+import os
+import re
+import subprocess
+import sys
+import json
+import secrets
+import sqlite3
+import heapq
+import itertools
+import threading
+import time
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
+
+from quicklaunch.collection import LauncherCollection, diff_launchers
+from quicklaunch import importer, instance
+from quicklaunch.iconcache import IconDiskCache, stat_target
+from quicklaunch import iconcache
+from quicklaunch.executor import Plan, PlanRun, get_backend, is_command, parse_plan
+from quicklaunch.logbuffer import LogRingBuffer
+from quicklaunch import pathhealth
+from quicklaunch.pathhealth import PathHealthCache
+from quicklaunch.resultcache import ResultCache, parse_patterns
+from quicklaunch.runlog import MappedLog, RunLogStore, RunLogWriter
+from quicklaunch.search import LauncherIndex
+from quicklaunch import sessions
+from quicklaunch.sessions import SessionPool
+from quicklaunch.store import open_store
+from quicklaunch.telemetry import RunRecord, TelemetryStore
+from quicklaunch.triggers import TriggerHeap, parse_schedule, parse_trigger
+
+class EditDialog(QDialog):
+    OVERLAP_LABELS = (("skip", "If still running: skip the new run"),
+                      ("queue", "If still running: run again when it ends"),
+                      ("cancel", "If still running: cancel it and start again"))
+
+    def __init__(self, parent=None, nickname="", path="", options=None):
+        super().__init__(parent)
+        self.setWindowTitle("Edit Launcher")
+        self.setGeometry(800, 450, 300, 200)  # Increased size (approx. 16:9)
+        self.nickname_edit = QLineEdit(nickname)
+        self.path_edit = QLineEdit(path)
+        cache = (options or {}).get("cache", {})
+        self.cache_inputs_edit = QLineEdit("; ".join(cache.get("inputs", [])))
+        self.cache_inputs_edit.setPlaceholderText("e.g. src/**/*.c; include/*.h (empty: always run)")
+        self.cache_outputs_edit = QLineEdit("; ".join(cache.get("outputs", [])))
+        self.cache_outputs_edit.setPlaceholderText("e.g. build/app.exe")
+        self.session_check = QCheckBox("Run commands in a warm shell session")
+        self.session_check.setChecked(bool((options or {}).get("session")))
+        self.session_check.setEnabled(sessions.supported())
+        trigger = (options or {}).get("trigger", {})
+        self.schedule_edit = QLineEdit(trigger.get("schedule", ""))
+        self.schedule_edit.setPlaceholderText("e.g. 5m, 1h or */15 8-18 * * 1-5 (empty: none)")
+        self.watch_edit = QLineEdit("; ".join(trigger.get("watch", [])))
+        self.watch_edit.setPlaceholderText("e.g. src; setup.cfg (empty: none)")
+        self.overlap_combo = QComboBox()
+        for policy, label in self.OVERLAP_LABELS:
+            self.overlap_combo.addItem(label, policy)
+        self.overlap_combo.setCurrentIndex(max(0, self.overlap_combo.findData(trigger.get("overlap", "skip"))))
+
+        layout = QVBoxLayout()
+        layout.addWidget(QLabel("Nickname:"))
+        layout.addWidget(self.nickname_edit)
+        layout.addWidget(QLabel("Path:"))
+        layout.addWidget(self.path_edit)
+        layout.addWidget(QLabel("Cache inputs (commands only):"))
+        layout.addWidget(self.cache_inputs_edit)
+        layout.addWidget(QLabel("Cache outputs:"))
+        layout.addWidget(self.cache_outputs_edit)
+        layout.addWidget(self.session_check)
+        layout.addWidget(QLabel("Run on a schedule (commands only):"))
+        layout.addWidget(self.schedule_edit)
+        layout.addWidget(QLabel("Run when these files or folders change:"))
+        layout.addWidget(self.watch_edit)
+        layout.addWidget(self.overlap_combo)
+
+        buttons = QDialogButtonBox(QDialogButtonBox.Ok | QDialogButtonBox.Cancel)
+        buttons.accepted.connect(self.accept)
+        buttons.rejected.connect(self.reject)
+        layout.addWidget(buttons)
+
+        self.setLayout(layout)
+        self.apply_stylesheet()
+        self.apply_background_color()
+
+    def apply_background_color(self):
+        """Applies a light gray background to the edit dialog."""
+        palette = self.palette()
+        #palette.setColor(QPalette.Background, QColor("#f0f0f0"))  # Light gray
+        #self.central_widget.setStyleSheet('background-color: #000000;')
+        self.setAutoFillBackground(True)
+        self.setPalette(palette)
+        self.setAutoFillBackground(True)
+
+    def apply_stylesheet(self):
+        stylesheet = """
+            QDialog {
+                color: #333;
+                font-family: "Segoe UI", sans-serif;
+                font-size: 10pt;
+            }
+            QLabel {
+                color: #FFFFFF;
+            }
+            QLineEdit {
+                background: white;
+                border: 1px solid #ccc;
+                border-radius: 3px;
+                padding: 5px;
+                color: #333;
+            }
+            QDialogButtonBox QPushButton {
+                background: #e0e0e0;
+                border: 1px solid #ccc;
+                border-radius: 3px;
+                padding: 5px 10px;
+                color: #333;
+                font-weight: normal;
+            }
+            QDialogButtonBox QPushButton:hover {
+                background: #d8d8d8;
+            }
+        """
+        self.setStyleSheet(stylesheet)
+
+    def get_values(self):
+        return self.nickname_edit.text().strip(), self.path_edit.text().strip()
+
+    def get_options(self):
+        """Per-launcher options; a cache spec is kept only when inputs are declared."""
+        options = {}
+        inputs = parse_patterns(self.cache_inputs_edit.text())
+        if inputs:
+            options["cache"] = {"inputs": inputs, "outputs": parse_patterns(self.cache_outputs_edit.text())}
+        if self.session_check.isChecked():
+            options["session"] = True
+        schedule = self.schedule_edit.text().strip()
+        watch = parse_patterns(self.watch_edit.text())
+        if schedule or watch:
+            options["trigger"] = {"schedule": schedule, "watch": watch, "overlap": self.overlap_combo.currentData()}
+        return options
+
+    def accept(self):
+        schedule = self.schedule_edit.text().strip()
+        if schedule:
+            try:
+                parse_schedule(schedule)
+            except ValueError as e:
+                QMessageBox.warning(self, "Invalid schedule", str(e))
+                return
+        super().accept()
+
+class IconService(QObject):
+    """Icons of launcher targets, resolved without blocking the GUI thread.
+
+    ``icon`` answers from an in-memory LRU, then from the on-disk cache
+    (quicklaunch/iconcache.py), and otherwise returns a placeholder.  Every
+    target is stat'ed once per session on a worker thread; when its icon is
+    missing or stale it is rendered with QFileIconProvider on the GUI thread
+    (pixmaps cannot be created elsewhere), stored in both caches and
+    ``icons_changed`` is emitted.
+    """
+
+    icons_changed = pyqtSignal()
+    target_stated = pyqtSignal(str, object, str)  # Path, mtime in ns, iconcache kind; from worker threads
+
+    ICON_SIZE = 20
+    MEMORY_ENTRIES = 2000  # Pixmaps kept in memory
+    WORKERS = 4  # Threads stat'ing targets
+    RENDER_BATCH = 20  # Icons rendered per event loop pass
+
+    def __init__(self, parent=None, disk_cache=None):
+        super().__init__(parent)
+        self.provider = QFileIconProvider()
+        self.disk = disk_cache or IconDiskCache()
+        self.memory = OrderedDict()  # path -> QPixmap, least recently used first
+        self.executor = ThreadPoolExecutor(max_workers=self.WORKERS, thread_name_prefix="icons")
+        self.checked = set()  # Targets stat'ed (or being stat'ed) this session
+        self.pending = []  # (path, mtime_ns, kind) waiting to be rendered
+        self.placeholder = self.provider.icon(QFileIconProvider.File).pixmap(self.ICON_SIZE)
+        self.folder_icon = self.provider.icon(QFileIconProvider.Folder).pixmap(self.ICON_SIZE)
+        self.command_icon = QApplication.style().standardIcon(QStyle.SP_ComputerIcon).pixmap(self.ICON_SIZE)
+        self.target_stated.connect(self.handle_target_stated)
+        self.render_timer = QTimer(self)
+        self.render_timer.setSingleShot(True)
+        self.render_timer.timeout.connect(self.render_pending)
+        self.changed_timer = QTimer(self)  # Coalesces repaints while many icons arrive
+        self.changed_timer.setSingleShot(True)
+        self.changed_timer.setInterval(100)
+        self.changed_timer.timeout.connect(self.icons_changed.emit)
+
+    def icon(self, path):
+        """A QPixmap for ``path``; never touches the target itself."""
+        if not path:
+            return None
+        if is_command(path):
+            return self.command_icon
+        pixmap = self.memory.get(path)
+        if pixmap is None:
+            data = self.disk.read(path)
+            if data is not None:
+                pixmap = QPixmap()
+                if not pixmap.loadFromData(data, "PNG"):
+                    pixmap = None
+                else:
+                    self.remember(path, pixmap)
+        else:
+            self.memory.move_to_end(path)
+        if path not in self.checked:
+            self.checked.add(path)
+            self.executor.submit(self._stat, path)
+        return pixmap if pixmap is not None else self.placeholder
+
+    def remember(self, path, pixmap):
+        self.memory[path] = pixmap
+        self.memory.move_to_end(path)
+        while len(self.memory) > self.MEMORY_ENTRIES:
+            self.memory.popitem(last=False)
+
+    def _stat(self, path):
+        mtime_ns, kind = stat_target(path)
+        self.target_stated.emit(path, mtime_ns, kind)
+
+    @pyqtSlot(str, object, str)
+    def handle_target_stated(self, path, mtime_ns, kind):
+        if kind == iconcache.MISSING:
+            return  # Keep whatever icon was cached; the grid greys the launcher out
+        if self.disk.mtime(path) == mtime_ns and path in self.memory:
+            return
+        self.pending.append((path, mtime_ns, kind))
+        self.render_timer.start()
+
+    def render_pending(self):
+        batch, self.pending = self.pending[:self.RENDER_BATCH], self.pending[self.RENDER_BATCH:]
+        for path, mtime_ns, kind in batch:
+            if kind == iconcache.FOLDER:
+                pixmap = self.folder_icon
+            else:
+                pixmap = self.provider.icon(QFileInfo(path)).pixmap(self.ICON_SIZE)
+            self.remember(path, pixmap)
+            data = QByteArray()
+            buffer = QBuffer(data)
+            buffer.open(QIODevice.WriteOnly)
+            pixmap.save(buffer, "PNG")
+            buffer.close()
+            self.executor.submit(self.disk.put, path, mtime_ns, bytes(data))
+        if self.pending:
+            self.render_timer.start()
+        self.changed_timer.start()
+
+    def shutdown(self):
+        # Stats of unreachable targets cannot be interrupted, so do not wait for them
+        self.executor.shutdown(wait=False, cancel_futures=True)
+        self.disk.save()
+
+
+class TriggerScheduler(QObject):
+    """Fires launcher triggers (quicklaunch/triggers.py) from a single timer.
+
+    Scheduled runs and file changes share one TriggerHeap and one
+    single-shot QTimer armed for the earliest due time.  A change to a
+    watched path (re)sets its launcher's entry to ``DEBOUNCE`` seconds later,
+    so a burst of saves fires once, at most ``MAX_DELAY`` seconds after the
+    first change of the burst.
+
+    QFileSystemWatcher only reports entries added to or removed from a
+    folder, so a watched folder is watched together with every file and
+    folder below it (hidden ones and ``__pycache__`` excepted, at most
+    ``MAX_TREE_PATHS``), and rescanned when its entries change.  A watched
+    path that does not exist yet is waited for through its nearest existing
+    parent folder.
+    """
+
+    triggered = pyqtSignal(str, str)  # Nickname, reason
+    warning = pyqtSignal(str, str)  # Nickname, message
+
+    DEBOUNCE = 1.0  # Seconds of quiet after the last change of a burst
+    MAX_DELAY = 30.0  # ... but never wait longer than this after its first change
+    MAX_SLEEP = 60.0  # Re-check the heap at least this often, in case the clock jumps
+    MAX_TREE_PATHS = 2000  # Files and folders watched below one watched folder
+    IGNORED_NAMES = {"__pycache__"}
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.heap = TriggerHeap()  # (nickname, "schedule" | "watch") -> due time
+        self.specs = {}  # nickname -> (trigger option, schedule, watched paths, overlap policy)
+        self.watched = {}  # Absolute watched path (a root) -> nicknames watching it
+        self.trees = {}  # Root -> paths actually watched for it
+        self.owners = {}  # Path actually watched -> roots it belongs to
+        self.first_change = {}  # nickname -> time of the first change of the current burst
+        self.watcher = QFileSystemWatcher(self)
+        self.watcher.fileChanged.connect(self.path_changed)
+        self.watcher.directoryChanged.connect(self.path_changed)
+        self.timer = QTimer(self)
+        self.timer.setSingleShot(True)
+        self.timer.timeout.connect(self.fire_due)
+
+    def set_triggers(self, triggers):
+        """Applies ``{nickname: trigger option}``; returns ``{nickname: error}`` for invalid ones.
+
+        Launchers whose trigger did not change keep their next due time.
+        """
+        for nickname in list(self.specs):
+            if triggers.get(nickname) != self.specs[nickname][0]:
+                self.remove(nickname)
+        errors = {}
+        now = time.time()
+        for nickname, options in triggers.items():
+            if nickname in self.specs:
+                continue
+            try:
+                schedule, watch, overlap = parse_trigger(options)
+                due = schedule.next_after(now) if schedule is not None else None
+            except ValueError as e:
+                errors[nickname] = str(e)
+                continue
+            watch = [os.path.abspath(os.path.expanduser(path)) for path in watch]
+            self.specs[nickname] = (options, schedule, watch, overlap)
+            if due is not None:
+                self.heap.set((nickname, "schedule"), due)
+            for path in watch:
+                self.watched.setdefault(path, set()).add(nickname)
+                if path not in self.trees:
+                    self.trees[path] = self.scan(path, nickname)
+                if not os.path.exists(path):
+                    self.warning.emit(nickname, f"watched path does not exist yet, changes count once it "
+                                                f"is created: {path}")
+        self.update_watcher()
+        self.arm()
+        return errors
+
+    def remove(self, nickname):
+        _, _, watch, _ = self.specs.pop(nickname)
+        self.heap.remove((nickname, "schedule"))
+        self.heap.remove((nickname, "watch"))
+        self.first_change.pop(nickname, None)
+        for path in watch:
+            nicknames = self.watched.get(path, set())
+            nicknames.discard(nickname)
+            if not nicknames:
+                self.watched.pop(path, None)
+                self.trees.pop(path, None)
+
+    def overlap(self, nickname):
+        return self.specs[nickname][3] if nickname in self.specs else "skip"
+
+    def scan(self, root, nickname=None):
+        """The paths to watch for ``root``: itself and everything below a folder.
+
+        A root that does not exist yet is represented by its nearest
+        existing parent folder.
+        """
+        if not os.path.exists(root):
+            parent = os.path.dirname(root)
+            while not os.path.isdir(parent) and os.path.dirname(parent) != parent:
+                parent = os.path.dirname(parent)
+            return {parent} if os.path.isdir(parent) else set()
+        paths = {root}
+        folders = [root] if os.path.isdir(root) else []
+        while folders:
+            try:
+                entries = list(os.scandir(folders.pop()))
+            except OSError:
+                continue
+            for entry in entries:
+                if entry.name.startswith(".") or entry.name in self.IGNORED_NAMES:
+                    continue
+                if len(paths) >= self.MAX_TREE_PATHS:
+                    for name in sorted(self.watched.get(root, ())) if nickname is None else [nickname]:
+                        self.warning.emit(name, f"only the first {self.MAX_TREE_PATHS} files and folders "
+                                                f"below {root} are watched")
+                    return paths
+                paths.add(entry.path)
+                if entry.is_dir(follow_symlinks=False):
+                    folders.append(entry.path)
+        return paths
+
+    def update_watcher(self):
+        self.owners = {}
+        for root, paths in self.trees.items():
+            for path in paths:
+                self.owners.setdefault(path, set()).add(root)
+        current = set(self.watcher.files()) | set(self.watcher.directories())
+        stale = [path for path in current if path not in self.owners]
+        if stale:
+            self.watcher.removePaths(stale)
+        missing = [path for path in self.owners if path not in current and os.path.exists(path)]
+        if missing:
+            self.watcher.addPaths(missing)
+
+    @pyqtSlot(str)
+    def path_changed(self, path):
+        roots = self.owners.get(path, set())
+        existed = {root for root in roots if root in self.trees[root]}
+        if os.path.isdir(path) or not os.path.exists(path):
+            # Entries were added, removed or renamed: rescan the affected trees
+            for root in roots:
+                self.trees[root] = self.scan(root)
+            self.update_watcher()
+        elif path not in self.watcher.files():
+            self.watcher.addPath(path)  # Replaced by a save: the old watch is gone
+        now = time.time()
+        for root in roots:
+            if root not in existed and not os.path.exists(root):
+                continue  # Something else changed next to a path that is still missing
+            for nickname in self.watched.get(root, ()):
+                first = self.first_change.setdefault(nickname, now)
+                self.heap.set((nickname, "watch"), min(now + self.DEBOUNCE, first + self.MAX_DELAY))
+        self.arm()
+
+    def arm(self):
+        due = self.heap.next_due()
+        if due is None:
+            self.timer.stop()
+            return
+        self.timer.start(int(min(max(0.0, due - time.time()), self.MAX_SLEEP) * 1000))
+
+    def fire_due(self):
+        now = time.time()
+        for nickname, kind in self.heap.pop_due(now):
+            if nickname not in self.specs:
+                continue
+            if kind == "schedule":
+                # Runs missed while asleep collapse into this one
+                self.heap.set((nickname, "schedule"), self.specs[nickname][1].next_after(now))
+                self.triggered.emit(nickname, "schedule")
+            else:
+                self.first_change.pop(nickname, None)
+                self.triggered.emit(nickname, "file change")
+        self.arm()
+
+
+class LauncherListModel(QAbstractListModel):
+    """Ordered list of (nickname, path) launchers shown by the LauncherGridView."""
+
+    NicknameRole = Qt.UserRole
+    PathRole = Qt.UserRole + 1
+    StatusRole = Qt.UserRole + 2  # pathhealth status of a plain path, None for commands
+
+    def __init__(self, parent=None, status_lookup=None, icon_lookup=None):
+        super().__init__(parent)
+        self.launchers = []
+        self.status_lookup = status_lookup
+        self.icon_lookup = icon_lookup
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.launchers)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        nickname, path = self.launchers[index.row()]
+        if role in (Qt.DisplayRole, LauncherListModel.NicknameRole):
+            return nickname
+        if role in (Qt.ToolTipRole, LauncherListModel.PathRole):
+            return path
+        if role == LauncherListModel.StatusRole:
+            if not path or ";" in path or self.status_lookup is None:
+                return None
+            return self.status_lookup(path)
+        if role == Qt.DecorationRole and self.icon_lookup is not None:
+            return self.icon_lookup(path)
+        return None
+
+    def flags(self, index):
+        if not index.isValid():
+            return Qt.NoItemFlags
+        return Qt.ItemIsEnabled
+
+    def set_launchers(self, launchers_data):
+        """Replaces all rows with the entries of a nickname -> path dict."""
+        self.beginResetModel()
+        self.launchers = [[nickname, path] for nickname, path in launchers_data.items()]
+        self.endResetModel()
+
+    def launcher(self, row):
+        nickname, path = self.launchers[row]
+        return nickname, path
+
+    def set_launcher(self, row, nickname, path):
+        self.launchers[row] = [nickname, path]
+        index = self.index(row)
+        self.dataChanged.emit(index, index)
+
+    def refresh_all(self):
+        """Tells the views that every row may have changed (cheap: only visible rows repaint)."""
+        if self.launchers:
+            self.dataChanged.emit(self.index(0), self.index(len(self.launchers) - 1))
+
+    def append_launcher(self, nickname, path):
+        self.append_launchers([(nickname, path)])
+
+    def append_launchers(self, launchers):
+        """Appends (nickname, path) pairs as one insertion."""
+        if not launchers:
+            return
+        row = len(self.launchers)
+        self.beginInsertRows(QModelIndex(), row, row + len(launchers) - 1)
+        self.launchers.extend([nickname, path] for nickname, path in launchers)
+        self.endInsertRows()
+
+    def remove_row(self, row):
+        self.beginRemoveRows(QModelIndex(), row, row)
+        del self.launchers[row]
+        self.endRemoveRows()
+
+    def move_row(self, row, new_row):
+        """Moves one row so it ends up at ``new_row``; the views shift only the rows in between."""
+        if row == new_row:
+            return
+        # Qt wants the destination as it is before the row is taken out
+        self.beginMoveRows(QModelIndex(), row, row, QModelIndex(), new_row + 1 if new_row > row else new_row)
+        self.launchers.insert(new_row, self.launchers.pop(row))
+        self.endMoveRows()
+
+
+class LauncherDelegate(QStyledItemDelegate):
+    """Paints a launcher row as an open button plus copy, edit and delete buttons.
+
+    The buttons are only drawn, never instantiated, so a row costs no widgets
+    at all.  Clicks and tooltips are resolved with ``hit_test`` against the
+    row rectangle.
+    """
+
+    action_triggered = pyqtSignal(str, int)  # Action ("open", "copy", "edit", "delete"), row
+
+    ROW_HEIGHT = 46
+    MARGIN = 6
+    TEXT_INSET = 48  # Room left of the nickname for the icon and warning sign
+    ACTION_SIZE = 25
+    ACTION_SPACING = 2
+    ACTIONS = [
+        # Action, symbol, tooltip, gradient colours, hover gradient colours
+        ("copy", "\u2398", "Copy path to clipboard", ("#a5d6a7", "#81c784"), ("#90ee90", "#66bb6a")),
+        ("edit", "\u270E", "Edit nickname and path", ("#ce93d8", "#ba68c8"), ("#e1bee7", "#ab47bc")),
+        ("delete", "X", "Remove nickname and path", ("#ef5350", "#e53935"), ("#f44336", "#d32f2f")),
+    ]
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.border_pen = QPen(QColor("#cccccc"))
+        self.text_pen = QPen(QColor("#000000"))
+        self.disabled_text_pen = QPen(QColor("#808080"))
+        self.disabled_brush = QBrush(QColor("#d3d3d3"))
+        self.warning_pen = QPen(QColor("#e65100"))
+        self.action_font = QFont("Segoe UI")
+        self.action_font.setPointSize(10)
+
+    def sizeHint(self, option, index):
+        # Fill the whole grid cell of the view the row is shown in
+        grid_size = option.widget.gridSize() if isinstance(option.widget, QListView) else QSize()
+        return QSize(grid_size.width() if grid_size.isValid() else 200, self.ROW_HEIGHT)
+
+    def button_rect(self, rect):
+        """Rectangle of the main open button inside a row."""
+        inner = rect.adjusted(self.MARGIN, self.MARGIN, -self.MARGIN, -self.MARGIN)
+        actions_width = len(self.ACTIONS) * (self.ACTION_SIZE + self.ACTION_SPACING) + self.MARGIN
+        return inner.adjusted(0, 0, -actions_width, 0)
+
+    def action_rects(self, rect):
+        """(action, rectangle) pairs of the round buttons inside a row."""
+        inner = rect.adjusted(self.MARGIN, self.MARGIN, -self.MARGIN, -self.MARGIN)
+        top = inner.center().y() - self.ACTION_SIZE // 2
+        left = inner.right() - len(self.ACTIONS) * (self.ACTION_SIZE + self.ACTION_SPACING) + 1
+        rects = []
+        for i, (action, *_) in enumerate(self.ACTIONS):
+            x = left + i * (self.ACTION_SIZE + self.ACTION_SPACING) + self.ACTION_SPACING
+            rects.append((action, QRect(x, top, self.ACTION_SIZE, self.ACTION_SIZE)))
+        return rects
+
+    @staticmethod
+    def is_enabled(index):
+        """Whether the open button of a row can be clicked."""
+        return bool(index.data(LauncherListModel.PathRole)) and \
+            index.data(LauncherListModel.StatusRole) != pathhealth.MISSING
+
+    def hit_test(self, rect, pos):
+        """Returns the action under ``pos`` for a row drawn in ``rect``, or None."""
+        for action, action_rect in self.action_rects(rect):
+            if action_rect.contains(pos):
+                return action
+        if self.button_rect(rect).contains(pos):
+            return "open"
+        return None
+
+    def paint(self, painter, option, index):
+        nickname = index.data(LauncherListModel.NicknameRole)
+        enabled = self.is_enabled(index)
+        status = index.data(LauncherListModel.StatusRole)
+        hovered_action = None
+        if option.state & QStyle.State_MouseOver and option.widget is not None:
+            hovered_action = self.hit_test(option.rect, option.widget.hover_pos)
+
+        painter.save()
+        painter.setRenderHint(QPainter.Antialiasing)
+
+        rect = self.button_rect(option.rect)
+        if not enabled:
+            painter.setBrush(self.disabled_brush)
+        else:
+            gradient = QLinearGradient(QPointF(rect.topLeft()), QPointF(rect.topRight()))
+            colours = ("#e8e8e8", "#d8d8d8") if hovered_action == "open" else ("#f0f0f0", "#e0e0e0")
+            gradient.setColorAt(0, QColor(colours[0]))
+            gradient.setColorAt(1, QColor(colours[1]))
+            painter.setBrush(QBrush(gradient))
+        painter.setPen(self.border_pen)
+        painter.drawRoundedRect(QRectF(rect).adjusted(0.5, 0.5, -0.5, -0.5), 5, 5)
+        painter.setPen(self.text_pen if enabled else self.disabled_text_pen)
+        painter.setFont(option.font)
+        text = option.fontMetrics.elidedText(nickname, Qt.ElideRight, rect.width() - 2 * self.TEXT_INSET)
+        painter.drawText(rect, Qt.AlignCenter, text)
+        icon = index.data(Qt.DecorationRole)
+        if isinstance(icon, QPixmap) and not icon.isNull():
+            size = icon.size() / icon.devicePixelRatio()
+            top = rect.center().y() - size.height() // 2
+            if not enabled:
+                painter.setOpacity(0.4)
+            painter.drawPixmap(QRect(rect.left() + 8, top, size.width(), size.height()), icon)
+            painter.setOpacity(1.0)
+        if status in (pathhealth.MISSING, pathhealth.TIMEOUT):
+            painter.setPen(self.warning_pen)
+            painter.drawText(rect.adjusted(32, 0, 0, 0), Qt.AlignLeft | Qt.AlignVCenter, "\u26A0")
+
+        painter.setFont(self.action_font)
+        for (action, action_rect), (_, symbol, _, colours, hover_colours) in zip(self.action_rects(option.rect), self.ACTIONS):
+            gradient = QLinearGradient(QPointF(action_rect.topLeft()), QPointF(action_rect.bottomRight()))
+            stops = hover_colours if hovered_action == action else colours
+            gradient.setColorAt(0, QColor(stops[0]))
+            gradient.setColorAt(1, QColor(stops[1]))
+            painter.setPen(Qt.NoPen)
+            painter.setBrush(QBrush(gradient))
+            painter.drawEllipse(action_rect)
+            painter.setPen(QColor("#ffffff"))
+            painter.drawText(action_rect, Qt.AlignCenter, symbol)
+        painter.restore()
+
+    def editorEvent(self, event, model, option, index):
+        if event.type() == QEvent.MouseButtonRelease and event.button() == Qt.LeftButton:
+            action = self.hit_test(option.rect, event.pos())
+            if action == "open" and not self.is_enabled(index):
+                action = None  # Disabled, like the old QPushButton
+            if action:
+                self.action_triggered.emit(action, index.row())
+                return True
+        return super().editorEvent(event, model, option, index)
+
+    def helpEvent(self, event, view, option, index):
+        if event.type() == QEvent.ToolTip:
+            action = self.hit_test(option.rect, event.pos())
+            tooltips = {name: tooltip for name, _, tooltip, _, _ in self.ACTIONS}
+            tooltip = tooltips.get(action) or index.data(LauncherListModel.PathRole)
+            status = index.data(LauncherListModel.StatusRole)
+            if tooltip and action not in tooltips:
+                if status == pathhealth.MISSING:
+                    tooltip += "\n(Path not found)"
+                elif status == pathhealth.TIMEOUT:
+                    tooltip += "\n(Path is not responding)"
+            if tooltip:
+                QToolTip.showText(event.globalPos(), tooltip, view)
+                return True
+        return super().helpEvent(event, view, option, index)
+
+
+class LauncherGridView(QListView):
+    """Virtualized grid of launchers laid out in ``columns`` columns.
+
+    Only the rows inside the viewport are painted, so construction and
+    repaint cost depend on the window size, not on the number of launchers.
+
+    While ``reorderable`` is set, launchers can be dragged onto other cells:
+    dropping on the middle of a cell swaps the two launchers, dropping near
+    its left or right edge moves the dragged launcher before or after it.
+    The view only reports the drop through ``launcher_dropped``.
+    """
+
+    launcher_dropped = pyqtSignal(int, int, bool)  # Dragged row, target row, swap (else move)
+
+    MIME_TYPE = "application/x-quicklaunch-row"
+    EDGE_FRACTION = 0.25  # Share of a cell's width on each side that means "insert here"
+
+    def __init__(self, columns=2, parent=None):
+        super().__init__(parent)
+        self.columns = columns
+        self.reorderable = True
+        self.press_pos = None
+        self.drag_row = -1
+        self.drop_indicator = None  # (QRect, swap) painted while dragging
+        self.hover_pos = QPoint(-1, -1)
+        self.launcher_delegate = LauncherDelegate(self)
+        self.setItemDelegate(self.launcher_delegate)
+        self.setViewMode(QListView.ListMode)
+        self.setFlow(QListView.LeftToRight)
+        self.setWrapping(True)
+        self.setResizeMode(QListView.Adjust)
+        self.setUniformItemSizes(True)
+        self.setSelectionMode(QListView.NoSelection)
+        self.setEditTriggers(QListView.NoEditTriggers)
+        self.setFocusPolicy(Qt.NoFocus)
+        self.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+        self.setMouseTracking(True)
+        self.setFrameShape(QFrame.NoFrame)
+        self.setAcceptDrops(True)
+
+    def update_grid_size(self):
+        available = self.viewport().width() - 1
+        if not self.verticalScrollBar().isVisible():
+            # The flow layout keeps room for a scroll bar that may appear
+            available -= self.style().pixelMetric(QStyle.PM_ScrollBarExtent)
+        width = max(1, available // self.columns)
+        self.setGridSize(QSize(width, LauncherDelegate.ROW_HEIGHT))
+
+    def resizeEvent(self, event):
+        self.update_grid_size()
+        super().resizeEvent(event)
+
+    def mousePressEvent(self, event):
+        self.press_pos = event.pos() if event.button() == Qt.LeftButton else None
+        super().mousePressEvent(event)
+
+    def mouseMoveEvent(self, event):
+        if (self.press_pos is not None and event.buttons() & Qt.LeftButton and self.reorderable
+                and (event.pos() - self.press_pos).manhattanLength() >= QApplication.startDragDistance()):
+            index = self.indexAt(self.press_pos)
+            self.press_pos = None
+            if index.isValid():
+                self.start_drag(index)
+                return
+        # Repaint the rows under the old and new cursor positions so the
+        # delegate can highlight the hovered button
+        old_index = self.indexAt(self.hover_pos)
+        self.hover_pos = event.pos()
+        new_index = self.indexAt(self.hover_pos)
+        for index in (old_index, new_index):
+            if index.isValid():
+                self.viewport().update(self.visualRect(index))
+        super().mouseMoveEvent(event)
+
+    def leaveEvent(self, event):
+        index = self.indexAt(self.hover_pos)
+        self.hover_pos = QPoint(-1, -1)
+        if index.isValid():
+            self.viewport().update(self.visualRect(index))
+        super().leaveEvent(event)
+
+    def start_drag(self, index):
+        rect = self.visualRect(index)
+        mime_data = QMimeData()
+        mime_data.setData(self.MIME_TYPE, str(index.row()).encode("ascii"))
+        drag = QDrag(self)
+        drag.setMimeData(mime_data)
+        drag.setPixmap(self.viewport().grab(rect))
+        drag.setHotSpot(self.viewport().mapFromGlobal(self.cursor().pos()) - rect.topLeft())
+        self.drag_row = index.row()
+        try:
+            drag.exec_(Qt.MoveAction)
+        finally:
+            self.drag_row = -1
+            self.set_drop_indicator(None)
+
+    def drop_target(self, pos):
+        """(target row, swap) for a drop at ``pos``, or None where nothing would change."""
+        count = self.model().rowCount()
+        index = self.indexAt(pos)
+        if not index.isValid():
+            return (count - 1, False) if count and self.drag_row != count - 1 else None
+        row = index.row()
+        rect = self.visualRect(index)
+        edge = rect.width() * self.EDGE_FRACTION
+        if pos.x() < rect.left() + edge:
+            target = row - 1 if self.drag_row < row else row  # Before this cell
+        elif pos.x() > rect.right() - edge:
+            target = row if self.drag_row < row else row + 1  # After this cell
+        else:
+            return (row, True) if row != self.drag_row else None
+        return (target, False) if target != self.drag_row else None
+
+    def indicator_for(self, pos):
+        target = self.drop_target(pos)
+        if target is None:
+            return None
+        index = self.indexAt(pos)
+        if not index.isValid():
+            index = self.model().index(self.model().rowCount() - 1, 0)
+            rect = self.visualRect(index)
+            return QRect(rect.right() - 2, rect.top() + 4, 4, rect.height() - 8), False
+        rect = self.visualRect(index)
+        if target[1]:
+            return rect.adjusted(2, 2, -2, -2), True
+        x = rect.left() if pos.x() < rect.center().x() else rect.right() - 3
+        return QRect(x, rect.top() + 4, 4, rect.height() - 8), False
+
+    def set_drop_indicator(self, indicator):
+        if indicator != self.drop_indicator:
+            for old in (self.drop_indicator, indicator):
+                if old is not None:
+                    self.viewport().update(old[0].adjusted(-2, -2, 2, 2))
+            self.drop_indicator = indicator
+
+    def dragEnterEvent(self, event):
+        if event.source() is self and event.mimeData().hasFormat(self.MIME_TYPE):
+            event.acceptProposedAction()
+        else:
+            event.ignore()
+
+    def dragMoveEvent(self, event):
+        if event.source() is not self or not event.mimeData().hasFormat(self.MIME_TYPE):
+            event.ignore()
+            return
+        self.set_drop_indicator(self.indicator_for(event.pos()))
+        event.acceptProposedAction()
+
+    def dragLeaveEvent(self, event):
+        self.set_drop_indicator(None)
+        event.accept()
+
+    def dropEvent(self, event):
+        self.set_drop_indicator(None)
+        if event.source() is not self or not event.mimeData().hasFormat(self.MIME_TYPE):
+            event.ignore()
+            return
+        event.acceptProposedAction()
+        target = self.drop_target(event.pos())
+        if target is not None:
+            self.launcher_dropped.emit(self.drag_row, *target)
+
+    def paintEvent(self, event):
+        super().paintEvent(event)
+        if self.drop_indicator is None:
+            return
+        rect, swap = self.drop_indicator
+        painter = QPainter(self.viewport())
+        painter.setRenderHint(QPainter.Antialiasing)
+        if swap:
+            painter.setPen(QPen(QColor("#ffd54f"), 2, Qt.DashLine))
+            painter.setBrush(Qt.NoBrush)
+            painter.drawRoundedRect(QRectF(rect), 5, 5)
+        else:
+            painter.fillRect(rect, QColor("#ffd54f"))
+        painter.end()
+
+
+class BuildThread(QThread):
+    """A thread to run the C code build command.
+
+    By default the whole stdout/stderr is captured and delivered once through
+    ``build_finished``.  With ``stream=True`` the command is run as a
+    quicklaunch.executor Plan: output is read line by line while it runs and
+    delivered in batches through ``output_chunk`` as ``(stream, line)``
+    tuples, every finished step is reported through ``step_finished`` and
+    ``run_finished`` carries the exit code and wall time in seconds.  Only one
+    batch is ever held in memory; with ``log_path`` every batch is also
+    appended to that quicklaunch.runlog file.  Streamed runs can be stopped
+    with ``cancel`` or by passing ``timeout``.
+    """
+
+    build_finished = pyqtSignal(str, str)  # Signal to send output to the main thread
+    output_chunk = pyqtSignal(list)  # Batch of (stream, line) tuples
+    step_finished = pyqtSignal(str, int, float)  # Step text, exit code, seconds
+    run_finished = pyqtSignal(int, float)  # Exit code, wall time in seconds
+
+    def __init__(self, command,command_type = "command", stream=False, timeout=None, kill_timeout=5.0,
+                 cache=None, cache_spec=None, sessions=None, log_path=None):
+        super().__init__()
+        self.command = command  # A shell command string or an executor Plan
+        self.command_type = command_type
+        self.stream = stream
+        self.log_path = log_path
+        self.log = None
+        plan = command if isinstance(command, Plan) else Plan.shell(command)
+        self.runner = PlanRun(plan, on_output=self.emit_output, on_step=self.emit_step,
+                              timeout=timeout, kill_timeout=kill_timeout,
+                              cache=cache, cache_spec=cache_spec, sessions=sessions)
+
+    @property
+    def cancel_requested(self):
+        return self.runner.cancel_requested
+
+    @property
+    def timed_out(self):
+        return self.runner.timed_out
+
+    def run(self):
+        if self.stream:
+            if self.log_path is not None:
+                try:
+                    self.log = RunLogWriter(self.log_path)
+                except OSError:
+                    self.log = None  # Run without a log rather than not at all
+            exit_code = -1
+            try:
+                exit_code = self.runner.run()
+            except Exception as e:  # The job must still finish, or it holds its slot for good
+                self.emit_output([("stderr", f"An unexpected error occurred: {str(e)}")])
+                if self.runner.start is not None:
+                    self.runner.wall_time = time.monotonic() - self.runner.start
+            finally:
+                if self.log is not None:
+                    self.log.close()
+                self.run_finished.emit(exit_code, self.runner.wall_time)
+            return
+        try:
+            CREATE_NO_WINDOW = getattr(subprocess, "CREATE_NO_WINDOW", 0)  # Flag to hide the console
+            result = subprocess.run(
+                str(self.command),
+                shell=True,
+                capture_output=True,
+                text=True,
+                check=True,
+                creationflags=CREATE_NO_WINDOW  # Hide console
+            )
+            self.build_finished.emit("INFO", result.stdout)
+        except subprocess.CalledProcessError as e:
+            self.build_finished.emit("ERROR", e.stderr)
+        except Exception as e:  # Catch any other potential errors
+            self.build_finished.emit("ERROR", f"An unexpected error occurred: {str(e)}")
+
+    def emit_output(self, batch):
+        if self.log is not None:
+            self.log.write(batch)
+        self.output_chunk.emit(batch)
+
+    def emit_step(self, result):
+        self.step_finished.emit(result.step.label, result.exit_code, result.seconds)
+
+    def cancel(self):
+        """Asks the running command to stop; it is killed after ``kill_timeout`` seconds."""
+        self.runner.cancel()
+
+
+class TerminalView(QPlainTextEdit):
+    """Read-only terminal pane that appends log lines in rate-limited batches.
+
+    Lines are queued by ``append_lines`` and written to the document at most
+    once per ``flush_interval`` milliseconds.  The view mirrors a
+    ``LogRingBuffer``, so only the most recent lines are ever kept.
+    """
+
+    def __init__(self, max_lines=10000, max_chars=2000000, flush_interval=50, parent=None):
+        super().__init__(parent)
+        self.setReadOnly(True)
+        self.setUndoRedoEnabled(False)
+        self.setLineWrapMode(QPlainTextEdit.NoWrap)
+        self.ring = LogRingBuffer(max_lines, max_chars)
+        self.pending = []
+        self.flush_timer = QTimer(self)
+        self.flush_timer.setSingleShot(True)
+        self.flush_timer.setInterval(flush_interval)
+        self.flush_timer.timeout.connect(self.flush)
+
+    def append_lines(self, lines):
+        """Queues lines for the next flush."""
+        self.pending.extend(lines)
+        if not self.flush_timer.isActive():
+            self.flush_timer.start()
+
+    def flush(self):
+        """Writes all queued lines to the document in a single edit."""
+        if not self.pending:
+            return
+        new_lines, self.pending = self.pending, []
+        shown_lines = len(self.ring)
+        evicted = self.ring.extend(new_lines)
+
+        scrollbar = self.verticalScrollBar()
+        at_bottom = scrollbar.value() >= scrollbar.maximum()
+        if evicted >= shown_lines:
+            # Everything on screen has been pushed out of the buffer
+            self.setPlainText(self.ring.text())
+        else:
+            cursor = QTextCursor(self.document())
+            cursor.beginEditBlock()
+            if evicted:
+                cursor.movePosition(QTextCursor.Start)
+                cursor.movePosition(QTextCursor.NextBlock, QTextCursor.KeepAnchor, evicted)
+                cursor.removeSelectedText()
+            cursor.movePosition(QTextCursor.End)
+            cursor.insertText(("\n" if shown_lines else "") + "\n".join(new_lines))
+            cursor.endEditBlock()
+        if at_bottom:
+            scrollbar.setValue(scrollbar.maximum())  # Scroll to bottom
+
+    def clear(self):
+        self.pending = []
+        self.ring.clear()
+        super().clear()
+
+
+class Job:
+    """Bookkeeping for one launcher execution handled by the JobManager."""
+
+    QUEUED = "Queued"
+    RUNNING = "Running"
+    FINISHED = "Finished"
+    FAILED = "Failed"
+    CANCELLED = "Cancelled"
+    TIMED_OUT = "Timed out"
+
+    def __init__(self, job_id, nickname, command, command_type="command", priority=0, timeout=None,
+                 cache_spec=None, warm_session=False):
+        self.job_id = job_id
+        self.nickname = nickname
+        self.command = command
+        self.command_type = command_type
+        self.priority = priority
+        self.timeout = timeout
+        self.state = Job.QUEUED
+        self.exit_code = None
+        self.submitted_at = time.monotonic()
+        self.started_at = None
+        self.finished_at = None
+        self.thread = None
+        self.steps = []  # (step text, exit code, seconds) per finished step
+        self.submitted_wall = time.time()
+        self.spawn_latency = None
+        self.output_chars = {}
+        self.cache_spec = cache_spec
+        self.cache_status = None
+        self.warm_session = warm_session  # Run in a session of JobManager.session_pool
+        self.log_path = None  # Full output, when the JobManager keeps run logs
+
+    @property
+    def is_active(self):
+        return self.state in (Job.QUEUED, Job.RUNNING)
+
+    def elapsed(self):
+        """Seconds spent waiting (queued) or running so far."""
+        if self.started_at is None:
+            return time.monotonic() - self.submitted_at
+        return (self.finished_at or time.monotonic()) - self.started_at
+
+
+class JobManager(QObject):
+    """Runs launcher commands on a bounded pool of BuildThreads.
+
+    Jobs wait in a priority queue (higher ``priority`` first, FIFO within the
+    same priority) until one of ``max_concurrency`` slots is free.  The
+    manager owns every thread until it has finished, so a running QThread is
+    never garbage-collected from under its command.
+    """
+
+    job_changed = pyqtSignal(int)  # Job ID whose state changed
+    job_output = pyqtSignal(int, list)  # Job ID, batch of (stream, line) tuples
+    job_finished = pyqtSignal(int)  # Job ID that reached a final state
+
+    HISTORY_SIZE = 50  # Finished jobs kept for the jobs panel
+
+    def __init__(self, max_concurrency=None, kill_timeout=5.0, result_cache=None, session_pool=None,
+                 run_logs=None, parent=None):
+        super().__init__(parent)
+        self.max_concurrency = max_concurrency or os.cpu_count() or 4
+        self.kill_timeout = kill_timeout
+        self.result_cache = result_cache  # Used by jobs submitted with a cache_spec
+        self.session_pool = session_pool  # Used by jobs submitted with warm_session, when available
+        self.run_logs = run_logs  # quicklaunch.runlog RunLogStore receiving every job's output
+        self.jobs = {}
+        self.queue = []
+        self.running = set()
+        self.next_id = 1
+        self.sequence = itertools.count()
+
+    def submit(self, command, nickname="", command_type="command", priority=0, timeout=None, cache_spec=None,
+               warm_session=False):
+        """Queues a command and returns its job ID."""
+        job = Job(self.next_id, nickname, command, command_type, priority, timeout, cache_spec, warm_session)
+        self.next_id += 1
+        self.jobs[job.job_id] = job
+        heapq.heappush(self.queue, (-priority, next(self.sequence), job.job_id))
+        self.job_changed.emit(job.job_id)
+        self.start_ready_jobs()
+        return job.job_id
+
+    def cancel(self, job_id):
+        """Cancels a queued job or stops a running one."""
+        job = self.jobs.get(job_id)
+        if job is None or not job.is_active:
+            return False
+        if job.state == Job.QUEUED:
+            # The stale queue entry is skipped when it reaches the front
+            self.finish_job(job, Job.CANCELLED)
+        else:
+            job.thread.cancel()
+        return True
+
+    def cancel_all(self):
+        for job_id in list(self.jobs):
+            self.cancel(job_id)
+
+    def shutdown(self, wait_ms=None):
+        """Cancels everything and waits for running threads to exit."""
+        self.cancel_all()
+        if wait_ms is None:
+            wait_ms = int((self.kill_timeout + 1) * 1000)
+        for job in list(self.jobs.values()):
+            if job.thread is not None:
+                job.thread.wait(wait_ms)
+
+    def set_max_concurrency(self, max_concurrency):
+        self.max_concurrency = max(1, max_concurrency)
+        self.start_ready_jobs()
+
+    def active_jobs(self):
+        return [job for job in self.jobs.values() if job.is_active]
+
+    def start_ready_jobs(self):
+        while self.queue and len(self.running) < self.max_concurrency:
+            _, _, job_id = heapq.heappop(self.queue)
+            job = self.jobs.get(job_id)
+            if job is None or job.state != Job.QUEUED:
+                continue
+            if self.run_logs is not None:
+                try:
+                    job.log_path = self.run_logs.new_log(job_id, job.nickname or "command")
+                except OSError:
+                    job.log_path = None
+            thread = BuildThread(job.command, command_type=job.command_type, stream=True,
+                                 timeout=job.timeout, kill_timeout=self.kill_timeout,
+                                 cache=self.result_cache, cache_spec=job.cache_spec,
+                                 sessions=self.session_pool if job.warm_session else None,
+                                 log_path=job.log_path)
+            thread.job_id = job_id
+            thread.output_chunk.connect(self.handle_output_chunk)
+            thread.step_finished.connect(self.handle_step_finished)
+            thread.run_finished.connect(self.handle_run_finished)
+            thread.finished.connect(self.handle_thread_finished)
+            job.thread = thread
+            job.state = Job.RUNNING
+            job.started_at = time.monotonic()
+            self.running.add(job_id)
+            thread.start()
+            self.job_changed.emit(job_id)
+
+    # Slots below run on the GUI thread; sender() is the job's BuildThread
+
+    @pyqtSlot(list)
+    def handle_output_chunk(self, chunk):
+        self.job_output.emit(self.sender().job_id, chunk)
+
+    @pyqtSlot(str, int, float)
+    def handle_step_finished(self, text, exit_code, seconds):
+        self.jobs[self.sender().job_id].steps.append((text, exit_code, seconds))
+
+    @pyqtSlot(int, float)
+    def handle_run_finished(self, exit_code, wall_time):
+        self.jobs[self.sender().job_id].exit_code = exit_code
+
+    @pyqtSlot()
+    def handle_thread_finished(self):
+        thread = self.sender()
+        job = self.jobs[thread.job_id]
+        job_id = job.job_id
+        self.running.discard(job_id)
+        if thread.timed_out:
+            state = Job.TIMED_OUT
+        elif thread.cancel_requested:
+            state = Job.CANCELLED
+        elif job.exit_code == 0:
+            state = Job.FINISHED
+        else:
+            state = Job.FAILED
+        job.spawn_latency = thread.runner.spawn_latency
+        job.output_chars = thread.runner.output_chars
+        job.cache_status = thread.runner.cache_status
+        job.thread = None
+        thread.deleteLater()
+        self.finish_job(job, state)
+        self.start_ready_jobs()
+
+    def finish_job(self, job, state):
+        job.state = state
+        job.finished_at = time.monotonic()
+        if job.started_at is None:
+            job.started_at = job.finished_at
+        self.job_changed.emit(job.job_id)
+        self.job_finished.emit(job.job_id)
+        self.prune_history()
+
+    def prune_history(self):
+        finished = [job_id for job_id, job in self.jobs.items() if not job.is_active]
+        for job_id in finished[:-self.HISTORY_SIZE]:
+            del self.jobs[job_id]
+
+
+class JobsPanel(QWidget):
+    """Lists running, queued and recently finished jobs of a JobManager."""
+
+    COLUMNS = ["#", "Launcher", "State", "Time", "Exit"]
+
+    def __init__(self, job_manager, parent=None):
+        super().__init__(parent)
+        self.job_manager = job_manager
+        self.items = {}
+
+        self.tree = QTreeWidget()
+        self.tree.setHeaderLabels(self.COLUMNS)
+        self.tree.setRootIsDecorated(False)
+        self.tree.setSelectionMode(QTreeWidget.ExtendedSelection)
+        self.tree.setColumnWidth(0, 40)
+        self.tree.setColumnWidth(1, 260)
+
+        self.concurrency_spin = QSpinBox()
+        self.concurrency_spin.setRange(1, 256)
+        self.concurrency_spin.setValue(job_manager.max_concurrency)
+        self.concurrency_spin.setToolTip("Maximum number of launchers running at once")
+        self.concurrency_spin.valueChanged.connect(job_manager.set_max_concurrency)
+
+        self.cancel_button = QPushButton("Cancel Selected")
+        self.cancel_button.clicked.connect(self.cancel_selected)
+        self.stats_button = QPushButton("Stats")
+        self.stats_button.setToolTip("Run times and failure rates per launcher")
+        self.logs_button = QPushButton("Logs")
+        self.logs_button.setToolTip("Full output of past runs")
+
+        controls = QHBoxLayout()
+        controls.addWidget(QLabel("Jobs"))
+        controls.addStretch()
+        controls.addWidget(QLabel("Max parallel:"))
+        controls.addWidget(self.concurrency_spin)
+        controls.addWidget(self.cancel_button)
+        controls.addWidget(self.stats_button)
+        controls.addWidget(self.logs_button)
+
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+        layout.addLayout(controls)
+        layout.addWidget(self.tree)
+
+        job_manager.job_changed.connect(self.update_job)
+        self.refresh_timer = QTimer(self)
+        self.refresh_timer.setInterval(1000)
+        self.refresh_timer.timeout.connect(self.refresh_times)
+        self.refresh_timer.start()
+
+    @pyqtSlot(int)
+    def update_job(self, job_id):
+        job = self.job_manager.jobs.get(job_id)
+        item = self.items.get(job_id)
+        if item is None:
+            item = QTreeWidgetItem([str(job_id), job.nickname or str(job.command), "", "", ""])
+            item.setData(0, Qt.UserRole, job_id)
+            self.tree.addTopLevelItem(item)
+            self.items[job_id] = item
+        item.setText(2, job.state)
+        item.setText(3, f"{job.elapsed():.1f}s")
+        item.setText(4, "" if job.exit_code is None else str(job.exit_code))
+        self.drop_pruned_items()
+
+    def refresh_times(self):
+        for job in self.job_manager.active_jobs():
+            item = self.items.get(job.job_id)
+            if item is not None:
+                item.setText(3, f"{job.elapsed():.1f}s")
+
+    def drop_pruned_items(self):
+        for job_id in [job_id for job_id in self.items if job_id not in self.job_manager.jobs]:
+            item = self.items.pop(job_id)
+            self.tree.takeTopLevelItem(self.tree.indexOfTopLevelItem(item))
+
+    def cancel_selected(self):
+        for item in self.tree.selectedItems():
+            self.job_manager.cancel(item.data(0, Qt.UserRole))
+
+    def selected_jobs(self):
+        return [self.job_manager.jobs[job_id] for job_id in
+                (item.data(0, Qt.UserRole) for item in self.tree.selectedItems())
+                if job_id in self.job_manager.jobs]
+
+
+class StatsDialog(QDialog):
+    """Run time percentiles and failure rate per launcher, from the telemetry store."""
+
+    COLUMNS = ["Launcher", "Runs", "p50", "p95", "Failed", "Last run"]
+
+    def __init__(self, stats, parent=None):
+        super().__init__(parent)
+        self.setWindowTitle("Launcher Stats")
+        self.resize(640, 360)
+        tree = QTreeWidget()
+        tree.setHeaderLabels(self.COLUMNS)
+        tree.setRootIsDecorated(False)
+        tree.setColumnWidth(0, 220)
+        for entry in sorted(stats.values(), key=lambda entry: -entry.p95):  # Slowest first
+            item = QTreeWidgetItem([entry.nickname, str(entry.runs), f"{entry.p50:.2f}s", f"{entry.p95:.2f}s",
+                                    f"{entry.failure_rate:.0%}",
+                                    time.strftime("%Y-%m-%d %H:%M", time.localtime(entry.last_run))])
+            for column in range(1, 5):
+                item.setTextAlignment(column, Qt.AlignRight | Qt.AlignVCenter)
+            tree.addTopLevelItem(item)
+
+        buttons = QDialogButtonBox(QDialogButtonBox.Close)
+        buttons.rejected.connect(self.reject)
+        layout = QVBoxLayout(self)
+        layout.addWidget(tree if stats else QLabel("No launcher runs recorded yet."))
+        layout.addWidget(buttons)
+
+
+class LogLineModel(QAbstractListModel):
+    """Lines of a quicklaunch.runlog MappedLog, read from the mapping only when shown."""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.log = None
+        self.rows = 0
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else self.rows
+
+    def data(self, index, role=Qt.DisplayRole):
+        if role != Qt.DisplayRole or not index.isValid():
+            return None
+        return self.log.line(index.row())
+
+    def set_log(self, log):
+        self.beginResetModel()
+        if self.log is not None:
+            self.log.close()
+        self.log = log
+        self.rows = len(log) if log is not None else 0
+        self.endResetModel()
+
+    def refresh(self):
+        """Shows lines appended since the last refresh (the log of a running job grows)."""
+        if self.log is None:
+            return
+        rows = self.log.refresh()
+        if rows > self.rows:
+            if self.rows:
+                # The last line may have been incomplete
+                self.dataChanged.emit(self.index(self.rows - 1), self.index(self.rows - 1))
+            self.beginInsertRows(QModelIndex(), self.rows, rows - 1)
+            self.rows = rows
+            self.endInsertRows()
+
+
+class LogViewerDialog(QDialog):
+    """Past runs' logs, paged from disk through mmap, with jump-to-line and regex search.
+
+    Search walks the mapping ``SEARCH_LINES_PER_STEP`` lines per event loop
+    pass, so even a log of several gigabytes never blocks the window.  A
+    lower-case pattern matches case-insensitively.
+    """
+
+    COLUMNS = ["Launcher", "Job", "Started", "Size"]
+    SEARCH_LINES_PER_STEP = 200000
+    FOLLOW_INTERVAL = 1000  # Milliseconds between checks for new lines
+
+    def __init__(self, run_logs, path=None, parent=None):
+        super().__init__(parent)
+        self.setWindowTitle("Run Logs")
+        self.resize(1000, 600)
+        self.run_logs = run_logs
+
+        self.runs_tree = QTreeWidget()
+        self.runs_tree.setHeaderLabels(self.COLUMNS)
+        self.runs_tree.setRootIsDecorated(False)
+        self.runs_tree.setColumnWidth(0, 160)
+        self.runs_tree.setMaximumWidth(380)
+        self.runs_tree.currentItemChanged.connect(self.open_selected)
+
+        self.model = LogLineModel(self)
+        self.view = QListView()
+        self.view.setUniformItemSizes(True)  # Lets the view lay out millions of rows without asking for them
+        self.view.setFont(QFont("Consolas" if os.name == "nt" else "Monospace", 9))
+        self.view.setModel(self.model)
+
+        self.line_spin = QSpinBox()
+        self.line_spin.setRange(1, 1)
+        self.line_spin.setMinimumWidth(100)
+        go_button = QPushButton("Go")
+        go_button.clicked.connect(lambda: self.jump_to_line(self.line_spin.value() - 1))
+        self.search_edit = QLineEdit()
+        self.search_edit.setPlaceholderText("Regular expression (lower case: ignore case)")
+        self.search_edit.returnPressed.connect(self.find_next)
+        find_button = QPushButton("Find Next")
+        find_button.clicked.connect(self.find_next)
+        self.status_label = QLabel()
+
+        controls = QHBoxLayout()
+        controls.addWidget(QLabel("Line:"))
+        controls.addWidget(self.line_spin)
+        controls.addWidget(go_button)
+        controls.addWidget(self.search_edit, 1)
+        controls.addWidget(find_button)
+        right = QVBoxLayout()
+        right.addLayout(controls)
+        right.addWidget(self.view, 1)
+        right.addWidget(self.status_label)
+        layout = QHBoxLayout(self)
+        layout.addWidget(self.runs_tree)
+        layout.addLayout(right, 1)
+
+        self.search = None  # (pattern, next line, line to stop at, where to stop after wrapping)
+        self.search_timer = QTimer(self)
+        self.search_timer.setSingleShot(True)
+        self.search_timer.timeout.connect(self.search_step)
+        self.follow_timer = QTimer(self)
+        self.follow_timer.setInterval(self.FOLLOW_INTERVAL)
+        self.follow_timer.timeout.connect(self.follow)
+        self.follow_timer.start()
+
+        for run in run_logs.runs():
+            item = QTreeWidgetItem([run.nickname, str(run.job_id),
+                                    time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(run.started)),
+                                    f"{run.size / 1024:.0f} KB"])
+            item.setData(0, Qt.UserRole, run.path)
+            self.runs_tree.addTopLevelItem(item)
+            if run.path == path or (path is None and self.runs_tree.topLevelItemCount() == 1):
+                self.runs_tree.setCurrentItem(item)
+
+    def open_selected(self, item):
+        self.search_timer.stop()
+        self.search = None
+        try:
+            log = MappedLog(item.data(0, Qt.UserRole)) if item is not None else None
+        except (OSError, ValueError) as e:
+            log = None
+            self.status_label.setText(f"Could not open log: {e}")
+        self.model.set_log(log)
+        self.update_line_count()
+
+    def update_line_count(self):
+        rows = self.model.rowCount()
+        self.line_spin.setRange(1, max(1, rows))
+        if self.search is None:
+            self.status_label.setText(f"{rows} lines")
+
+    def follow(self):
+        rows = self.model.rowCount()
+        try:
+            self.model.refresh()
+        except (OSError, ValueError):
+            return
+        if self.model.rowCount() != rows:
+            self.update_line_count()
+
+    def jump_to_line(self, row):
+        if not 0 <= row < self.model.rowCount():
+            return
+        index = self.model.index(row)
+        self.view.setCurrentIndex(index)
+        self.view.scrollTo(index, QListView.PositionAtCenter)
+
+    def find_next(self):
+        text = self.search_edit.text()
+        if self.model.log is None or not text:
+            return
+        try:
+            pattern = re.compile(text.encode("utf-8"), re.MULTILINE | (re.IGNORECASE if text.islower() else 0))
+        except re.error as e:
+            self.status_label.setText(f"Invalid pattern: {e}")
+            return
+        start = self.view.currentIndex().row() + 1
+        self.search = (pattern, start, self.model.rowCount(), start)
+        self.search_step()
+
+    def search_step(self):
+        pattern, line, stop, wrap_stop = self.search
+        end = min(line + self.SEARCH_LINES_PER_STEP, stop)
+        found = self.model.log.search(pattern, line, end)
+        if found is not None:
+            self.search = None
+            self.jump_to_line(found)
+            self.status_label.setText(f"Match on line {found + 1}")
+            return
+        if end < stop:
+            self.search = (pattern, end, stop, wrap_stop)
+        elif wrap_stop:
+            self.search = (pattern, 0, wrap_stop, 0)  # Continue from the top up to where we started
+        else:
+            self.search = None
+            self.status_label.setText("No match")
+            return
+        self.status_label.setText(f"Searching ... line {self.search[1] + 1}")
+        self.search_timer.start()
+
+    def done(self, result):
+        self.search_timer.stop()
+        self.follow_timer.stop()
+        self.model.set_log(None)  # Unmap before the file may be pruned
+        super().done(result)
+
+
+class InstanceServer(QObject):
+    """Receives requests from the command line over localhost (see quicklaunch/instance.py)."""
+
+    def __init__(self, handler, parent=None):
+        super().__init__(parent)
+        self.handler = handler
+        self.token = secrets.token_hex(16)
+        self.server = QTcpServer(self)
+        self.server.newConnection.connect(self.accept_connections)
+        if self.server.listen(QHostAddress.LocalHost, 0):
+            try:
+                instance.publish(self.server.serverPort(), self.token)
+            except OSError:
+                self.server.close()
+
+    def accept_connections(self):
+        while self.server.hasPendingConnections():
+            connection = self.server.nextPendingConnection()
+            connection.readyRead.connect(lambda connection=connection: self.read_request(connection))
+            connection.disconnected.connect(connection.deleteLater)
+
+    def read_request(self, connection):
+        if not connection.canReadLine():
+            return
+        try:
+            request = json.loads(bytes(connection.readLine()).decode("utf-8"))
+        except ValueError:
+            request = {}
+        if not isinstance(request, dict) or request.get("token") != self.token:
+            reply = {"ok": False, "error": "Invalid request."}
+        else:
+            reply = dict(self.handler(request), token=self.token)  # Proves the reply comes from this window
+        connection.write(json.dumps(reply).encode("utf-8") + b"\n")
+        connection.disconnectFromHost()
+
+    def close(self):
+        if self.server.isListening():
+            instance.unpublish(self.token)
+            self.server.close()
+
+
+class MainWindow(QMainWindow):
+    path_checked = pyqtSignal(str, str)  # Path, pathhealth status; emitted from worker threads
+    import_scanned = pyqtSignal(list)  # importer.ImportedItems of a drop; emitted from a worker thread
+    import_failed = pyqtSignal(str)  # Error message of a drop that could not be scanned; from a worker thread
+    config_read = pyqtSignal(int, object)  # Reload generation, store.read() result or error; from a worker thread
+
+    LOG_MAX_LINES = 10000  # Terminal keeps only this many recent lines
+    LOG_MAX_CHARS = 2000000  # ... and at most this many characters
+    LOG_FLUSH_INTERVAL = 50  # Milliseconds between terminal updates
+    MAX_CONCURRENT_JOBS = os.cpu_count() or 4  # Launchers allowed to run at once
+    SEARCH_LIMIT = 200  # Matches shown while searching
+    INDEX_SLICE = 0.008  # Seconds of search indexing per idle event-loop turn
+    SAVE_DEBOUNCE = 500  # Milliseconds of quiet before changes are written
+    PATH_CHECK_TTL = 60.0  # Seconds a path check result stays fresh
+    PATH_CHECK_TIMEOUT = 3.0  # Seconds before a path check is reported as not responding
+    PATH_CHECK_WORKERS = 4  # Threads used for path checks
+    IMPORT_WORKERS = 8  # Threads used to inspect dropped files and folders
+    SESSION_POOL_SIZE = 2  # Warm shell sessions kept idle for launchers that use them
+    SESSION_MAX_COMMANDS = 100  # Commands after which a session is replaced
+    RELOAD_DEBOUNCE = 300  # Milliseconds of quiet after an outside change before the file is re-read
+
+    def __init__(self):
+        super().__init__()
+        self.setWindowTitle("Quick Launch")
+        self.setGeometry(580, 270, 900, 600)  # Increased height to accommodate the terminal
+        self.setWindowIcon(QIcon(".\\cmd_icon.ico"))
+
+        self.central_widget = QWidget()
+        self.central_widget.setAutoFillBackground(False)
+        palette = self.central_widget.palette()
+        #palette.setColor(QPalette.Background, QColor("#ffffff"))
+        #self.central_widget.setStyleSheet('background-color: #000000;')
+        self.central_widget.setPalette(palette)
+        self.setCentralWidget(self.central_widget)
+
+        self.layout = QVBoxLayout(self.central_widget)
+        self.path_health = PathHealthCache(self.PATH_CHECK_TTL, self.PATH_CHECK_TIMEOUT,
+                                           self.PATH_CHECK_WORKERS, on_result=self.path_checked.emit)
+        self.path_checked.connect(self.handle_path_checked)
+        self.import_scanned.connect(self.add_launchers)
+        self.import_failed.connect(lambda message: self.log_message(f"Import failed: {message}", "ERROR"))
+        self.path_refresh_timer = QTimer(self)  # Coalesces repaints when many results arrive
+        self.path_refresh_timer.setSingleShot(True)
+        self.path_refresh_timer.setInterval(100)
+        self.path_refresh_timer.timeout.connect(self.refresh_path_states)
+        self.path_check_timer = QTimer(self)
+        self.path_check_timer.setInterval(int(self.PATH_CHECK_TTL * 1000))
+        self.path_check_timer.timeout.connect(self.check_launcher_paths)
+        self.path_check_timer.start()
+
+        self.icon_service = IconService(self)
+        self.icon_service.icons_changed.connect(self.refresh_path_states)
+        self.launcher_model = LauncherListModel(self, status_lookup=self.path_health.status,
+                                                icon_lookup=self.icon_service.icon)
+        self.search_model = LauncherListModel(self, status_lookup=self.path_health.status,
+                                              icon_lookup=self.icon_service.icon)  # Ranked matches while searching
+        self.search_index = LauncherIndex()  # Filled in idle slices, see build_search_index
+        self.index_pending = deque()  # Nicknames not yet indexed
+        self.index_timer = QTimer(self)
+        self.index_timer.setInterval(0)
+        self.index_timer.timeout.connect(self.index_some_launchers)
+        self.launcher_view = LauncherGridView(columns=2)
+        self.launcher_view.setModel(self.launcher_model)
+        self.launcher_view.launcher_delegate.action_triggered.connect(self.handle_launcher_action)
+        self.launcher_view.launcher_dropped.connect(self.handle_launcher_drop)
+        self.launchers_data = LauncherCollection({"Button 1": "", "Button 2": "",
+                                                  "Button 3": "", "Button 4": "",
+                                                  "Button 5": "", "Button 6": "",
+                                                  "Button 7": "", "Button 8": ""})
+
+        self.save_timer = QTimer(self)
+        self.save_timer.setSingleShot(True)
+        self.save_timer.setInterval(self.SAVE_DEBOUNCE)
+        self.save_timer.timeout.connect(self.flush_launchers)
+
+        self.load_launchers()
+        self.create_launcher_grid()
+        self.check_launcher_paths()
+
+        self.config_signature = self.store.signature()  # What the launcher file looked like when last read or written
+        self.reload_generation = 0
+        self.reload_timer = QTimer(self)
+        self.reload_timer.setSingleShot(True)
+        self.reload_timer.setInterval(self.RELOAD_DEBOUNCE)
+        self.reload_timer.timeout.connect(self.check_config_changed)
+        self.config_read.connect(self.apply_config)
+        # The directory is watched too: atomic replaces drop the file's own watch
+        self.config_watcher = QFileSystemWatcher(self)
+        self.config_watcher.addPath(os.path.dirname(os.path.abspath(self.store.path)))
+        if os.path.exists(self.store.path):
+            self.config_watcher.addPath(self.store.path)
+        self.config_watcher.fileChanged.connect(self.reload_timer.start)
+        self.config_watcher.directoryChanged.connect(self.reload_timer.start)
+
+        self.search_edit = QLineEdit()
+        self.search_edit.setObjectName("searchEdit")
+        self.search_edit.setPlaceholderText("Search launchers (Enter runs the top hit)")
+        self.search_edit.setClearButtonEnabled(True)
+        self.search_edit.textChanged.connect(self.update_search)
+        self.search_edit.returnPressed.connect(self.run_top_search_hit)
+
+        self.add_button = QPushButton("+ Add New Launcher")
+        self.add_button.clicked.connect(self.add_new_launcher)
+        self.add_button.setObjectName("addButton")
+
+        self.info_button = QPushButton("About")  # New button for extra info
+        self.info_button.setFixedSize(60, 17)
+        self.info_button.clicked.connect(self.show_extra_info)
+        self.info_button.setStyleSheet("""
+            QPushButton {
+                background: transparent;
+                border: none; /* Removes the border */
+                color: #000000; /* Text color */
+                font-weight: bold;
+            }
+            QPushButton:hover {
+                color: #ffffff;
+            }
+        """)
+
+        self.layout.addWidget(self.search_edit)
+        self.layout.addWidget(self.launcher_view, 1)
+        self.layout.addWidget(self.add_button)
+        #self.layout.addWidget(self.info_button)
+
+        self.session_pool = SessionPool(self.SESSION_POOL_SIZE, self.SESSION_MAX_COMMANDS) \
+            if sessions.supported() else None
+        if self.session_pool is not None and any(options.get("session")
+                                                 for options in self.launcher_options.values()):
+            self.session_pool.prewarm()
+        self.run_logs = RunLogStore()
+        self.job_manager = JobManager(self.MAX_CONCURRENT_JOBS, result_cache=ResultCache(),
+                                      session_pool=self.session_pool, run_logs=self.run_logs, parent=self)
+        self.job_manager.job_output.connect(self.handle_job_output)
+        self.job_manager.job_finished.connect(self.handle_job_finished)
+        self.jobs_panel = JobsPanel(self.job_manager)
+        self.jobs_panel.stats_button.clicked.connect(self.show_stats)
+        self.jobs_panel.logs_button.clicked.connect(self.show_logs)
+        self.telemetry = TelemetryStore()
+        self.jobs_panel.setMaximumHeight(160)
+        self.layout.addWidget(self.jobs_panel)
+
+        self.terminal = TerminalView(self.LOG_MAX_LINES, self.LOG_MAX_CHARS, self.LOG_FLUSH_INTERVAL)
+        self.layout.addWidget(self.terminal, 1)  # Add it to the main layout
+        self.trigger_scheduler = TriggerScheduler(self)
+        self.trigger_scheduler.triggered.connect(self.run_trigger)
+        self.trigger_scheduler.warning.connect(
+            lambda nickname, message: self.log_message(f"{nickname}: {message}", "WARNING"))
+        self.trigger_pending = set()  # Nicknames to run again once their current job ends
+        self.sync_triggers()
+        
+        info_layout = QHBoxLayout()
+        info_layout.addWidget(self.info_button)
+        info_layout.setAlignment(Qt.AlignCenter) 
+        self.layout.addLayout(info_layout)
+
+
+        self.apply_stylesheet()
+        self.setAcceptDrops(True)
+
+        self.instance_server = InstanceServer(self.handle_instance_request, self)
+
+    def closeEvent(self, event):
+        self.instance_server.close()
+        self.flush_launchers()
+        self.store.close()
+        self.job_manager.shutdown()
+        if self.session_pool is not None:
+            self.session_pool.close()
+        self.telemetry.close()
+        self.icon_service.shutdown()
+        self.path_health.shutdown()
+        super().closeEvent(event)
+
+    def apply_stylesheet(self):
+        stylesheet = """
+            QWidget {
+                background: #10507f;
+                color: #ffffff;
+                font-family: "Segoe UI", sans-serif;
+                font-size: 11pt;
+            }
+            QPushButton#info_button {
+                background: transparent;
+                color: #000000;
+                font-weight: bold;
+            }
+            QPushButton#addButton {
+                background: #ffccbc;
+                color: #333;
+                font-weight: bold;
+            }
+            QPushButton#addButton:hover {
+                background: #ffb380;
+            }
+            QListView {
+                border: none;
+            }
+            QLineEdit#searchEdit {
+                background: white;
+                border: 1px solid #ccc;
+                border-radius: 3px;
+                padding: 5px;
+                color: #333;
+            }
+            QTextEdit, QPlainTextEdit {
+            background: #000000; /* White background for terminal */
+            color: #ffffff; /* Dark gray text */
+            border: 2px solid #cccccc; /* Light gray border */
+        }
+        """
+        self.setStyleSheet(stylesheet)
+
+    def load_launchers(self):
+        self.store = open_store()
+        saved_launchers = self.store.load()
+        if saved_launchers is not None:
+            self.launchers_data = LauncherCollection(saved_launchers)
+        else:
+            self.store.record("reset")  # Use default initial data, written on the first save
+        self.launcher_options = self.store.get_section("options") or {}  # nickname -> options
+
+    def save_launchers(self):
+        """Schedules a save; bursts of changes are written once after SAVE_DEBOUNCE ms."""
+        self.save_timer.start()
+
+    def flush_launchers(self):
+        """Writes the changes recorded since the last save."""
+        self.save_timer.stop()
+        try:
+            self.store.flush(self.launchers_data)
+        except (OSError, sqlite3.Error) as e:
+            self.log_message(f"Could not save launchers: {e}", "ERROR")
+        self.config_signature = self.store.signature()  # Our own write is not an outside change
+
+    def check_config_changed(self):
+        """Re-reads the launcher file off the GUI thread if another program changed it."""
+        if os.path.exists(self.store.path) and self.store.path not in self.config_watcher.files():
+            self.config_watcher.addPath(self.store.path)
+        signature = self.store.signature()
+        if signature is None or signature == self.config_signature:
+            return
+        self.config_signature = signature
+        self.reload_generation += 1
+        generation = self.reload_generation
+
+        def read():
+            try:
+                result = self.store.read()
+            except (OSError, ValueError, sqlite3.Error) as e:
+                result = e
+            self.config_read.emit(generation, result)
+
+        threading.Thread(target=read, name="config-reload", daemon=True).start()
+
+    @pyqtSlot(int, object)
+    def apply_config(self, generation, result):
+        """Brings the grid in line with a re-read launcher file, touching only rows that changed."""
+        if generation != self.reload_generation:
+            return  # A newer read is on its way
+        if isinstance(result, Exception):
+            self.log_message(f"Could not reload launchers: {result}", "WARNING")
+            return
+        if result is None or result[0] is None:
+            return
+        launchers, sections = result
+        if self.save_timer.isActive():
+            self.save_timer.stop()
+            self.log_message("Launchers were changed by another program; unsaved edits were dropped", "WARNING")
+        self.store.reloaded(sections)
+        self.launcher_options = sections.get("options") or {}
+
+        removed, added, updated = diff_launchers(self.launchers_data, launchers)
+        index = self.search_index
+        for nickname in removed:
+            self.launcher_model.remove_row(self.launchers_data.index(nickname))
+            del self.launchers_data[nickname]
+            index.remove(nickname)
+        for nickname, path in updated:
+            self.launchers_data[nickname] = path
+            self.launcher_model.set_launcher(self.launchers_data.index(nickname), nickname, path)
+            index.update(nickname, nickname, path)
+        for nickname, path in added:
+            self.launchers_data[nickname] = path
+            index.add(nickname, path)
+        self.launcher_model.append_launchers(added)
+        moved = self.launchers_data.reorder(list(launchers), self.launcher_model.move_row)
+
+        self.sync_triggers()
+        if removed or added or updated or moved:
+            self.path_health.check_all(path for _, path in added + updated if path and ";" not in path)
+            self.refresh_search()
+            self.log_message(f"Reloaded launchers: {len(added)} added, {len(removed)} removed, "
+                             f"{len(updated)} changed, {moved} moved", "INFO")
+
+    def create_launcher_grid(self):
+        """Shows the launchers in the grid view, in the order of self.launchers_data."""
+        self.launcher_model.set_launchers(self.launchers_data)
+        self.build_search_index()
+
+    def build_search_index(self):
+        """Re-indexes every launcher for search, a slice per idle turn of the event loop.
+
+        Edits made meanwhile go straight to the index, searches see the
+        launchers indexed so far and are re-run once the build completes.
+        """
+        self.search_index.clear()
+        self.index_pending = deque(self.launchers_data)
+        self.index_timer.start()
+
+    def index_some_launchers(self):
+        if self.search_index.add_pending(self.index_pending, self.launchers_data, self.INDEX_SLICE):
+            self.index_timer.stop()
+            self.refresh_search()
+
+    def check_launcher_paths(self):
+        """Re-checks every plain launcher path whose cached result is stale."""
+        self.path_health.check_all(path for path in self.launchers_data.values()
+                                   if path and ";" not in path)
+
+    @pyqtSlot(str, str)
+    def handle_path_checked(self, path, status):
+        if not self.path_refresh_timer.isActive():
+            self.path_refresh_timer.start()
+
+    def refresh_path_states(self):
+        self.launcher_model.refresh_all()
+        self.search_model.refresh_all()
+
+    @pyqtSlot(str)
+    def update_search(self, query):
+        """Shows the launchers matching ``query``, or all of them when it is empty."""
+        if not query.strip():
+            self.launcher_view.setModel(self.launcher_model)
+            self.launcher_view.reorderable = True
+            return
+        self.search_model.set_launchers(dict(self.search_index.search(query, self.SEARCH_LIMIT)))
+        self.launcher_view.setModel(self.search_model)
+        self.launcher_view.reorderable = False  # Search results are ranked, not ordered
+
+    def refresh_search(self):
+        """Re-runs the current search after launchers changed."""
+        if self.launcher_view.model() is self.search_model:
+            self.update_search(self.search_edit.text())
+
+    def run_top_search_hit(self):
+        if self.launcher_view.model() is self.search_model and self.search_model.rowCount():
+            nickname, path = self.search_model.launcher(0)
+            self.open_path_in_explorer(path, nickname)
+
+    @pyqtSlot(str, int)
+    def handle_launcher_action(self, action, row):
+        """Dispatches a click on one of the buttons painted for a launcher row."""
+        nickname, path = self.launcher_view.model().launcher(row)
+        if action == "open":
+            self.open_path_in_explorer(path, nickname)
+        elif action == "copy":
+            self.copy_to_clipboard(path)
+        elif action == "edit":
+            self.edit_launcher(nickname, path)
+        elif action == "delete":
+            self.delete_launcher(nickname)
+
+    def empty_nickname(self):
+        """Returns an unused "Empty Path" nickname for a cleared launcher."""
+        nickname = "Empty Path"
+        counter = 2
+        while nickname in self.launchers_data:
+            nickname = f"Empty Path {counter}"
+            counter += 1
+        return nickname
+
+    def rename_launcher(self, nickname, new_nickname, new_path):
+        """Replaces a launcher in place, keeping its position in the grid."""
+        index_to_update = self.launchers_data.index(nickname)
+        self.launchers_data.rename(nickname, new_nickname, new_path)
+        if new_nickname != nickname:
+            self.store.record("rename", nickname, new_nickname)
+        self.store.record("put", new_nickname, new_path)
+        options = self.launcher_options.pop(nickname, None)
+        if options is not None:
+            if new_path:
+                self.launcher_options[new_nickname] = options  # Options follow a rename, not a delete
+            self.store.set_section("options", self.launcher_options)
+            self.sync_triggers()
+        self.launcher_model.set_launcher(index_to_update, new_nickname, new_path)
+        self.search_index.update(nickname, new_nickname, new_path)
+        self.refresh_search()
+
+    def set_launcher_options(self, nickname, options):
+        if options == self.launcher_options.get(nickname, {}):
+            return
+        if options:
+            self.launcher_options[nickname] = options
+            if options.get("session") and self.session_pool is not None:
+                self.session_pool.prewarm()
+        else:
+            self.launcher_options.pop(nickname, None)
+        self.store.set_section("options", self.launcher_options)
+        self.sync_triggers()
+
+    def sync_triggers(self):
+        """Hands the trigger options of all launchers to the scheduler."""
+        triggers = {nickname: options["trigger"] for nickname, options in self.launcher_options.items()
+                    if options.get("trigger") and nickname in self.launchers_data}
+        for nickname, error in self.trigger_scheduler.set_triggers(triggers).items():
+            self.log_message(f"{nickname}: trigger ignored: {error}", "WARNING")
+
+    @pyqtSlot(str, str)
+    def run_trigger(self, nickname, reason):
+        """Runs a launcher for a trigger, applying its overlap policy when it is still running."""
+        path = self.launchers_data.get(nickname)
+        if not path or not is_command(path):
+            self.log_message(f"{nickname}: {reason} ignored, triggers only run command launchers", "WARNING")
+            return
+        active = [job for job in self.job_manager.active_jobs() if job.nickname == nickname]
+        if active:
+            policy = self.trigger_scheduler.overlap(nickname)
+            if policy == "skip":
+                self.log_message(f"{nickname}: {reason} skipped, still running", "INFO")
+                return
+            self.trigger_pending.add(nickname)  # Started by handle_job_finished
+            if policy == "cancel":
+                for job in active:
+                    self.job_manager.cancel(job.job_id)
+            return
+        self.log_message(f"{nickname}: started by {reason}", "INFO")
+        self.open_path_in_explorer(path, nickname)
+
+    def swap_launchers(self, nickname1, nickname2):
+        """Swaps the positions of two launchers and saves the order."""
+        self.launchers_data.swap(nickname1, nickname2)
+        for nickname in (nickname1, nickname2):
+            self.launcher_model.set_launcher(self.launchers_data.index(nickname), nickname,
+                                             self.launchers_data[nickname])
+        self.store.record("swap", nickname1, nickname2)
+        self.save_launchers()
+
+    def move_launcher(self, nickname, row):
+        """Moves a launcher to ``row``, shifting the ones in between, and saves the order."""
+        old_row = self.launchers_data.index(nickname)
+        self.launchers_data.move(nickname, row)
+        row = self.launchers_data.index(nickname)
+        if row == old_row:
+            return
+        self.launcher_model.move_row(old_row, row)
+        self.store.record("move", nickname)
+        self.save_launchers()
+
+    @pyqtSlot(int, int, bool)
+    def handle_launcher_drop(self, row, target_row, swap):
+        """Applies a drag and drop inside the launcher grid."""
+        if self.launcher_view.model() is not self.launcher_model:
+            return
+        nickname = self.launchers_data.at(row)[0]
+        if swap:
+            self.swap_launchers(nickname, self.launchers_data.at(target_row)[0])
+        else:
+            self.move_launcher(nickname, target_row)
+
+    @pyqtSlot(str, str)
+    def handle_build_finished(self, message_type, message):
+        """Handles the signal from the build thread and updates the terminal."""
+        self.log_message(message, message_type)
+
+    @pyqtSlot(int, list)
+    def handle_job_output(self, job_id, chunk):
+        """Writes a batch of streamed (stream, line) tuples to the terminal."""
+        label = self.job_label(job_id)
+        lines = []
+        current_stream = None
+        for stream_name, line in chunk:
+            if stream_name != current_stream and lines:
+                self.log_message("\n".join(lines), f"{label} {current_stream.upper()}")
+                lines = []
+            current_stream = stream_name
+            lines.append(line)
+        if lines:
+            self.log_message("\n".join(lines), f"{label} {current_stream.upper()}")
+
+    @pyqtSlot(int)
+    def handle_job_finished(self, job_id):
+        """Reports the final state, exit code and wall time of a job."""
+        job = self.job_manager.jobs[job_id]
+        message_type = "INFO" if job.state == Job.FINISHED else "ERROR"
+        if job.exit_code is None:
+            self.log_message(f"{self.job_label(job_id)} {job.state}", message_type)
+        else:
+            self.log_message(f"{self.job_label(job_id)} {job.state} with exit code {job.exit_code} "
+                             f"in {job.elapsed():.2f}s", message_type)
+        if len(job.steps) > 1:
+            self.log_message("\n".join(f"  {seconds:8.2f}s  exit {exit_code:<4} {text}"
+                                        for text, exit_code, seconds in job.steps),
+                             f"{self.job_label(job_id)} STEPS")
+        if job.log_path and sum(job.output_chars.values()) > self.LOG_MAX_CHARS // 2:
+            self.log_message(f"{self.job_label(job_id)} Full output: {job.log_path} (Logs button)", "INFO")
+        if job.cache_status == "hit":
+            self.log_message(f"{self.job_label(job_id)} Cache hit: replayed the last successful run", "INFO")
+        elif job.cache_status == "miss" and job.state == Job.FINISHED:
+            self.log_message(f"{self.job_label(job_id)} Cache miss: result stored for next time", "INFO")
+        if job.exit_code is not None:
+            self.telemetry.record(RunRecord(
+                job.nickname, "cached" if job.cache_status == "hit" else "chain", started=job.submitted_wall, queue_wait=job.started_at - job.submitted_at,
+                spawn_latency=job.spawn_latency, wall_time=job.elapsed(), exit_code=job.exit_code,
+                state=job.state, stdout_chars=job.output_chars.get("stdout", 0),
+                stderr_chars=job.output_chars.get("stderr", 0), steps=job.steps))
+        if job.nickname in self.trigger_pending and not any(
+                other.nickname == job.nickname for other in self.job_manager.active_jobs()):
+            self.trigger_pending.discard(job.nickname)
+            self.run_trigger(job.nickname, "queued trigger")
+
+    def show_stats(self):
+        self.telemetry.flush()
+        StatsDialog(self.telemetry.stats(), self).exec_()
+
+    def show_logs(self):
+        """Opens the run log viewer on the selected job, or on the newest run."""
+        selected = [job.log_path for job in self.jobs_panel.selected_jobs() if job.log_path]
+        LogViewerDialog(self.run_logs, selected[0] if selected else None, self).exec_()
+
+    def job_label(self, job_id):
+        job = self.job_manager.jobs[job_id]
+        return f"#{job_id} {job.nickname}" if job.nickname else f"#{job_id}"
+
+    def open_path_in_explorer(self, path, nickname=""):
+        if not is_command(path):
+            if path:
+                try:
+                    # Answer from the cache: a stat on a dead network mount would freeze the window
+                    status = self.path_health.status(path)
+                    if status != pathhealth.MISSING:
+                        if status == pathhealth.TIMEOUT:
+                            self.show_info_message("WARNING", "Path is not responding, opening anyway.\n" + path)
+                        start = time.monotonic()
+                        get_backend().open_path(path)
+                        self.telemetry.record(RunRecord(nickname, "open", spawn_latency=time.monotonic() - start))
+                    else:
+                        self.show_error_message("Could not open path: ", "Directory Not Found" )
+                        self.show_info_message("ERROR", "Check Path.\n" + path)
+                except FileNotFoundError:
+                    self.show_error_message("Path not found:", path)
+                except Exception as e:
+                    self.show_error_message("Could not open path:", str(e))
+            else:
+                self.show_info_message("Info", "Path is not set for this launcher.")
+        else:
+            # Shell-free segments are executed directly, the rest by cmd.exe or /bin/sh
+            try:
+                plan = parse_plan(path)
+            except ValueError as e:
+                self.show_info_message("ERROR", f"{nickname}: {str(e)}")
+                return
+
+            if ".exe" in path:
+                command_type = "exe"
+            else:
+                command_type = "command"
+            options = self.launcher_options.get(nickname, {})
+            job_id = self.job_manager.submit(plan, nickname, command_type=command_type,
+                                             cache_spec=options.get("cache"), warm_session=options.get("session", False))
+            self.show_info_message("INFO", f"{self.job_label(job_id)} Executing ...")  # Show initial message
+            #self.show_info_message("Info", "Done Execution!")
+            
+
+    def handle_instance_request(self, request):
+        """Answers a request forwarded from the command line."""
+        if request.get("command") == "show":
+            self.showNormal()
+            self.raise_()
+            self.activateWindow()
+            return {"ok": True}
+        if request.get("command") == "run":
+            nickname = request.get("nickname")
+            if nickname not in self.launchers_data:
+                return {"ok": False, "error": f"No launcher named '{nickname}'."}
+            self.open_path_in_explorer(self.launchers_data[nickname], nickname)
+            return {"ok": True}
+        return {"ok": False, "error": "Unknown request."}
+
+    def copy_to_clipboard(self, path):
+        if path:
+            clipboard = QApplication.clipboard()
+            clipboard.setText(path)
+            if ";" in path:
+                self.show_info_message("Copied", "Command copied to clipboard!\n" + path)
+            else:
+                self.show_info_message("Copied", "Path copied to clipboard!\n" + path)
+        else:
+            self.show_info_message("Info", "Path is not set for this launcher.")
+
+    def edit_launcher(self, nickname, current_path):
+        dialog = EditDialog(self, nickname, current_path, self.launcher_options.get(nickname))
+        if dialog.exec_() == QDialog.Accepted:
+            new_nickname, new_path = dialog.get_values()
+
+            if new_nickname != nickname and new_nickname in self.launchers_data:
+                # Nickname already exists, rename the existing one to "Empty Path"
+                self.rename_launcher(new_nickname, self.empty_nickname(), "")
+
+            # Update the current launcher
+            self.rename_launcher(nickname, new_nickname, new_path)
+            self.set_launcher_options(new_nickname, dialog.get_options())
+            self.save_launchers()
+
+
+    def delete_launcher(self, nickname_to_delete):
+        if nickname_to_delete in self.launchers_data:
+            self.rename_launcher(nickname_to_delete, self.empty_nickname(), "")
+            self.save_launchers()
+
+    def add_new_launcher(self):
+        dialog = EditDialog(self)
+        if dialog.exec_() == QDialog.Accepted:
+            new_nickname, new_path = dialog.get_values()
+            if new_nickname:
+                if new_nickname in self.launchers_data:
+                    # Nickname already exists, rename the existing one to "Empty Path"
+                    self.rename_launcher(new_nickname, self.empty_nickname(), "")
+                self.launchers_data[new_nickname] = new_path
+                self.store.record("put", new_nickname, new_path)
+                self.set_launcher_options(new_nickname, dialog.get_options())
+                self.launcher_model.append_launcher(new_nickname, new_path)
+                self.search_index.add(new_nickname, new_path)
+                self.refresh_search()
+                self.save_launchers()
+
+    def dragEnterEvent(self, event):
+        if any(url.isLocalFile() for url in event.mimeData().urls()):
+            event.acceptProposedAction()
+        else:
+            event.ignore()
+
+    def dragMoveEvent(self, event):
+        self.dragEnterEvent(event)
+
+    def dropEvent(self, event):
+        paths = [url.toLocalFile() for url in event.mimeData().urls() if url.isLocalFile()]
+        if not paths:
+            event.ignore()
+            return
+        event.acceptProposedAction()
+        self.import_paths(paths)
+
+    def import_paths(self, paths):
+        """Inspects dropped files and folders off the GUI thread, then adds them with add_launchers."""
+        self.log_message(f"Importing {len(paths)} dropped item(s) ...", "INFO")
+        threading.Thread(target=self.scan_dropped, args=(paths,), name="import-scan", daemon=True).start()
+
+    def scan_dropped(self, paths):
+        """Runs on the import thread; always reports back, so an import never hangs."""
+        try:
+            items = importer.scan_paths(paths, self.IMPORT_WORKERS)
+        except Exception as e:
+            self.import_failed.emit(str(e))
+            return
+        self.import_scanned.emit(items)
+
+    @pyqtSlot(list)
+    def add_launchers(self, items):
+        """Adds scanned items as launchers with one grid insertion and one save.
+
+        Items that no longer exist or whose path already has a launcher are
+        skipped; clashing nicknames get a " (2)" style suffix.
+        """
+        known_paths = {os.path.normcase(path) for path in self.launchers_data.values() if path}
+        added = []
+        skipped = 0
+        for item in items:
+            key = os.path.normcase(item.path)
+            if item.kind == importer.MISSING or key in known_paths:
+                skipped += 1
+                continue
+            known_paths.add(key)
+            nickname = importer.unique_nickname(item.nickname, self.launchers_data)
+            self.launchers_data[nickname] = item.path
+            self.store.record("put", nickname, item.path)
+            self.search_index.add(nickname, item.path)
+            added.append((nickname, item.path))
+        if added:
+            self.launcher_model.append_launchers(added)
+            self.path_health.check_all(path for _, path in added)
+            self.refresh_search()
+            self.save_launchers()
+        message = f"Imported {len(added)} launcher(s)"
+        if skipped:
+            message += f", skipped {skipped} missing or already added"
+        self.log_message(message, "INFO")
+
+    def log_message(self, message, message_type="INFO"):
+        """Logs a message to the terminal with a timestamp."""
+        current_time = QTime.currentTime().toString("hh:mm:ss")
+        formatted_message = f"[{current_time}] {message_type}: {message}"
+        self.terminal.append_lines(formatted_message.splitlines())
+
+                
+    def show_error_message(self, title, message):
+        message_box = QMessageBox()
+        message_box.setIcon(QMessageBox.Critical)
+        message_box.setWindowTitle(title)
+        message_box.setText(message)
+        message_box.exec_()
+
+    # def show_info_message(self, title, message):
+    #     message_box = QMessageBox()
+    #     message_box.setIcon(QMessageBox.Information)
+    #     message_box.setWindowTitle(title)
+    #     message_box.setText(message)
+    #     message_box.exec_()
+    
+    def show_info_message(self, title, message):
+        self.log_message(f"{message}", title)
+
+    def show_extra_info(self):
+        """Displays extra information about the application."""
+        QMessageBox.information(
+            self,
+            "About",
+            "Code developed by: RsRaider\n"
+            "Application release date: May 9, 2025",
+        )
+                
+def main():
+    app = QApplication(sys.argv)
+    main_window = MainWindow()
+    main_window.show()
+    return app.exec_()
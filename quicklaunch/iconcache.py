@@ -0,0 +1,102 @@
+"""On-disk cache of launcher icons, keyed by the target's path and mtime.
+
+Icons are stored as PNG files under ``.quicklaunch_icons/``.  An index maps
+each target path to the mtime its icon was rendered for, so a warm start can
+show every cached icon without touching the targets at all; they are only
+stat'ed afterwards, in the background, to find icons that went stale.
+"""
+import hashlib
+import json
+import os
+import threading
+
+from quicklaunch.store import write_atomic
+
+
+ICON_DIR = ".quicklaunch_icons"
+INDEX_FILE = "index.json"
+
+FOLDER = "folder"
+FILE = "file"
+MISSING = "missing"
+
+
+def stat_target(path):
+    """(mtime in ns, kind) of a launcher target; may block on a dead network path."""
+    try:
+        stat = os.stat(path)
+    except (OSError, ValueError):
+        return 0, MISSING
+    return stat.st_mtime_ns, FOLDER if os.path.isdir(path) else FILE
+
+
+class IconDiskCache:
+    """PNG files plus a ``path -> [mtime_ns, file name]`` index; thread-safe."""
+
+    def __init__(self, directory=ICON_DIR, max_entries=5000):
+        self.directory = directory
+        self.max_entries = max_entries
+        self.lock = threading.Lock()
+        self.index = {}  # Least recently stored first
+        self.dirty = False
+        try:
+            with open(os.path.join(directory, INDEX_FILE), encoding="utf-8") as f:
+                self.index = json.load(f)
+        except (OSError, ValueError):
+            pass
+
+    def mtime(self, path):
+        """The mtime the cached icon of ``path`` was rendered for, or None."""
+        with self.lock:
+            entry = self.index.get(path)
+        return entry[0] if entry else None
+
+    def read(self, path):
+        """PNG bytes of the cached icon of ``path``, or None."""
+        with self.lock:
+            entry = self.index.get(path)
+        if entry is None:
+            return None
+        try:
+            with open(os.path.join(self.directory, entry[1]), "rb") as f:
+                return f.read()
+        except OSError:
+            with self.lock:
+                self.index.pop(path, None)
+                self.dirty = True
+            return None
+
+    def put(self, path, mtime_ns, data):
+        name = hashlib.sha1(f"{path}\0{mtime_ns}".encode("utf-8")).hexdigest() + ".png"
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            with open(os.path.join(self.directory, name), "wb") as f:
+                f.write(data)
+        except OSError:
+            return
+        stale = []
+        with self.lock:
+            old = self.index.pop(path, None)
+            if old is not None and old[1] != name:
+                stale.append(old[1])
+            self.index[path] = [mtime_ns, name]
+            while len(self.index) > self.max_entries:
+                stale.append(self.index.pop(next(iter(self.index)))[1])
+            self.dirty = True
+        for old_name in stale:
+            try:
+                os.remove(os.path.join(self.directory, old_name))
+            except OSError:
+                pass
+
+    def save(self):
+        with self.lock:
+            if not self.dirty:
+                return
+            text = json.dumps(self.index)
+            self.dirty = False
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            write_atomic(os.path.join(self.directory, INDEX_FILE), text, backup=False)
+        except OSError:
+            pass
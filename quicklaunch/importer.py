@@ -0,0 +1,126 @@
+"""Turns files and folders dropped on the window into launchers.
+
+``scan_paths`` inspects the dropped paths on a thread pool (a stat on a
+network share can take seconds): symlinks and Windows ``.lnk`` shortcuts are
+resolved to their targets, each item is classified as a folder, an
+executable or a plain file, and a nickname is derived from its name.
+"""
+import os
+import struct
+from concurrent.futures import ThreadPoolExecutor
+
+
+FOLDER = "folder"
+EXECUTABLE = "exe"
+FILE = "file"
+MISSING = "missing"
+
+EXECUTABLE_EXTENSIONS = (".exe", ".bat", ".cmd", ".com")
+
+
+class ImportedItem:
+    def __init__(self, source, path, kind, nickname):
+        self.source = source  # What was dropped
+        self.path = path  # Resolved target, used as the launcher path
+        self.kind = kind
+        self.nickname = nickname
+
+
+def read_shortcut(path):
+    """Target path of a Windows Shell Link (``.lnk``) file, or None.
+
+    Only the LinkInfo local path is read, which covers shortcuts to local
+    and mapped drives; shortcuts that cannot be decoded are kept as they are.
+    """
+    try:
+        with open(path, "rb") as f:
+            data = f.read(64 * 1024)
+    except OSError:
+        return None
+    if len(data) < 0x4C or struct.unpack_from("<I", data, 0)[0] != 0x4C:
+        return None
+    flags = struct.unpack_from("<I", data, 0x14)[0]
+    offset = 0x4C
+    if flags & 0x01:  # HasLinkTargetIDList
+        if offset + 2 > len(data):
+            return None
+        offset += 2 + struct.unpack_from("<H", data, offset)[0]
+    if not flags & 0x02 or offset + 0x1C > len(data):  # HasLinkInfo
+        return None
+    (_, header_size, info_flags, _, base_offset, _, suffix_offset) = struct.unpack_from("<7I", data, offset)
+    if not info_flags & 0x01:  # VolumeIDAndLocalBasePath
+        return None
+
+    def string_at(start, unicode=False):
+        if unicode:
+            end = start
+            while end + 1 < len(data) and data[end:end + 2] != b"\0\0":
+                end += 2
+            return data[start:end].decode("utf-16-le", "replace")
+        end = data.find(b"\0", start)
+        return data[start:end if end >= 0 else len(data)].decode("mbcs" if os.name == "nt" else "latin-1",
+                                                                 "replace")
+
+    if header_size >= 0x24:  # Unicode paths present
+        if offset + 0x24 > len(data):
+            return None  # Truncated file
+        base_unicode, suffix_unicode = struct.unpack_from("<2I", data, offset + 0x1C)
+        target = string_at(offset + base_unicode, True) + string_at(offset + suffix_unicode, True)
+    else:
+        target = string_at(offset + base_offset) + string_at(offset + suffix_offset)
+    return target or None
+
+
+def resolve(path):
+    """Follows a shortcut or symlink to the item it points to."""
+    if path.lower().endswith(".lnk"):
+        target = read_shortcut(path)
+        if target:
+            return os.path.normpath(target)
+    return os.path.realpath(path) if os.path.islink(path) else os.path.normpath(path)
+
+
+def classify(path):
+    if os.path.isdir(path):
+        return FOLDER
+    if not os.path.isfile(path):
+        return MISSING
+    if path.lower().endswith(EXECUTABLE_EXTENSIONS) or (os.name != "nt" and os.access(path, os.X_OK)):
+        return EXECUTABLE
+    return FILE
+
+
+def nickname_for(source, path, kind):
+    """A readable nickname: the folder name, or the file name without its extension."""
+    name = os.path.basename(source.rstrip("\\/")) or source
+    if source.lower().endswith(".lnk"):
+        name = name[:-4]
+    elif kind != FOLDER:
+        name = os.path.splitext(name)[0] or name
+    return name or os.path.basename(path.rstrip("\\/")) or path
+
+
+def scan_item(source):
+    path = resolve(source)
+    kind = classify(path)
+    if kind == MISSING and path != source and os.path.exists(source):
+        path, kind = os.path.normpath(source), FILE  # Dangling shortcut: let the shell deal with it
+    return ImportedItem(source, path, kind, nickname_for(source, path, kind))
+
+
+def scan_paths(paths, max_workers=8):
+    """Scans ``paths`` in parallel; returns ImportedItems in the dropped order."""
+    if not paths:
+        return []
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(paths)), thread_name_prefix="import") as executor:
+        return list(executor.map(scan_item, paths))
+
+
+def unique_nickname(nickname, taken):
+    """``nickname`` or the first free "nickname (N)"."""
+    candidate = nickname
+    counter = 2
+    while candidate in taken:
+        candidate = f"{nickname} ({counter})"
+        counter += 1
+    return candidate
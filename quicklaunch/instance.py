@@ -0,0 +1,93 @@
+"""Single-instance handshake between a running window and the command line.
+
+The window listens on a localhost TCP port and publishes the port together
+with a random token in ``INSTANCE_FILE``.  Clients send one JSON line and
+read one JSON line back.  Only the standard library is used, so the command
+line never has to import Qt.
+"""
+import json
+import os
+import socket
+
+from quicklaunch.store import write_atomic
+
+
+INSTANCE_FILE = "quicklaunch.instance"
+TIMEOUT = 0.5  # Seconds; a stale instance file must not stall the command line
+
+
+def publish(port, token, path=INSTANCE_FILE):
+    write_atomic(path, json.dumps({"port": port, "token": token, "pid": os.getpid()}), backup=False)
+
+
+def unpublish(token, path=INSTANCE_FILE):
+    """Removes the instance file if it still belongs to this instance."""
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            if json.load(f).get("token") == token:
+                os.remove(path)
+    except (OSError, ValueError):
+        pass
+
+
+def pid_alive(pid):
+    """True when a process with this id is running."""
+    if os.name == "nt":
+        import ctypes  # os.kill(pid, 0) would terminate the process on Windows
+        kernel32 = ctypes.windll.kernel32
+        handle = kernel32.OpenProcess(0x1000, False, pid)  # PROCESS_QUERY_LIMITED_INFORMATION
+        if not handle:
+            return False
+        try:
+            exit_code = ctypes.c_ulong()
+            return bool(kernel32.GetExitCodeProcess(handle, ctypes.byref(exit_code))) and exit_code.value == 259
+        finally:
+            kernel32.CloseHandle(handle)
+    try:
+        os.kill(pid, 0)
+    except PermissionError:
+        return True
+    except OSError:
+        return False
+    return True
+
+
+def forward(request, path=INSTANCE_FILE, timeout=TIMEOUT):
+    """Sends ``request`` to a running window; returns its reply, or None if no window took it.
+
+    The instance file is trusted only while the process that wrote it is
+    alive, and a reply only when it carries the instance's token, so a stale
+    file whose port now belongs to another program is ignored.  Once the
+    request has been sent to a live window, a reply that does not arrive
+    within ``timeout`` (the window may be busy) gives ``{"ok": True,
+    "unconfirmed": True}`` rather than None, so the caller does not run the
+    request a second time.
+    """
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            instance = json.load(f)
+        token = instance["token"]
+        if not pid_alive(int(instance["pid"])):
+            return None
+        message = json.dumps(dict(request, token=token)).encode("utf-8") + b"\n"
+        connection = socket.create_connection(("127.0.0.1", instance["port"]), timeout=timeout)
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+    with connection:
+        try:
+            connection.sendall(message)
+        except OSError:
+            return None
+        try:
+            reply = connection.makefile("rb").readline()
+        except socket.timeout:
+            return {"ok": True, "unconfirmed": True}
+        except OSError:
+            return None
+    try:
+        reply = json.loads(reply)
+    except ValueError:
+        return None
+    if not isinstance(reply, dict) or reply.get("token") != token:
+        return None
+    return reply
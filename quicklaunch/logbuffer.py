@@ -0,0 +1,36 @@
+from collections import deque
+
+
+class LogRingBuffer:
+    """Keeps the most recent log lines within a line and character budget.
+
+    ``extend`` returns how many lines were evicted from the front so a view
+    mirroring the buffer can drop the same number of lines from its top.
+    """
+
+    def __init__(self, max_lines=10000, max_chars=2000000):
+        self.max_lines = max_lines
+        self.max_chars = max_chars
+        self.lines = deque()
+        self.chars = 0
+
+    def __len__(self):
+        return len(self.lines)
+
+    def extend(self, new_lines):
+        """Appends lines and trims the oldest ones; returns the number evicted."""
+        evicted = 0
+        for line in new_lines:
+            self.lines.append(line)
+            self.chars += len(line) + 1
+        while self.lines and (len(self.lines) > self.max_lines or self.chars > self.max_chars):
+            self.chars -= len(self.lines.popleft()) + 1
+            evicted += 1
+        return evicted
+
+    def clear(self):
+        self.lines.clear()
+        self.chars = 0
+
+    def text(self):
+        return "\n".join(self.lines)
@@ -0,0 +1,165 @@
+"""Background existence checks of launcher paths that never block the GUI.
+
+``PathHealthCache`` answers from a cache and queues stale paths for a small
+set of worker threads.  A watchdog thread keeps a heap of the running
+checks' deadlines and reports a check that outlives it as TIMEOUT, starting
+a replacement worker so a dead network mount cannot stall the others.
+"""
+import heapq
+import itertools
+import os
+import queue
+import threading
+import time
+
+
+OK = "ok"
+MISSING = "missing"
+TIMEOUT = "timeout"
+UNKNOWN = "unknown"
+
+
+def check_path(path):
+    """Blocking existence check; may hang on an unreachable network mount."""
+    return OK if os.path.isdir(path) or os.path.isfile(path) else MISSING
+
+
+class PathHealthCache:
+    """Checks launcher paths on a bounded thread pool and caches the results.
+
+    ``status`` never touches the filesystem: it answers from the cache and
+    schedules a background check when the entry is missing or older than
+    ``ttl`` seconds.  Checks of the same path are deduplicated while one is
+    in flight, so a path whose check hangs is not checked again until it
+    returns.  A check that has not answered ``timeout`` seconds after it
+    started is reported as TIMEOUT; if it finishes later its real result
+    replaces that.
+
+    A worker stuck in a timed-out check is replaced by a new one, so hung
+    network mounts do not hold up the checks queued behind them; at most
+    ``max_hung`` such workers are left waiting at a time.
+
+    ``on_result(path, status)`` is called from a worker thread whenever a
+    path's status changes.
+    """
+
+    def __init__(self, ttl=60.0, timeout=3.0, max_workers=4, on_result=None, checker=check_path,
+                 max_hung=16):
+        self.ttl = ttl
+        self.timeout = timeout
+        self.on_result = on_result
+        self.checker = checker
+        self.max_workers = max_workers
+        self.max_hung = max_hung
+        self.pending = queue.Queue()  # (path, token) waiting for a worker, None stops one
+        self.workers = 0  # Worker threads started and not finished, hung ones included
+        self.hung = set()  # Tokens of timed-out checks that are still running
+        self.lock = threading.Lock()
+        self.entries = {}  # path -> (status, checked_at)
+        self.in_flight = {}  # path -> token of the check queued or running
+        self.deadlines = []  # Heap of (deadline, token, path) for running checks
+        self.tokens = itertools.count()
+        self.wakeup = threading.Condition(self.lock)
+        self.closed = False
+        self.watchdog = threading.Thread(target=self._watch_deadlines, name="path-health-watchdog", daemon=True)
+        self.watchdog.start()
+
+    def status(self, path):
+        """Cached status of ``path`` (UNKNOWN until checked); never blocks."""
+        path = os.path.normpath(path)
+        with self.lock:
+            status, checked_at = self.entries.get(path, (UNKNOWN, None))
+        if checked_at is None or time.monotonic() - checked_at > self.ttl:
+            self.check(path)
+        return status
+
+    def check(self, path, force=False):
+        """Schedules a background check unless a fresh result or a check exists."""
+        path = os.path.normpath(path)
+        with self.lock:
+            if self.closed or path in self.in_flight:
+                return
+            _, checked_at = self.entries.get(path, (UNKNOWN, None))
+            if not force and checked_at is not None and time.monotonic() - checked_at <= self.ttl:
+                return
+            token = next(self.tokens)
+            self.in_flight[path] = token
+            if self.workers - len(self.hung) < self.max_workers and self.workers < self.max_workers + self.max_hung:
+                self._start_worker()
+        self.pending.put((path, token))
+
+    def check_all(self, paths, force=False):
+        for path in paths:
+            self.check(path, force)
+
+    def shutdown(self):
+        with self.lock:
+            self.closed = True
+            self.wakeup.notify()
+            workers = self.workers
+        # Hung checks cannot be interrupted, so do not wait for them
+        for _ in range(workers):
+            self.pending.put(None)
+
+    def _start_worker(self):
+        """Starts one more worker thread; the caller holds the lock."""
+        self.workers += 1
+        threading.Thread(target=self._work, name="path-health", daemon=True).start()
+
+    def _work(self):
+        while True:
+            item = self.pending.get()
+            if item is None:
+                return
+            path, token = item
+            self._run_check(path, token)
+            with self.lock:
+                if token in self.hung:
+                    self.hung.discard(token)
+                    if self.workers - len(self.hung) > self.max_workers:
+                        self.workers -= 1  # A replacement took over while this check hung
+                        return
+
+    def _run_check(self, path, token):
+        with self.lock:
+            if self.closed or self.in_flight.get(path) != token:
+                return
+            # The timeout starts now, not while the check waited for a worker
+            heapq.heappush(self.deadlines, (time.monotonic() + self.timeout, token, path))
+            self.wakeup.notify()
+        try:
+            status = self.checker(path)
+        except OSError:
+            status = MISSING
+        with self.lock:
+            if self.in_flight.get(path) == token:
+                del self.in_flight[path]
+        self._store(path, status)
+
+    def _store(self, path, status):
+        with self.lock:
+            previous, _ = self.entries.get(path, (UNKNOWN, None))
+            self.entries[path] = (status, time.monotonic())
+        if status != previous and self.on_result is not None:
+            self.on_result(path, status)
+
+    def _watch_deadlines(self):
+        """Marks checks that outlive their deadline as TIMEOUT."""
+        while True:
+            expired = []
+            with self.lock:
+                while not self.closed and (not self.deadlines or self.deadlines[0][0] > time.monotonic()):
+                    delay = self.deadlines[0][0] - time.monotonic() if self.deadlines else None
+                    self.wakeup.wait(delay)
+                if self.closed:
+                    return
+                now = time.monotonic()
+                while self.deadlines and self.deadlines[0][0] <= now:
+                    _, token, path = heapq.heappop(self.deadlines)
+                    if self.in_flight.get(path) == token:
+                        expired.append(path)
+                        self.hung.add(token)
+                        if self.workers < self.max_workers + self.max_hung:
+                            self._start_worker()  # Replace the worker stuck in this check
+            for path in expired:
+                self._store(path, TIMEOUT)
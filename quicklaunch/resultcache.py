@@ -0,0 +1,213 @@
+"""Content-addressed cache of successful command chain runs.
+
+A launcher opts in with a spec ``{"inputs": [globs], "outputs": [files]}``.
+The cache key is a SHA-256 over the command and the contents of every file
+matching the input globs; runs whose globs match no file are not cached.
+Hashing is skipped when the inputs' paths, mtimes and sizes match a
+combination already seen, so an unchanged tree costs one ``stat`` per input.
+
+An entry holds the run's captured output and a copy of every declared
+output file.  A hit replays the output and restores output files that are
+missing or differ from the cached copy, instead of running the chain.
+Entries live under ``.quicklaunch_cache/`` and the least recently used ones
+are evicted once the cache grows past ``max_bytes``.
+"""
+import glob
+import hashlib
+import json
+import os
+import shutil
+import threading
+import time
+
+from quicklaunch.store import write_atomic
+
+
+CACHE_DIR = ".quicklaunch_cache"
+INDEX_FILE = "index.json"
+OUTPUT_FILE = "output.jsonl"
+
+
+def parse_patterns(text):
+    """Splits a ``;``-separated list of globs or paths as typed in the edit dialog."""
+    return [pattern.strip() for pattern in text.split(";") if pattern.strip()]
+
+
+def file_digest(path):
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+class CacheLookup:
+    """The inputs seen before a run, and the matching entry's key if any."""
+
+    def __init__(self, command, workdir, outputs, signature, key=None, hit=False):
+        self.command = command
+        self.workdir = workdir
+        self.outputs = outputs
+        self.signature = signature  # Hash of the inputs' paths, mtimes and sizes
+        self.key = key  # Content key, computed only when needed
+        self.hit = hit
+        self.output = []  # (stream, line) tuples replayed on a hit
+
+
+class ResultCache:
+    """On-disk cache shared by every job; safe to use from several threads."""
+
+    MAX_RECORDED_LINES = 100000  # Runs printing more than this are not cached
+
+    def __init__(self, directory=CACHE_DIR, max_bytes=256 * 1024 * 1024):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.lock = threading.Lock()
+        self.entries = {}  # key -> {"size": bytes, "last_used": time, "outputs": [...]}
+        self.signatures = {}  # signature -> key
+        self._load_index()
+
+    def lookup(self, command, spec, workdir=None):
+        """Returns a CacheLookup; ``hit`` is set when a matching run is cached.
+
+        Raises ValueError when no file matches the input globs: the key
+        would then cover nothing but the command, and every later run would
+        replay the first one whatever changed.
+        """
+        workdir = workdir or os.getcwd()
+        patterns = spec.get("inputs", [])
+        files = self._input_files(patterns, workdir)
+        if not files:
+            raise ValueError(f"no input files match {'; '.join(patterns) or '(no inputs)'} in {workdir}")
+        stats = []
+        for path in files:
+            stat = os.stat(path)
+            stats.append((os.path.relpath(path, workdir), stat.st_mtime_ns, stat.st_size))
+        signature = hashlib.sha256(json.dumps([command, stats]).encode("utf-8")).hexdigest()
+        lookup = CacheLookup(command, workdir, spec.get("outputs", []), signature)
+
+        with self.lock:
+            key = self.signatures.get(signature)
+        if key is None:
+            # Inputs were touched (or never seen): fall back to their contents
+            digest = hashlib.sha256(command.encode("utf-8"))
+            for path, (relative, _, _) in zip(files, stats):
+                digest.update(relative.encode("utf-8") + b"\0" + file_digest(path).encode("ascii"))
+            key = digest.hexdigest()
+        lookup.key = key
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is None:
+                return lookup
+            self.signatures[signature] = key
+            entry["last_used"] = time.time()
+        try:
+            lookup.output = self._read_output(key)
+            self._restore_outputs(key, entry, workdir)
+        except (OSError, ValueError):
+            self._drop(key)
+            return lookup
+        lookup.hit = True
+        self._save_index()
+        return lookup
+
+    def store(self, lookup, output):
+        """Caches a successful run's output lines and declared output files."""
+        if lookup.hit or len(output) > self.MAX_RECORDED_LINES:
+            return False
+        entry_dir = os.path.join(self.directory, lookup.key)
+        try:
+            os.makedirs(os.path.join(entry_dir, "outputs"), exist_ok=True)
+            size = 0
+            outputs = []
+            for number, relative in enumerate(lookup.outputs):
+                source = os.path.join(lookup.workdir, relative)
+                target = os.path.join(entry_dir, "outputs", str(number))
+                shutil.copy2(source, target)
+                stat = os.stat(source)
+                outputs.append([relative, stat.st_mtime_ns, stat.st_size])
+                size += stat.st_size
+            with open(os.path.join(entry_dir, OUTPUT_FILE), "w", encoding="utf-8") as f:
+                for item in output:
+                    f.write(json.dumps(item) + "\n")
+                size += f.tell()
+        except OSError:
+            shutil.rmtree(entry_dir, ignore_errors=True)  # A declared output is missing
+            return False
+        with self.lock:
+            self.entries[lookup.key] = {"size": size, "last_used": time.time(), "outputs": outputs}
+            self.signatures[lookup.signature] = lookup.key
+            evicted = self._evict()
+        for key in evicted:
+            shutil.rmtree(os.path.join(self.directory, key), ignore_errors=True)
+        self._save_index()
+        return True
+
+    def clear(self):
+        with self.lock:
+            self.entries = {}
+            self.signatures = {}
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+    @staticmethod
+    def _input_files(patterns, workdir):
+        files = set()
+        for pattern in patterns:
+            pattern = os.path.join(workdir, os.path.expanduser(pattern))
+            files.update(path for path in glob.glob(pattern, recursive=True) if os.path.isfile(path))
+        return sorted(files)
+
+    def _read_output(self, key):
+        with open(os.path.join(self.directory, key, OUTPUT_FILE), encoding="utf-8") as f:
+            return [tuple(json.loads(line)) for line in f]
+
+    def _restore_outputs(self, key, entry, workdir):
+        for number, (relative, mtime_ns, size) in enumerate(entry["outputs"]):
+            target = os.path.join(workdir, relative)
+            try:
+                stat = os.stat(target)
+                if (stat.st_mtime_ns, stat.st_size) == (mtime_ns, size):
+                    continue
+            except FileNotFoundError:
+                pass
+            os.makedirs(os.path.dirname(os.path.abspath(target)), exist_ok=True)
+            shutil.copy2(os.path.join(self.directory, key, "outputs", str(number)), target)
+
+    def _drop(self, key):
+        with self.lock:
+            self.entries.pop(key, None)
+            self.signatures = {signature: value for signature, value in self.signatures.items() if value != key}
+        shutil.rmtree(os.path.join(self.directory, key), ignore_errors=True)
+        self._save_index()
+
+    def _evict(self):
+        """Forgets least recently used entries past ``max_bytes``; returns their keys."""
+        total = sum(entry["size"] for entry in self.entries.values())
+        evicted = []
+        for key in sorted(self.entries, key=lambda key: self.entries[key]["last_used"]):
+            if total <= self.max_bytes:
+                break
+            total -= self.entries.pop(key)["size"]
+            evicted.append(key)
+        if evicted:
+            self.signatures = {signature: key for signature, key in self.signatures.items()
+                               if key in self.entries}
+        return evicted
+
+    def _load_index(self):
+        try:
+            with open(os.path.join(self.directory, INDEX_FILE), encoding="utf-8") as f:
+                index = json.load(f)
+        except (OSError, ValueError):
+            return
+        self.entries = index.get("entries", {})
+        self.signatures = index.get("signatures", {})
+
+    def _save_index(self):
+        with self.lock:
+            text = json.dumps({"entries": self.entries, "signatures": self.signatures})
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            write_atomic(os.path.join(self.directory, INDEX_FILE), text, backup=False)
+        except OSError:
+            pass  # The cache is an optimization; losing the index only costs re-runs
@@ -0,0 +1,220 @@
+"""Per-run output logs on disk, and paged access to them through mmap.
+
+Every job's output is appended to its own file under ``.quicklaunch_logs/``
+by a ``RunLogWriter`` on the job's worker thread, so a long build never has
+to fit in memory.  Next to each ``.log`` the writer keeps an ``.idx`` file:
+the end offset of every line as unsigned 64-bit integers.
+
+``MappedLog`` opens a log with ``mmap``, takes the line index from the
+``.idx`` file (scanning only what it does not cover, e.g. a log that is
+still being written or one without an index) and reads single lines on
+demand.  ``search`` runs a regular expression directly over the mapping,
+a range of lines at a time.
+"""
+import array
+import bisect
+import itertools
+import mmap
+import os
+import re
+import time
+
+
+LOG_DIR = ".quicklaunch_logs"
+NAME = re.compile(r"(?P<started>\d{8}-\d{6})-(?P<job_id>\d+)-(?P<nickname>.*)\.log\Z")
+
+
+class RunLogWriter:
+    """Appends ``(stream, line)`` batches to a log file and its line index.
+
+    Errors are swallowed after closing the files: losing the log must never
+    break the run it records.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.position = 0
+        self.log_file = open(path, "ab")
+        self.index_file = open(path + ".idx", "ab")
+
+    def write(self, batch):
+        if self.log_file is None:
+            return
+        data = "".join(line + "\n" for _, line in batch).encode("utf-8", "replace")
+        ends = array.array("Q")
+        position = self.position
+        for _, line in batch:
+            position += len(line.encode("utf-8", "replace")) + 1
+            ends.append(position)
+        try:
+            self.log_file.write(data)
+            self.log_file.flush()  # Let the viewer follow a running job
+            ends.tofile(self.index_file)
+            self.index_file.flush()
+        except OSError:
+            self.close()
+            return
+        self.position = position
+
+    def close(self):
+        for f in (self.log_file, self.index_file):
+            if f is not None:
+                try:
+                    f.close()
+                except OSError:
+                    pass
+        self.log_file = self.index_file = None
+
+
+class RunLogInfo:
+    def __init__(self, path, nickname, job_id, started, size):
+        self.path = path
+        self.nickname = nickname
+        self.job_id = job_id
+        self.started = started  # Unix timestamp
+        self.size = size
+
+
+class RunLogStore:
+    """The directory of run logs; keeps the newest ``max_runs`` within ``max_bytes``."""
+
+    def __init__(self, directory=LOG_DIR, max_runs=200, max_bytes=2 * 1024 ** 3):
+        self.directory = directory
+        self.max_runs = max_runs
+        self.max_bytes = max_bytes
+
+    def new_log(self, job_id, nickname):
+        """Path for the log of a new run; older logs are pruned to make room."""
+        os.makedirs(self.directory, exist_ok=True)
+        self.prune(keep=self.max_runs - 1)
+        safe = re.sub(r"[^\w .-]", "_", nickname)[:60] or "run"
+        started = time.strftime("%Y%m%d-%H%M%S")
+        return os.path.join(self.directory, f"{started}-{job_id}-{safe}.log")
+
+    def runs(self):
+        """RunLogInfos of every log, newest first."""
+        try:
+            names = os.listdir(self.directory)
+        except OSError:
+            return []
+        runs = []
+        for name in names:
+            match = NAME.match(name)
+            if match is None:
+                continue
+            path = os.path.join(self.directory, name)
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            started = time.mktime(time.strptime(match["started"], "%Y%m%d-%H%M%S"))
+            runs.append(RunLogInfo(path, match["nickname"], int(match["job_id"]), started, stat.st_size))
+        runs.sort(key=lambda run: (run.started, run.job_id), reverse=True)
+        return runs
+
+    def prune(self, keep=None):
+        keep = self.max_runs if keep is None else keep
+        total = 0
+        for number, run in enumerate(self.runs()):
+            total += run.size
+            if number >= keep or total > self.max_bytes:
+                for path in (run.path, run.path + ".idx"):
+                    try:
+                        os.remove(path)
+                    except OSError:
+                        pass  # Still open in a viewer on Windows
+
+
+class MappedLog:
+    """Read-only, line-addressed view of a log file through mmap."""
+
+    SCAN_CHUNK = 4 * 1024 * 1024  # Bytes split per step while indexing
+
+    def __init__(self, path):
+        self.path = path
+        self.file = open(path, "rb")
+        self.map = None
+        self.size = 0
+        self.ends = array.array("Q")  # Offset just past the line break of every complete line
+        self._load_index()
+        self.refresh()
+
+    def __len__(self):
+        """Number of lines, counting a last line without a line break."""
+        return len(self.ends) + (1 if self.scanned < self.size else 0)
+
+    @property
+    def scanned(self):
+        return self.ends[-1] if self.ends else 0
+
+    def refresh(self):
+        """Maps the file again if it grew and indexes the new lines; returns the line count."""
+        size = os.fstat(self.file.fileno()).st_size
+        if size != self.size or self.map is None:
+            if self.map is not None:
+                self.map.close()
+            self.map = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ) if size else None
+            self.size = size
+            if self.scanned > size:
+                self.ends = array.array("Q")  # Truncated or replaced
+            self._scan()
+        return len(self)
+
+    def close(self):
+        if self.map is not None:
+            self.map.close()
+            self.map = None
+        self.file.close()
+
+    def span(self, number):
+        """(start, end) byte offsets of a line, without its line break."""
+        start = self.ends[number - 1] if number > 0 else 0
+        end = self.ends[number] - 1 if number < len(self.ends) else self.size
+        return start, end
+
+    def line(self, number):
+        start, end = self.span(number)
+        return self.map[start:end].decode("utf-8", "replace").rstrip("\r")
+
+    def line_at(self, offset):
+        """Number of the line containing byte ``offset``."""
+        return bisect.bisect_right(self.ends, offset)
+
+    def search(self, pattern, start_line=0, stop_line=None):
+        """First line in ``[start_line, stop_line)`` matching ``pattern`` (a bytes regex), or None."""
+        stop_line = len(self) if stop_line is None else min(stop_line, len(self))
+        if self.map is None or start_line >= stop_line:
+            return None
+        match = pattern.search(self.map, self.span(start_line)[0], self.span(stop_line - 1)[1])
+        return None if match is None else self.line_at(match.start())
+
+    def _load_index(self):
+        try:
+            with open(self.path + ".idx", "rb") as f:
+                data = f.read()
+        except OSError:
+            return
+        ends = array.array("Q")
+        ends.frombytes(data[:len(data) - len(data) % ends.itemsize])
+        size = os.fstat(self.file.fileno()).st_size
+        if ends and ends[-1] <= size:
+            self.ends = ends  # Checked against the file once it is mapped
+
+    def _scan(self):
+        if self.ends and (self.map is None or self.map[self.scanned - 1] != 0x0A):
+            self.ends = array.array("Q")  # The index does not belong to this file
+        position = self.scanned
+        while position < self.size:
+            chunk = self.map[position:position + self.SCAN_CHUNK]
+            lines = chunk.split(b"\n")
+            if len(lines) == 1:  # A line longer than the chunk
+                end = self.map.find(b"\n", position + len(chunk))
+                if end < 0:
+                    break
+                position = end + 1
+                self.ends.append(position)
+                continue
+            ends = itertools.accumulate((len(line) + 1 for line in lines[:-1]), initial=position)
+            next(ends)  # The initial value is where the chunk starts
+            self.ends.extend(ends)
+            position = self.ends[-1]
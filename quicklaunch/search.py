@@ -0,0 +1,273 @@
+import re
+import time
+from bisect import bisect_right
+
+
+FIELD_SEPARATOR = "\x00"
+WORD_BOUNDARIES = " _-./\\:"
+
+
+def trigrams(text):
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+
+def narrow(postings, small_enough):
+    """Intersects postings sets (sorted smallest first) while that pays off.
+
+    Intersecting costs as much as the running result is large, so once a
+    large result stops shrinking the remaining sets are skipped; callers
+    verify every candidate anyway.
+    """
+    result = postings[0]
+    for other in postings[1:]:
+        if len(result) <= small_enough or len(other) < len(result) * 2:
+            narrowed = result & other
+            if len(result) > small_enough and len(narrowed) > len(result) // 2:
+                return narrowed
+            result = narrowed
+    return result
+
+
+def nickname_part(text):
+    """The nickname field of an indexed document's searchable text."""
+    return text.split(FIELD_SEPARATOR, 1)[0]
+
+
+class LauncherIndex:
+    """In-memory fuzzy search index over launcher nicknames, paths and commands.
+
+    Every launcher is indexed as its nickname plus either its path or, for
+    chained commands, each ``;``-separated segment.  A query matches when its
+    characters appear in order inside one of those fields.  Results are
+    gathered in tiers, best first: nickname word prefixes, substrings (found
+    through trigram postings) and finally loose subsequences.  Inside a tier
+    matches are ranked by tightness, trigram overlap and the field they were
+    found in.
+
+    The index is updated entry by entry with ``add``, ``remove`` and
+    ``update``; nothing is ever rebuilt from scratch.  A large collection is
+    indexed a slice at a time with ``add_pending``, and may be edited and
+    searched in between.
+    """
+
+    SCORE_LIMIT = 1000  # Larger tiers are only scored for their shortest nicknames
+    SCAN_FACTOR = 2  # ... of which ``limit * SCAN_FACTOR`` are scored
+    PREFIX_LENGTH = 3  # Longest nickname word prefix kept in the prefix index
+    FIELD_WEIGHTS = (1.0, 0.7)  # Nickname, path/command segments
+
+    def __init__(self):
+        self.next_id = 0
+        self.ids = {}  # nickname -> document id
+        self.docs = {}  # document id -> (nickname, path, searchable text, field offsets)
+        self.sort_keys = {}  # document id -> key used when ranking is coarse
+        self.order = []  # Document ids sorted by their sort key
+        self.char_postings = {}
+        self.prefix_postings = {}
+        self.trigram_postings = {}
+        self.last_fuzzy = (None, None)  # (query, complete subsequence matches)
+
+    def __len__(self):
+        return len(self.ids)
+
+    def __contains__(self, nickname):
+        return nickname in self.ids
+
+    def add(self, nickname, path):
+        """Indexes a launcher; an existing entry with that nickname is replaced."""
+        if nickname in self.ids:
+            self.remove(nickname)
+        doc_id = self.next_id
+        self.next_id += 1
+
+        fields = [nickname.lower()]
+        if ";" in path:
+            fields.extend(segment.strip().lower() for segment in path.split(";") if segment.strip())
+        elif path:
+            fields.append(path.lower())
+        offsets = []
+        position = 0
+        for field in fields:
+            offsets.append(position)
+            position += len(field) + 1
+        text = FIELD_SEPARATOR.join(fields)
+
+        self.ids[nickname] = doc_id
+        self.docs[doc_id] = (nickname, path, text, offsets)
+        sort_key = (len(nickname), fields[0])
+        self.sort_keys[doc_id] = sort_key
+        self.order.insert(self._order_position(sort_key), doc_id)
+        self._post(doc_id, text, add=True)
+
+    def remove(self, nickname):
+        doc_id = self.ids.pop(nickname, None)
+        if doc_id is None:
+            return
+        _, _, text, _ = self.docs.pop(doc_id)
+        position = self._order_position(self.sort_keys[doc_id]) - 1
+        while self.order[position] != doc_id:
+            position -= 1  # Entries with an equal key sit just before the insertion point
+        del self.order[position]
+        del self.sort_keys[doc_id]
+        self._post(doc_id, text, add=False)
+
+    def update(self, nickname, new_nickname, new_path):
+        """Re-indexes a launcher after it was renamed or its path changed."""
+        self.remove(nickname)
+        self.add(new_nickname, new_path)
+
+    def add_pending(self, pending, launchers, budget):
+        """Indexes nicknames taken from the ``pending`` deque for up to ``budget`` seconds.
+
+        Paths are looked up in ``launchers`` when a nickname is taken, so edits
+        made meanwhile are picked up; nicknames that were removed or are
+        already indexed are skipped.  Returns True once ``pending`` is empty.
+        """
+        deadline = time.perf_counter() + budget
+        while pending:
+            nickname = pending.popleft()
+            if nickname not in self.ids and nickname in launchers:
+                self.add(nickname, launchers[nickname])
+            if time.perf_counter() >= deadline:
+                break
+        return not pending
+
+    def clear(self):
+        self.__init__()
+
+    def _post(self, doc_id, text, add):
+        """Adds or removes a document from every postings table."""
+        self.last_fuzzy = (None, None)
+        prefixes = {word[:length] for word in nickname_part(text).split()
+                    for length in range(1, self.PREFIX_LENGTH + 1)}
+        for table, keys in ((self.char_postings, set(text)),
+                            (self.prefix_postings, prefixes),
+                            (self.trigram_postings, trigrams(text))):
+            for key in keys:
+                if add:
+                    table.setdefault(key, set()).add(doc_id)
+                else:
+                    postings = table[key]
+                    postings.discard(doc_id)
+                    if not postings:
+                        del table[key]
+
+    def _order_position(self, sort_key):
+        """Insertion point for ``sort_key`` in ``order`` (bisect_right semantics)."""
+        low, high = 0, len(self.order)
+        while low < high:
+            middle = (low + high) // 2
+            if sort_key < self.sort_keys[self.order[middle]]:
+                high = middle
+            else:
+                low = middle + 1
+        return low
+
+    def search(self, query, limit=50):
+        """Returns up to ``limit`` (nickname, path) pairs, best match first."""
+        words = query.lower().split()
+        phrase = " ".join(words)
+        chars = "".join(words)
+        if not chars:
+            return []
+        pattern = re.compile("[^\x00]*?".join(re.escape(char) for char in chars))
+        results = []
+        seen = set()
+
+        def take(tier, matches=None):
+            for doc_id in self._best(tier, phrase, chars, pattern, limit - len(results), seen, matches):
+                seen.add(doc_id)
+                results.append(self.docs[doc_id][:2])
+
+        # Candidates containing the query as a substring, from trigram postings
+        substring_candidates = None
+        if len(phrase) >= 3:
+            postings = [self.trigram_postings.get(gram, set()) for gram in trigrams(phrase)]
+            postings.sort(key=len)
+            substring_candidates = narrow(postings, self.SCORE_LIMIT)
+
+        # Nickname words starting with the query
+        prefix = self.prefix_postings.get(phrase[:self.PREFIX_LENGTH], set())
+        if len(phrase) <= self.PREFIX_LENGTH:
+            take(prefix)
+        else:
+            take(prefix & substring_candidates,
+                 lambda text: (" " + nickname_part(text)).find(" " + phrase) >= 0)
+
+        # Substrings anywhere
+        if len(results) < limit and substring_candidates:
+            take(substring_candidates, lambda text: phrase in text)
+
+        # Loose subsequences, narrowed down with character postings and the
+        # matches of the previous keystroke
+        if len(results) < limit:
+            candidates = self._fuzzy_candidates(chars)
+            if len(candidates) <= self.SCORE_LIMIT:
+                matches = {doc_id for doc_id in candidates if pattern.search(self.docs[doc_id][2])}
+                self.last_fuzzy = (chars, matches)
+                take(matches)
+            else:
+                take(candidates, lambda text: pattern.search(text) is not None)
+        return results
+
+    def _fuzzy_candidates(self, chars):
+        last_query, last_matches = self.last_fuzzy
+        postings = []
+        if last_query is not None and chars.startswith(last_query):
+            postings.append(last_matches)
+        for char in set(chars):
+            char_postings = self.char_postings.get(char)
+            if not char_postings:
+                return set()
+            postings.append(char_postings)
+        postings.sort(key=len)
+        return narrow(postings, self.SCORE_LIMIT)
+
+    def _best(self, tier, phrase, chars, pattern, count, seen, matches=None):
+        """Returns the ``count`` best-scoring documents of a tier that pass ``matches``.
+
+        Small tiers are scored in full.  Large ones are walked in nickname
+        order and only the first ``count * SCAN_FACTOR`` hits are scored.
+        """
+        if count <= 0 or not tier:
+            return []
+        if len(tier) <= self.SCORE_LIMIT:
+            candidates = (doc_id for doc_id in tier if doc_id not in seen)
+            budget = None
+        else:
+            candidates = (doc_id for doc_id in self.order if doc_id in tier and doc_id not in seen)
+            budget = count * self.SCAN_FACTOR
+        query_grams = trigrams(phrase)
+        scored = []
+        for doc_id in candidates:
+            doc = self.docs[doc_id]
+            if matches is not None and not matches(doc[2]):
+                continue
+            score = self._score(doc, phrase, chars, query_grams, pattern)
+            if score:
+                scored.append((-score, self.sort_keys[doc_id], doc_id))
+                if budget is not None and len(scored) >= budget:
+                    break
+        scored.sort()
+        return [doc_id for _, _, doc_id in scored[:count]]
+
+    def _score(self, doc, phrase, chars, query_grams, pattern):
+        _, _, text, offsets = doc
+        position = text.find(phrase)
+        if position >= 0:
+            field = bisect_right(offsets, position) - 1
+            if position == offsets[field]:
+                score = 3.0  # Prefix of the field
+            elif text[position - 1] in WORD_BOUNDARIES:
+                score = 2.5  # Start of a word
+            else:
+                score = 2.0
+        else:
+            match = pattern.search(text)
+            if match is None:
+                return 0.0
+            position = match.start()
+            field = bisect_right(offsets, position) - 1
+            score = 1.0 + len(chars) / (match.end() - position)  # Tighter is better
+        if query_grams:
+            score += sum(gram in text for gram in query_grams) / len(query_grams)
+        return score * self.FIELD_WEIGHTS[min(field, 1)]
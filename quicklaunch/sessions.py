@@ -0,0 +1,238 @@
+"""Warm shell sessions: run command steps without starting a shell each time.
+
+A ``ShellSession`` is a ``/bin/sh`` process started ahead of time that reads
+commands from its stdin.  Every command is sent as
+
+    ( cd DIR && export NAME=VALUE && eval 'COMMAND' ) </dev/null
+    printf '%s %d\\n' MARKER $?
+    printf '%s\\n' MARKER >&2
+
+so it runs in a forked subshell (``cd``, ``export`` or ``exit`` do not leak
+into later commands, and ``eval`` turns a syntax error into an exit status
+instead of leaving the session waiting for more input) and is followed by a
+marker line on each stream, which ends its output and carries its exit code.
+
+``SessionPool`` keeps a few idle sessions warm, checks the health of a session
+that sat idle for a while before handing it out, and replaces sessions after
+``max_commands`` commands or as soon as one breaks or is cancelled.  POSIX
+only: cmd.exe has no subshell to isolate commands, so Windows keeps starting
+a process per step.
+"""
+import os
+import queue
+import re
+import secrets
+import shlex
+import signal
+import subprocess
+import threading
+import time
+
+
+SHELL = "/bin/sh"
+NAME = re.compile(r"[A-Za-z_][A-Za-z0-9_]*\Z")  # Variables the shell can set or unset
+
+
+def supported():
+    return os.name != "nt" and os.path.exists(SHELL)
+
+
+class ShellSession:
+    """One warm shell; runs one command at a time, output arrives on ``pending``."""
+
+    MAX_PENDING_LINES = 10000  # Reader threads block when this many lines wait
+
+    def __init__(self, cwd=None, env=None):
+        self.env = dict(os.environ if env is None else env)
+        self.marker = f"__quicklaunch_{secrets.token_hex(8)}__"
+        self.process = subprocess.Popen([SHELL], stdin=subprocess.PIPE, stdout=subprocess.PIPE,
+                                        stderr=subprocess.PIPE, cwd=cwd, env=self.env, text=True,
+                                        errors="replace", start_new_session=True)
+        self.pending = queue.Queue(maxsize=self.MAX_PENDING_LINES)  # (stream, line), None ends a stream
+        self.exit_code = None  # Of the last finished command
+        self.commands = 0
+        self.broken = False
+        self.last_used = time.monotonic()
+        self.readers = [
+            threading.Thread(target=self._read, args=(self.process.stdout, "stdout"), daemon=True),
+            threading.Thread(target=self._read, args=(self.process.stderr, "stderr"), daemon=True),
+        ]
+        for reader in self.readers:
+            reader.start()
+
+    @property
+    def alive(self):
+        return not self.broken and self.process.poll() is None
+
+    def script(self, command, cwd=None, env=None):
+        """The text sent to the shell to run ``command`` in ``cwd`` with ``env``."""
+        setup = []
+        if cwd is not None:
+            setup.append(f"cd -- {shlex.quote(cwd)}")
+        if env is not None:
+            for name in sorted(set(self.env) - set(env)):
+                if NAME.match(name):
+                    setup.append(f"unset {name}")
+            for name, value in sorted(env.items()):
+                if self.env.get(name) != value and NAME.match(name):
+                    setup.append(f"export {name}={shlex.quote(value)}")
+        setup.append(f"eval {shlex.quote(command)}")
+        return (f"( {' && '.join(setup)}\n) </dev/null\n"
+                f"printf '%s %d\\n' {self.marker} $?\n"
+                f"printf '%s\\n' {self.marker} >&2\n")
+
+    def send(self, command, cwd=None, env=None):
+        """Starts ``command``; its output follows on ``pending``, ended by one None per stream."""
+        self.exit_code = None
+        self.commands += 1
+        self.last_used = time.monotonic()
+        try:
+            self.process.stdin.write(self.script(command, cwd, env))
+            self.process.stdin.flush()
+        except (OSError, ValueError):
+            self.broken = True
+            raise
+
+    def ping(self, timeout=1.0):
+        """Runs a no-op; False when the session does not answer within ``timeout``."""
+        try:
+            self.send(":")
+        except (OSError, ValueError):
+            return False
+        deadline = time.monotonic() + timeout
+        ends = 0
+        while ends < 2:
+            try:
+                item = self.pending.get(timeout=max(0.0, deadline - time.monotonic()))
+            except queue.Empty:
+                self.broken = True
+                return False
+            if item is None:
+                ends += 1
+        self.commands -= 1  # Health checks do not count towards recycling
+        return self.alive and self.exit_code == 0
+
+    def terminate(self, force=False):
+        try:
+            os.killpg(self.process.pid, signal.SIGKILL if force else signal.SIGTERM)
+        except OSError:
+            pass
+        self.broken = True
+
+    def close(self):
+        """Ends the session; the shell exits when its stdin closes."""
+        self.broken = True
+        try:
+            self.process.stdin.close()
+        except OSError:
+            pass
+        try:
+            self.process.wait(timeout=1.0)
+        except subprocess.TimeoutExpired:
+            self.terminate(force=True)
+
+    def _read(self, pipe, stream_name):
+        marker = self.marker
+        try:
+            for line in pipe:
+                line = line.rstrip("\r\n")
+                at = line.find(marker)
+                if at < 0:
+                    self.pending.put((stream_name, line))
+                    continue
+                if at:
+                    self.pending.put((stream_name, line[:at]))  # Output without a final line break
+                if stream_name == "stdout":
+                    try:
+                        self.exit_code = int(line[at + len(marker):])
+                    except ValueError:
+                        self.exit_code = -1
+                self.pending.put(None)
+        finally:
+            pipe.close()
+            self.broken = True
+            self.pending.put(None)
+
+
+class SessionPool:
+    """Idle ShellSessions ready to take a command; safe to use from several threads.
+
+    ``acquire`` hands out a warm session (starting one only when none is
+    idle) and tops the pool up in the background; give the session back with
+    ``release`` when its command finished normally, or ``discard`` it.
+    ``prewarm`` fills the pool in the background ahead of the first command.
+    """
+
+    PING_AFTER = 30.0  # Seconds idle after which a session is health-checked before use
+
+    def __init__(self, size=2, max_commands=100, cwd=None, env=None):
+        self.size = size
+        self.max_commands = max_commands
+        self.cwd = cwd
+        self.env = env
+        self.lock = threading.Lock()
+        self.idle = []
+        self.starting = 0
+        self.closed = False
+
+    def warm(self):
+        """Starts sessions until ``size`` are idle."""
+        while True:
+            with self.lock:
+                if self.closed or len(self.idle) + self.starting >= self.size:
+                    return
+                self.starting += 1
+            try:
+                session = ShellSession(self.cwd, self.env)
+            except OSError:
+                return
+            finally:
+                with self.lock:
+                    self.starting -= 1
+            self._park(session)
+
+    def acquire(self):
+        while True:
+            with self.lock:
+                session = self.idle.pop() if self.idle else None
+            if session is None:
+                break
+            if session.alive and (time.monotonic() - session.last_used < self.PING_AFTER or session.ping()):
+                break
+            session.close()
+        if session is None or not self.idle:
+            self.prewarm()  # Keep the next command warm
+        return session or ShellSession(self.cwd, self.env)
+
+    def release(self, session):
+        if session.alive and session.commands < self.max_commands:
+            self._park(session)
+        else:
+            session.close()
+            self.prewarm()
+
+    def discard(self, session):
+        session.terminate(force=True)
+        session.close()
+        self.prewarm()
+
+    def close(self):
+        with self.lock:
+            self.closed = True
+            idle, self.idle = self.idle, []
+        for session in idle:
+            session.close()
+
+    def _park(self, session):
+        with self.lock:
+            if not self.closed and len(self.idle) < self.size:
+                self.idle.append(session)
+                return
+        session.close()
+
+    def prewarm(self):
+        """Starts missing idle sessions on a background thread."""
+        with self.lock:
+            if self.closed or len(self.idle) + self.starting >= self.size:
+                return
+        threading.Thread(target=self.warm, name="shell-sessions", daemon=True).start()
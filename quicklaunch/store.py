@@ -0,0 +1,357 @@
+"""Persistence for launchers: an atomic JSON file or an optional SQLite database.
+
+Both stores share the same small interface:
+
+* ``load()`` returns the launchers as an ordered ``{nickname: path}`` dict, or
+  None when nothing has been saved yet.
+* ``record(op, *args)`` notes a single change ("put", "rename", "remove",
+  "swap", "move" or "reset", the latter meaning "write everything");
+  ``flush(launchers)`` writes everything recorded since the last flush.  The
+  JSON store rewrites the document once per flush, the SQLite store applies
+  only the recorded rows.
+* ``get_section``/``set_section`` keep extra top-level data next to the
+  launchers.
+* ``signature()`` and ``read()`` let the window notice and re-read changes
+  made by another program; ``read()`` is safe to call from a worker thread.
+  ``reloaded(sections)`` then adopts what was read, dropping changes that
+  were recorded but not flushed yet.
+
+Run ``python -m quicklaunch.store migrate [--sqlite]`` to normalize a legacy
+list-format file or to move it into SQLite once.
+"""
+import json
+import os
+import shutil
+import sqlite3
+import sys
+import tempfile
+
+from quicklaunch.collection import LauncherCollection
+
+
+JSON_PATH = "launcher_paths.json"
+SQLITE_PATH = "launcher_paths.sqlite3"
+
+
+def parse_launchers(saved_data):
+    """Converts the saved dict format or the older list format to a dict."""
+    if isinstance(saved_data, dict):
+        return saved_data.get("launchers")
+    if isinstance(saved_data, list):  # Handle older format if it existed
+        new_data = {}
+        for i, item in enumerate(saved_data):
+            if isinstance(item, dict) and "nickname" in item and "path" in item:
+                new_data[item["nickname"]] = item["path"]
+            else:
+                new_data[f"Empty Path {i+1}"] = ""
+        return new_data
+    return None
+
+
+def file_signature(path):
+    """(mtime in ns, size) of ``path``, or None when it does not exist."""
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+def write_atomic(path, text, backup=True):
+    """Replaces ``path`` with ``text`` so readers never see a partial file.
+
+    The text goes to a temporary file in the same directory, is fsynced and
+    then renamed over the target.  The previous file is kept as ``.bak``.
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, temp_path = tempfile.mkstemp(prefix=os.path.basename(path) + ".", suffix=".tmp", dir=directory)
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(text)
+            f.flush()
+            os.fsync(f.fileno())
+        if backup and os.path.exists(path):
+            shutil.copy2(path, path + ".bak")
+        os.replace(temp_path, path)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+    if os.name != "nt":
+        # Make the rename itself durable
+        dir_fd = os.open(directory, os.O_RDONLY)
+        try:
+            os.fsync(dir_fd)
+        finally:
+            os.close(dir_fd)
+
+
+class JsonLauncherStore:
+    """Keeps launchers in ``launcher_paths.json``, rewritten atomically per flush."""
+
+    def __init__(self, path=JSON_PATH, backup=True):
+        self.path = path
+        self.backup = backup
+        self.sections = {}
+        self.dirty = False
+
+    def load(self):
+        for candidate in (self.path, self.path + ".bak"):
+            try:
+                with open(candidate, "r", encoding="utf-8") as f:
+                    saved_data = json.load(f)
+            except FileNotFoundError:
+                continue
+            except ValueError:
+                continue  # Corrupt file, fall back to the backup generation
+            if isinstance(saved_data, dict):
+                self.sections = {key: value for key, value in saved_data.items() if key != "launchers"}
+            return parse_launchers(saved_data)
+        return None
+
+    def read(self):
+        """(launchers, sections) as currently on disk, or None when there is no file.
+
+        Unlike ``load`` it does not fall back to the backup: a file caught
+        half-written by another program raises ValueError.
+        """
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                saved_data = json.load(f)
+        except FileNotFoundError:
+            return None
+        sections = {}
+        if isinstance(saved_data, dict):
+            sections = {key: value for key, value in saved_data.items() if key != "launchers"}
+        return parse_launchers(saved_data), sections
+
+    def signature(self):
+        return file_signature(self.path)
+
+    def record(self, op, *args):
+        self.dirty = True
+
+    def reloaded(self, sections):
+        self.sections = dict(sections)
+        self.dirty = False
+
+    def get_section(self, name, default=None):
+        return self.sections.get(name, default)
+
+    def set_section(self, name, value):
+        self.sections[name] = value
+        self.dirty = True
+
+    def flush(self, launchers):
+        if self.dirty:
+            self.save_all(launchers)
+
+    def save_all(self, launchers):
+        data_to_save = {"launchers": dict(launchers)}
+        data_to_save.update(self.sections)
+        write_atomic(self.path, json.dumps(data_to_save, indent=4), self.backup)
+        self.dirty = False
+
+    def close(self):
+        pass
+
+
+class SqliteLauncherStore:
+    """Keeps launchers in an SQLite database, one row per launcher.
+
+    Flushing applies only the recorded changes inside one transaction, so an
+    edit costs a single row update however many launchers exist.  Rows are
+    ordered by a REAL ``position``: a launcher that was moved or swapped gets
+    a position between its new neighbours, so reordering never renumbers the
+    other rows.  A copy of the database is kept as ``.bak`` before the first
+    write of a session.
+    """
+
+    ORDER_OPS = ("swap", "move")  # Resolved against the final order at flush time
+
+    def __init__(self, path=SQLITE_PATH, backup=True):
+        self.path = path
+        self.backup = backup
+        self.backed_up = False
+        self.pending = []
+        self.connection = sqlite3.connect(path)
+        self.connection.executescript("""
+            CREATE TABLE IF NOT EXISTS launchers (
+                nickname TEXT PRIMARY KEY,
+                path TEXT NOT NULL,
+                position REAL NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS launchers_position ON launchers (position);
+            CREATE TABLE IF NOT EXISTS sections (
+                name TEXT PRIMARY KEY,
+                value TEXT NOT NULL
+            );
+        """)
+
+    def load(self):
+        rows = self.connection.execute("SELECT nickname, path FROM launchers ORDER BY position").fetchall()
+        return dict(rows) if rows else None
+
+    def read(self):
+        connection = sqlite3.connect(self.path)  # Connections cannot be shared between threads
+        try:
+            rows = connection.execute("SELECT nickname, path FROM launchers ORDER BY position").fetchall()
+            sections = {name: json.loads(value)
+                        for name, value in connection.execute("SELECT name, value FROM sections")}
+        finally:
+            connection.close()
+        return dict(rows), sections
+
+    def signature(self):
+        return file_signature(self.path)
+
+    def record(self, op, *args):
+        self.pending.append((op, args))
+
+    def reloaded(self, sections):
+        self.pending = []  # Sections are read from the database itself
+
+    def get_section(self, name, default=None):
+        row = self.connection.execute("SELECT value FROM sections WHERE name = ?", (name,)).fetchone()
+        return json.loads(row[0]) if row else default
+
+    def set_section(self, name, value):
+        self.pending.append(("section", (name, value)))
+
+    def flush(self, launchers):
+        if not self.pending:
+            return
+        self._backup_once()
+        pending, self.pending = self.pending, []
+        moved = set()
+        with self.connection:
+            for op, args in pending:
+                if op in self.ORDER_OPS:
+                    moved.update(args)
+                    continue
+                if op == "rename" and args[0] in moved:
+                    moved.discard(args[0])
+                    moved.add(args[1])
+                elif op == "remove":
+                    moved.discard(args[0])
+                elif op == "reset":
+                    moved.clear()
+                getattr(self, "_apply_" + op)(launchers, *args)
+            if moved:
+                self._reposition(launchers, moved)
+
+    def save_all(self, launchers):
+        self._backup_once()
+        self.pending = []
+        with self.connection:
+            self._apply_reset(launchers)
+
+    def close(self):
+        self.connection.close()
+
+    def _backup_once(self):
+        if self.backup and not self.backed_up:
+            target = sqlite3.connect(self.path + ".bak")
+            try:
+                self.connection.backup(target)
+            finally:
+                target.close()
+            self.backed_up = True
+
+    def _apply_reset(self, launchers):
+        self.connection.execute("DELETE FROM launchers")
+        self.connection.executemany(
+            "INSERT INTO launchers (nickname, path, position) VALUES (?, ?, ?)",
+            ((nickname, path, position) for position, (nickname, path) in enumerate(launchers.items())))
+
+    def _apply_put(self, launchers, nickname, path):
+        updated = self.connection.execute("UPDATE launchers SET path = ? WHERE nickname = ?", (path, nickname))
+        if not updated.rowcount:
+            self.connection.execute(
+                "INSERT INTO launchers (nickname, path, position) "
+                "VALUES (?, ?, (SELECT COALESCE(MAX(position), -1) + 1 FROM launchers))", (nickname, path))
+
+    def _apply_rename(self, launchers, nickname, new_nickname):
+        self.connection.execute("UPDATE launchers SET nickname = ? WHERE nickname = ?", (new_nickname, nickname))
+
+    def _apply_remove(self, launchers, nickname):
+        self.connection.execute("DELETE FROM launchers WHERE nickname = ?", (nickname,))
+
+    def _position(self, nickname):
+        row = self.connection.execute("SELECT position FROM launchers WHERE nickname = ?", (nickname,)).fetchone()
+        return row[0] if row else None
+
+    def _reposition(self, launchers, moved):
+        """Gives every moved launcher a position between its final neighbours.
+
+        Launchers are placed left to right, so the left neighbour is always
+        final already; the right one is the next launcher that did not move,
+        whose stored position is still valid relative to the others.
+        """
+        if not isinstance(launchers, LauncherCollection):
+            launchers = LauncherCollection(launchers)
+        for row in sorted(launchers.index(nickname) for nickname in moved if nickname in launchers):
+            nickname = launchers.at(row)[0]
+            left = self._position(launchers.at(row - 1)[0]) if row > 0 else None
+            right_row = row + 1
+            while right_row < len(launchers) and launchers.at(right_row)[0] in moved:
+                right_row += 1
+            right = self._position(launchers.at(right_row)[0]) if right_row < len(launchers) else None
+            if left is None and right is None:
+                position = 0.0
+            elif left is None:
+                position = right - 1.0
+            elif right is None:
+                position = left + 1.0
+            else:
+                position = (left + right) / 2
+                if not left < position < right:
+                    self._apply_reset(launchers)  # Out of float precision: renumber once
+                    return
+            self.connection.execute("UPDATE launchers SET position = ? WHERE nickname = ?", (position, nickname))
+
+    def _apply_section(self, launchers, name, value):
+        self.connection.execute("INSERT OR REPLACE INTO sections (name, value) VALUES (?, ?)",
+                                (name, json.dumps(value)))
+
+
+def open_store(json_path=JSON_PATH, sqlite_path=SQLITE_PATH):
+    """Uses the SQLite database once it exists, the JSON file otherwise."""
+    if os.path.exists(sqlite_path):
+        return SqliteLauncherStore(sqlite_path)
+    return JsonLauncherStore(json_path)
+
+
+def migrate(json_path=JSON_PATH, sqlite_path=None):
+    """One-shot migration of ``json_path``.
+
+    Without ``sqlite_path`` the file is rewritten in the current dict format
+    (the old file is kept as ``.bak``).  With it, the launchers and extra
+    sections are copied into a new SQLite database that is used from then on.
+    Returns the number of launchers migrated.
+    """
+    source = JsonLauncherStore(json_path)
+    launchers = source.load()
+    if launchers is None:
+        raise FileNotFoundError(json_path)
+    if sqlite_path is None:
+        source.save_all(launchers)
+        return len(launchers)
+    if os.path.exists(sqlite_path):
+        raise FileExistsError(sqlite_path)
+    target = SqliteLauncherStore(sqlite_path, backup=False)
+    try:
+        target.save_all(launchers)
+        for name, value in source.sections.items():
+            target.set_section(name, value)
+        target.flush(launchers)
+    finally:
+        target.close()
+    return len(launchers)
+
+
+if __name__ == '__main__':
+    if sys.argv[1:2] != ["migrate"]:
+        sys.exit("usage: python -m quicklaunch.store migrate [--sqlite]")
+    count = migrate(sqlite_path=SQLITE_PATH if "--sqlite" in sys.argv[2:] else None)
+    print(f"Migrated {count} launchers")
@@ -0,0 +1,189 @@
+"""Run history: one row per launcher execution, written off the GUI thread.
+
+``TelemetryStore.record`` only puts a RunRecord on a queue; a writer thread
+inserts queued records in batches into ``launcher_telemetry.sqlite3``.  When
+the file grows past ``max_bytes`` it is rotated to ``.1`` (``.1`` to ``.2``
+and so on, ``backups`` generations are kept) and a new file is started.
+``stats`` reads the current file and its rotated generations.
+"""
+import json
+import math
+import os
+import queue
+import sqlite3
+import threading
+import time
+
+
+TELEMETRY_PATH = "launcher_telemetry.sqlite3"
+
+SCHEMA = """
+    CREATE TABLE IF NOT EXISTS runs (
+        id INTEGER PRIMARY KEY,
+        nickname TEXT NOT NULL,
+        kind TEXT NOT NULL,
+        started REAL NOT NULL,
+        queue_wait REAL,
+        spawn_latency REAL,
+        wall_time REAL,
+        exit_code INTEGER,
+        state TEXT,
+        stdout_chars INTEGER,
+        stderr_chars INTEGER,
+        steps TEXT
+    );
+    CREATE INDEX IF NOT EXISTS runs_nickname ON runs (nickname, started);
+"""
+
+
+class RunRecord:
+    """What happened when a launcher ran.
+
+    ``kind`` is "chain" for command chains and "open" for plain paths.  Times
+    are seconds; ``started`` is a Unix timestamp.  ``steps`` holds (step
+    text, exit code, seconds) tuples.  Output sizes count decoded characters,
+    including line breaks.
+    """
+
+    FIELDS = ("nickname", "kind", "started", "queue_wait", "spawn_latency", "wall_time",
+              "exit_code", "state", "stdout_chars", "stderr_chars", "steps")
+
+    def __init__(self, nickname, kind="chain", started=None, queue_wait=None, spawn_latency=None,
+                 wall_time=None, exit_code=None, state=None, stdout_chars=0, stderr_chars=0, steps=()):
+        self.nickname = nickname
+        self.kind = kind
+        self.started = time.time() if started is None else started
+        self.queue_wait = queue_wait
+        self.spawn_latency = spawn_latency
+        self.wall_time = wall_time
+        self.exit_code = exit_code
+        self.state = state
+        self.stdout_chars = stdout_chars
+        self.stderr_chars = stderr_chars
+        self.steps = list(steps)
+
+    @property
+    def failed(self):
+        return self.exit_code not in (0, None) or self.state not in (None, "Finished")
+
+    def row(self):
+        values = [getattr(self, field) for field in self.FIELDS]
+        values[-1] = json.dumps(self.steps) if self.steps else None
+        return values
+
+
+def percentile(sorted_values, fraction):
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return None
+    return sorted_values[max(0, math.ceil(fraction * len(sorted_values)) - 1)]
+
+
+class LauncherStats:
+    def __init__(self, nickname, durations, failures, last_run):
+        durations = sorted(durations)
+        self.nickname = nickname
+        self.runs = len(durations)
+        self.failures = failures
+        self.failure_rate = failures / len(durations) if durations else 0.0
+        self.p50 = percentile(durations, 0.50)
+        self.p95 = percentile(durations, 0.95)
+        self.last_run = last_run
+
+
+class TelemetryStore:
+    BATCH_SIZE = 500  # Records inserted per transaction at most
+
+    def __init__(self, path=TELEMETRY_PATH, max_bytes=4 * 1024 * 1024, backups=2):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.backups = backups
+        self.pending = queue.Queue()
+        self.writer = threading.Thread(target=self._write_loop, name="telemetry-writer", daemon=True)
+        self.writer.start()
+
+    def record(self, run):
+        """Queues a RunRecord; never blocks on disk."""
+        self.pending.put(run)
+
+    def flush(self):
+        """Waits until every queued record has been written."""
+        self.pending.join()
+
+    def close(self):
+        self.pending.put(None)
+        self.writer.join()
+
+    def files(self):
+        """The current file and its rotated generations, newest first."""
+        candidates = [self.path] + [f"{self.path}.{n}" for n in range(1, self.backups + 1)]
+        return [path for path in candidates if os.path.exists(path)]
+
+    def stats(self, kind="chain"):
+        """LauncherStats for every launcher with recorded runs, by nickname."""
+        durations = {}
+        failures = {}
+        last_run = {}
+        for path in self.files():
+            connection = sqlite3.connect(path)
+            try:
+                rows = connection.execute(
+                    "SELECT nickname, wall_time, exit_code, state, started FROM runs "
+                    "WHERE kind = ? AND wall_time IS NOT NULL", (kind,))
+                for nickname, wall_time, exit_code, state, started in rows:
+                    durations.setdefault(nickname, []).append(wall_time)
+                    if exit_code not in (0, None) or state not in (None, "Finished"):
+                        failures[nickname] = failures.get(nickname, 0) + 1
+                    last_run[nickname] = max(last_run.get(nickname, started), started)
+            except sqlite3.Error:
+                continue  # Unreadable or not a database; the other generations still count
+            finally:
+                connection.close()
+        return {nickname: LauncherStats(nickname, values, failures.get(nickname, 0), last_run[nickname])
+                for nickname, values in durations.items()}
+
+    def _connect(self):
+        connection = sqlite3.connect(self.path)
+        connection.execute("PRAGMA synchronous = NORMAL")
+        connection.executescript(SCHEMA)
+        return connection
+
+    def _rotate(self):
+        for n in range(self.backups, 0, -1):
+            source = self.path if n == 1 else f"{self.path}.{n - 1}"
+            if os.path.exists(source):
+                os.replace(source, f"{self.path}.{n}")
+        if not self.backups:
+            os.remove(self.path)
+
+    def _write_loop(self):
+        connection = None  # Opened on the first batch and again after a failure
+        placeholders = ", ".join("?" * len(RunRecord.FIELDS))
+        insert = f"INSERT INTO runs ({', '.join(RunRecord.FIELDS)}) VALUES ({placeholders})"
+        while True:
+            batch = [self.pending.get()]
+            while len(batch) < self.BATCH_SIZE:
+                try:
+                    batch.append(self.pending.get_nowait())
+                except queue.Empty:
+                    break
+            records = [run for run in batch if run is not None]
+            try:
+                if records:
+                    if connection is None:
+                        connection = self._connect()
+                    with connection:
+                        connection.executemany(insert, [run.row() for run in records])
+                    if os.path.getsize(self.path) > self.max_bytes:
+                        connection.close()
+                        connection = None
+                        self._rotate()
+            except (OSError, sqlite3.Error):
+                pass  # Telemetry must never break a launcher run; these records are dropped
+            finally:
+                for _ in batch:
+                    self.pending.task_done()
+            if len(records) < len(batch):
+                if connection is not None:
+                    connection.close()
+                return
@@ -0,0 +1,174 @@
+"""Schedules and file watches that run launchers on their own.
+
+A launcher's ``trigger`` option looks like::
+
+    {"schedule": "5m", "watch": ["src", "setup.cfg"], "overlap": "skip"}
+
+``schedule`` is an interval (``90``, ``30s``, ``5m``, ``2h``, ``1d``) or a
+five-field cron expression (``*/15 8-18 * * 1-5``); ``watch`` lists files
+or directories whose changes start a run; ``overlap`` says what happens
+when a trigger fires while the launcher is still running: ``skip`` the new
+run, ``queue`` one run for when the current one ends, or ``cancel`` the
+current run and start again.
+
+Every due time, scheduled or a debounced file change, lives in one
+``TriggerHeap``, so the window needs a single timer for all launchers.
+"""
+import datetime
+import heapq
+import itertools
+import re
+
+
+OVERLAP_POLICIES = ("skip", "queue", "cancel")
+UNITS = {"s": 1, "m": 60, "h": 3600, "d": 86400}
+
+
+def parse_interval(text):
+    """Seconds of an interval such as ``90``, ``30s`` or ``5m``; ValueError otherwise."""
+    match = re.fullmatch(r"\s*(\d+(?:\.\d+)?)\s*([smhd]?)\s*", text.lower())
+    if match is None:
+        raise ValueError(f"Not an interval: {text!r}")
+    seconds = float(match[1]) * UNITS[match[2] or "s"]
+    if seconds <= 0:
+        raise ValueError("The interval must be positive")
+    return seconds
+
+
+class CronSchedule:
+    """A five-field cron expression: minute, hour, day of month, month, day of week.
+
+    Fields accept ``*``, numbers, ranges ``a-b``, steps ``*/n`` or ``a-b/n``
+    and comma-separated lists; day of week runs from 0 (Sunday) to 7
+    (Sunday again).  As in Vixie cron, when both day fields are restricted a
+    day matching either of them qualifies.
+    """
+
+    FIELDS = ((0, 59), (0, 23), (1, 31), (1, 12), (0, 7))
+    SEARCH_YEARS = 5  # Give up on expressions that never match, such as "0 0 30 2 *"
+
+    def __init__(self, expression):
+        fields = expression.split()
+        if len(fields) != 5:
+            raise ValueError(f"A cron expression has five fields: {expression!r}")
+        self.expression = expression
+        (self.minutes, self.hours, self.days, self.months, weekdays) = (
+            self._parse_field(field, low, high) for field, (low, high) in zip(fields, self.FIELDS))
+        self.weekdays = {day % 7 for day in weekdays}
+        self.any_day = fields[2] == "*"
+        self.any_weekday = fields[4] == "*"
+
+    @staticmethod
+    def _parse_field(field, low, high):
+        values = set()
+        for part in field.split(","):
+            base, _, step = part.partition("/")
+            if base == "*":
+                start, stop = low, high
+            elif "-" in base:
+                start, stop = (int(value) for value in base.split("-", 1))
+            else:
+                start = stop = int(base)
+                if step:
+                    stop = high
+            step = int(step) if step else 1
+            if not low <= start <= stop <= high or step < 1:
+                raise ValueError(f"Field {field!r} is outside {low}-{high}")
+            values.update(range(start, stop + 1, step))
+        return values
+
+    def day_matches(self, moment):
+        day_ok = moment.day in self.days
+        weekday_ok = (moment.weekday() + 1) % 7 in self.weekdays
+        if self.any_day or self.any_weekday:
+            return day_ok and weekday_ok
+        return day_ok or weekday_ok
+
+    def next_after(self, timestamp):
+        """The first matching minute strictly after ``timestamp`` (local time)."""
+        moment = datetime.datetime.fromtimestamp(timestamp).replace(second=0, microsecond=0)
+        moment += datetime.timedelta(minutes=1)
+        limit = moment + datetime.timedelta(days=366 * self.SEARCH_YEARS)
+        while moment < limit:
+            if moment.month not in self.months:
+                moment = (moment.replace(day=1, hour=0, minute=0) + datetime.timedelta(days=32)).replace(day=1)
+            elif not self.day_matches(moment):
+                moment = moment.replace(hour=0, minute=0) + datetime.timedelta(days=1)
+            elif moment.hour not in self.hours:
+                moment = moment.replace(minute=0) + datetime.timedelta(hours=1)
+            elif moment.minute not in self.minutes:
+                moment += datetime.timedelta(minutes=1)
+            else:
+                return moment.timestamp()
+        raise ValueError(f"{self.expression!r} never matches")
+
+
+class IntervalSchedule:
+    def __init__(self, seconds):
+        self.seconds = seconds
+
+    def next_after(self, timestamp):
+        return timestamp + self.seconds
+
+
+def parse_schedule(text):
+    """An IntervalSchedule or CronSchedule for ``text``; ValueError when it is neither."""
+    if len(text.split()) == 5:
+        return CronSchedule(text)
+    return IntervalSchedule(parse_interval(text))
+
+
+def parse_trigger(options):
+    """Validated ``(schedule or None, watched paths, overlap policy)`` of a trigger option."""
+    schedule = options.get("schedule")
+    overlap = options.get("overlap", "skip")
+    if overlap not in OVERLAP_POLICIES:
+        raise ValueError(f"Unknown overlap policy {overlap!r}")
+    return (parse_schedule(schedule) if schedule else None), list(options.get("watch", [])), overlap
+
+
+class TriggerHeap:
+    """Due times keyed by ``(nickname, kind)``; the earliest is always at the top.
+
+    Setting a key again replaces its due time: the old heap entry is left in
+    place and skipped when it surfaces, and the heap is rebuilt once stale
+    entries outnumber live ones.
+    """
+
+    def __init__(self):
+        self.heap = []
+        self.due = {}
+        self.sequence = itertools.count()
+
+    def __len__(self):
+        return len(self.due)
+
+    def __contains__(self, key):
+        return key in self.due
+
+    def set(self, key, due):
+        self.due[key] = due
+        heapq.heappush(self.heap, (due, next(self.sequence), key))
+        if len(self.heap) > 2 * len(self.due) + 64:
+            self.heap = [(due, next(self.sequence), key) for key, due in self.due.items()]
+            heapq.heapify(self.heap)
+
+    def remove(self, key):
+        self.due.pop(key, None)
+
+    def next_due(self):
+        """The earliest due time, or None when nothing is scheduled."""
+        while self.heap and self.due.get(self.heap[0][2]) != self.heap[0][0]:
+            heapq.heappop(self.heap)  # Stale entry
+        return self.heap[0][0] if self.heap else None
+
+    def pop_due(self, now):
+        """Removes and returns the keys due at ``now``, earliest first."""
+        keys = []
+        while True:
+            due = self.next_due()
+            if due is None or due > now:
+                return keys
+            key = heapq.heappop(self.heap)[2]
+            del self.due[key]
+            keys.append(key)